@@ -0,0 +1,147 @@
+"""
+Dashboard Interaction Benchmark
+Measures how long a widget interaction takes to rerun: the whole page vs only its fragment
+
+Usage:
+    python benchmarks/dashboard_interactions.py              # every interaction, 5 runs each
+    python benchmarks/dashboard_interactions.py --repeat 10
+
+Run the research pipeline first; the dashboard reads its generated data.
+"""
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+BENCHMARK_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+RESULTS_FILE = BENCHMARK_DIR / "results" / "dashboard_interactions.json"
+
+# Interaction -> page, widget (type and label), two values to alternate between,
+# and the call that renders only the widget's fragment
+INTERACTIONS = {
+    "Interview selector": {
+        "page": "💬 Interview Insights",
+        "widget": ("selectbox", "Select Interview:"),
+        "values": [2, 1],
+        "fragment": ("interview_insights", "render_interview_browser(load('metadata'), load('transcript_index'))")
+    },
+    "Transcript search": {
+        "page": "💬 Interview Insights",
+        "widget": ("text_input", "Search for keywords across all interviews:"),
+        "values": ["guilt", "overwhelm*"],
+        "fragment": ("interview_insights", "render_transcript_search(load('transcript_index'))")
+    },
+    "Journey view toggle": {
+        "page": "🗺️ Journey Maps",
+        "widget": ("radio", "Select View:"),
+        "values": ["Future State (Delight)", "Current State (Pain)"],
+        "fragment": ("journey_maps", "render_journey_view(load('journey_maps'))")
+    },
+    "Observation filter": {
+        "page": "🔎 Observation Explorer",
+        "widget": ("multiselect", "Sentiment:"),
+        "values": [["negative"], []],
+        "fragment": ("observation_explorer", "render_explorer(load('observation_store'))")
+    }
+}
+
+FRAGMENT_SCRIPT = """
+import sys
+sys.path.append({src!r})
+sys.path.append({root!r})
+from dashboard_pages import load
+from dashboard_pages.{module} import *
+{call}
+"""
+
+def find_widget(app, widget_type: str, label: str):
+    """The main-area widget of a type with a label"""
+    for widget in getattr(app.main, widget_type):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No {widget_type} labelled '{label}'")
+
+def time_interaction(app, interaction: Dict, repeat: int) -> float:
+    """
+    Change the interaction's widget ``repeat`` times and time each rerun
+
+    Returns:
+        Fastest rerun in seconds
+    """
+    widget_type, label = interaction["widget"]
+    timings = []
+    for i in range(repeat):
+        find_widget(app, widget_type, label).set_value(interaction["values"][i % 2])
+        start = time.perf_counter()
+        app.run()
+        timings.append(time.perf_counter() - start)
+        if app.exception:
+            raise RuntimeError(app.exception[0].message)
+    return min(timings)
+
+def measure_interaction(interaction: Dict, repeat: int) -> Dict:
+    """
+    Time one interaction as a full page rerun and as a fragment rerun
+
+    Returns:
+        Dictionary with full_page_seconds, fragment_seconds and speedup
+    """
+    from streamlit.testing.v1 import AppTest
+
+    page_app = AppTest.from_file(str(PROJECT_ROOT / "dashboard.py"), default_timeout=120)
+    page_app.run()
+    page_app.sidebar.radio[0].set_value(interaction["page"])
+    page_app.run()
+    full_page = time_interaction(page_app, interaction, repeat)
+
+    module, call = interaction["fragment"]
+    fragment_app = AppTest.from_string(FRAGMENT_SCRIPT.format(
+        src=str(PROJECT_ROOT / "src"), root=str(PROJECT_ROOT), module=module, call=call
+    ), default_timeout=120)
+    fragment_app.run()
+    fragment = time_interaction(fragment_app, interaction, repeat)
+
+    return {
+        "full_page_seconds": round(full_page, 4),
+        "fragment_seconds": round(fragment, 4),
+        "speedup": round(full_page / fragment, 1) if fragment else None,
+        "repeat": repeat
+    }
+
+def print_results(results: Dict[str, Dict]) -> None:
+    """Print a results table"""
+    print(f"\n{'Interaction':<24} {'Full page s':>12} {'Fragment s':>11} {'Speedup':>8}")
+    print("-" * 58)
+    for name, m in results.items():
+        print(f"{name:<24} {m['full_page_seconds']:>12.3f} {m['fragment_seconds']:>11.3f} {m['speedup']:>7}x")
+
+def main():
+    """Measure every interaction and store the results"""
+    parser = argparse.ArgumentParser(description="Dashboard interaction latency benchmark")
+    parser.add_argument("--interactions", nargs="+", default=list(INTERACTIONS), help="Interactions to measure")
+    parser.add_argument("--repeat", type=int, default=5, help="Reruns per interaction")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.interactions:
+        print(f"⏱️ Measuring {name}...")
+        results[name] = measure_interaction(INTERACTIONS[name], args.repeat)
+    print_results(results)
+
+    RESULTS_FILE.parent.mkdir(exist_ok=True)
+    with open(RESULTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            "created_at": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results
+        }, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Results: {RESULTS_FILE}")
+
+if __name__ == "__main__":
+    main()
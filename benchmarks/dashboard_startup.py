@@ -0,0 +1,135 @@
+"""
+Dashboard Startup Benchmark
+Measures dashboard cold start and the first paint of every page in fresh processes
+
+Usage:
+    python benchmarks/dashboard_startup.py                   # every page, 3 runs each
+    python benchmarks/dashboard_startup.py --repeat 5
+    python benchmarks/dashboard_startup.py --pages "🏠 Home" "🔍 Research Process"
+
+Run the research pipeline first; the dashboard reads its generated data.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+BENCHMARK_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+RESULTS_FILE = BENCHMARK_DIR / "results" / "dashboard_startup.json"
+
+PAGES = [
+    "🏠 Home",
+    "🔍 Research Process",
+    "💬 Interview Insights",
+    "🗂️ Affinity Mapping",
+    "🔎 Observation Explorer",
+    "👥 User Personas",
+    "🗺️ Journey Maps",
+    "💡 Key Insights",
+    "📄 Product Requirements",
+    "📊 Impact & Metrics"
+]
+HEAVY_MODULES = ["pandas", "numpy", "plotly.express", "plotly.graph_objects"]
+
+def measure_page(page: str) -> Dict:
+    """
+    Render the dashboard in this (fresh) process: the default page, then ``page``
+
+    Returns:
+        Dictionary with cold_start_seconds (streamlit import and first run of the
+        default page), first_paint_seconds (first run of ``page``) and the
+        heavy modules each of the two runs had loaded
+    """
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(PROJECT_ROOT / "dashboard.py"), default_timeout=120)
+    app.run()
+    cold_start = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    cold_modules = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    first_paint = 0.0
+    if page != PAGES[0]:
+        app.sidebar.radio[0].set_value(page)
+        start = time.perf_counter()
+        app.run()
+        first_paint = time.perf_counter() - start
+        if app.exception:
+            raise RuntimeError(app.exception[0].message)
+
+    return {
+        "cold_start_seconds": round(cold_start, 4),
+        "first_paint_seconds": round(first_paint, 4),
+        "cold_start_modules": cold_modules,
+        "page_modules": [name for name in HEAVY_MODULES if name in sys.modules]
+    }
+
+def run_page(page: str, repeat: int) -> Dict:
+    """
+    Measure one page in ``repeat`` fresh processes (the fastest run is reported)
+
+    Args:
+        page: Sidebar label of the page
+        repeat: Number of fresh processes
+
+    Returns:
+        Measurements of the fastest run, with the number of runs
+    """
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, __file__, "--measure", page],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run["cold_start_seconds"] + run["first_paint_seconds"])
+    return {**best, "repeat": repeat}
+
+def print_results(results: Dict[str, Dict]) -> None:
+    """Print a results table"""
+    print(f"\n{'Page':<28} {'Cold start s':>13} {'First paint s':>14}  Heavy modules loaded")
+    print("-" * 100)
+    for page, m in results.items():
+        print(f"{page:<28} {m['cold_start_seconds']:>13.3f} {m['first_paint_seconds']:>14.3f}  "
+              f"{', '.join(m['page_modules']) or '-'}")
+
+def main():
+    """Measure every requested page and store the results"""
+    parser = argparse.ArgumentParser(description="Dashboard cold start and first paint benchmark")
+    parser.add_argument("--pages", nargs="+", default=PAGES, help="Sidebar labels of the pages to measure")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per page")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        # Child process: print one JSON line for the parent
+        print(json.dumps(measure_page(args.measure)))
+        return
+
+    results = {}
+    for page in args.pages:
+        print(f"⏱️ Measuring {page}...")
+        results[page] = run_page(page, args.repeat)
+    print_results(results)
+
+    RESULTS_FILE.parent.mkdir(exist_ok=True)
+    with open(RESULTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            "created_at": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results
+        }, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Results: {RESULTS_FILE}")
+
+if __name__ == "__main__":
+    main()
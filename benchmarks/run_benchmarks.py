@@ -0,0 +1,164 @@
+"""
+Benchmark Runner
+Runs the benchmark suite at several interview scales and checks for regressions
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # 10 and 1,000 interviews
+    python benchmarks/run_benchmarks.py --scales 10 1000 100000
+    python benchmarks/run_benchmarks.py --compare            # fail on regressions vs baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline      # record a new baseline
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+BENCHMARK_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+BASELINE_FILE = BENCHMARK_DIR / "baseline.json"
+RESULTS_FILE = BENCHMARK_DIR / "results" / "latest.json"
+
+DEFAULT_SCALES = [10, 1000]  # 100000 is supported but takes ~25 minutes and ~4 GB
+DEFAULT_TOLERANCE = 0.5  # Allowed relative drop in throughput / growth in memory
+
+def repeats_for(scale: int) -> int:
+    """Fewer timed repetitions at larger scales"""
+    return 20 if scale <= 100 else 3 if scale <= 10000 else 1
+
+def run_scale(scale: int) -> Dict[str, Dict]:
+    """
+    Run the suite at one scale in a scratch copy of the project
+
+    Args:
+        scale: Number of interviews
+
+    Returns:
+        Dictionary of benchmark name to measurements
+    """
+    with tempfile.TemporaryDirectory(prefix=f"research_bench_{scale}_") as scratch:
+        scratch = Path(scratch)
+        shutil.copytree(PROJECT_ROOT / "src", scratch / "src",
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        (scratch / "data").mkdir()
+        shutil.copy(PROJECT_ROOT / "data" / "persona_profiles.json", scratch / "data")
+
+        output_file = scratch / "results.json"
+        subprocess.run(
+            [sys.executable, str(BENCHMARK_DIR / "suite.py"),
+             "--project", str(scratch),
+             "--scale", str(scale),
+             "--repeat", str(repeats_for(scale)),
+             "--output", str(output_file)],
+            check=True
+        )
+        with open(output_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Find regressions against a baseline
+
+    Args:
+        results: Current results ({scale: {benchmark: measurements}})
+        baseline: Baseline results in the same shape
+        tolerance: Allowed relative drop in throughput / growth in memory
+
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    regressions = []
+    for scale, benchmarks in results.items():
+        for name, current in benchmarks.items():
+            previous = baseline.get(scale, {}).get(name)
+            if previous is None:
+                continue
+
+            if previous["rows_per_second"] and current["rows_per_second"]:
+                ratio = current["rows_per_second"] / previous["rows_per_second"]
+                if ratio < 1 - tolerance:
+                    regressions.append(
+                        f"{name} @ {scale}: throughput {current['rows_per_second']:,.0f} rows/s "
+                        f"vs baseline {previous['rows_per_second']:,.0f} ({ratio:.0%})"
+                    )
+
+            if previous["peak_memory_mb"] > 0:
+                ratio = current["peak_memory_mb"] / previous["peak_memory_mb"]
+                if ratio > 1 + tolerance:
+                    regressions.append(
+                        f"{name} @ {scale}: peak memory {current['peak_memory_mb']:.1f} MB "
+                        f"vs baseline {previous['peak_memory_mb']:.1f} MB ({ratio:.0%})"
+                    )
+    return regressions
+
+def print_results(results: Dict) -> None:
+    """Print a results table"""
+    print(f"\n{'Benchmark':<48} {'Scale':>8} {'Seconds':>10} {'Rows/s':>12} {'Peak MB':>9}")
+    print("-" * 91)
+    for scale, benchmarks in results.items():
+        for name, m in benchmarks.items():
+            rate = f"{m['rows_per_second']:,.0f}" if m['rows_per_second'] else "-"
+            print(f"{name:<48} {scale:>8} {m['seconds']:>10.4f} {rate:>12} {m['peak_memory_mb']:>9.2f}")
+
+def main():
+    """Run benchmarks, store results and optionally compare with the baseline"""
+    parser = argparse.ArgumentParser(description="Research pipeline benchmarks")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Interview counts to benchmark (e.g. 10 1000 100000)")
+    parser.add_argument("--compare", action="store_true", help="Exit non-zero on regressions vs the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative throughput drop / memory growth (default 0.5)")
+    args = parser.parse_args()
+
+    results = {}
+    for scale in args.scales:
+        print(f"⏱️ Benchmarking {scale:,} interviews...")
+        results[str(scale)] = run_scale(scale)
+
+    print_results(results)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+    RESULTS_FILE.parent.mkdir(exist_ok=True)
+    with open(RESULTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results: {RESULTS_FILE}")
+
+    if args.save_baseline:
+        baseline = {"results": {}}
+        if BASELINE_FILE.exists():
+            with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        # Only the scales that were run are replaced
+        report["results"] = {**baseline["results"], **results}
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline: {BASELINE_FILE}")
+
+    if args.compare:
+        if not BASELINE_FILE.exists():
+            print("⚠️ No baseline to compare against (run with --save-baseline)")
+            return
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%} tolerance:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%} tolerance")
+
+if __name__ == "__main__":
+    main()
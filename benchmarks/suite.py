@@ -0,0 +1,145 @@
+"""
+Benchmark Suite
+Times the research pipeline's hot paths on generated fixtures of a given scale
+
+Runs inside a scratch copy of the project (see run_benchmarks.py), so the
+generated interviews and outputs never touch the real data directory.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+def measure(func: Callable[[], None], rows: int, repeat: int) -> Dict:
+    """
+    Time a benchmark and measure its peak Python memory
+
+    Args:
+        func: Benchmark body
+        rows: Rows processed per call (for throughput)
+        repeat: Timed repetitions (the fastest one is reported)
+
+    Returns:
+        Dictionary with seconds, rows, rows_per_second and peak_memory_mb
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # Memory is measured in a separate run so tracing does not skew the timings
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(times)
+    return {
+        "seconds": round(seconds, 4),
+        "rows": rows,
+        "rows_per_second": round(rows / seconds, 1) if seconds > 0 else None,
+        "peak_memory_mb": round(peak / 2 ** 20, 2),
+        "repeat": repeat
+    }
+
+def run_affinity_benchmarks(context, scale: int, repeat: int, results: Dict[str, Dict]) -> List[Dict]:
+    """
+    Time observation extraction and theme assignment on the generated transcripts
+
+    Args:
+        context: Research context of the suite
+        scale: Number of generated interviews
+        repeat: Timed repetitions per benchmark
+        results: Benchmark results to add to
+
+    Returns:
+        Observations with themes assigned
+    """
+    from config import INTERVIEW_DIR
+    from affinity_mapper import AffinityMapper
+
+    transcripts = [
+        (path.stem, path.read_text(encoding='utf-8'))
+        for path in sorted(INTERVIEW_DIR.glob("interview_*.txt"))
+    ]
+    mapper = AffinityMapper(context=context)
+
+    def extract():
+        # Observations are counted, not kept, so timed runs hold one interview at a time
+        return sum(len(mapper.extract_observations(text, interview_id)) for interview_id, text in transcripts)
+
+    results["affinity_mapper.extract_observations"] = measure(extract, scale, repeat)
+
+    observations = [obs for interview_id, text in transcripts for obs in mapper.extract_observations(text, interview_id)]
+    results["affinity_mapper.assign_themes"] = measure(
+        lambda: mapper.assign_themes(observations), len(observations), repeat
+    )
+    return mapper.assign_themes(observations)
+
+def run_suite(scale: int, repeat: int) -> Dict[str, Dict]:
+    """
+    Run every benchmark at one scale
+
+    Args:
+        scale: Number of interviews to generate
+        repeat: Timed repetitions per benchmark
+
+    Returns:
+        Dictionary of benchmark name to measurements
+    """
+    import numpy as np
+    import pandas as pd
+    from interview_generator import InterviewGenerator
+    from persona_builder import PersonaBuilder
+    from insights_synthesizer import InsightsSynthesizer
+    from research_context import ResearchContext
+
+    context = ResearchContext()
+    results = {}
+
+    def generate():
+        # Same seed every repetition, so every run produces the same fixtures
+        random.seed(42)
+        np.random.seed(42)
+        InterviewGenerator(num_interviews=scale, context=context).generate_all_interviews()
+
+    results["interview_generator.generate_all_interviews"] = measure(generate, scale, repeat)
+
+    # The transcripts and extracted observations are freed when the affinity benchmarks return
+    context.set("observations", pd.DataFrame(run_affinity_benchmarks(context, scale, repeat, results)))
+    results["persona_builder.build_personas"] = measure(
+        lambda: PersonaBuilder(context=context).build_personas(), scale, repeat
+    )
+    results["insights_synthesizer.synthesize_all_insights"] = measure(
+        lambda: InsightsSynthesizer(context=context).synthesize_all_insights(), scale, repeat
+    )
+    return results
+
+def main():
+    """Run the suite in a scratch project and write the results as JSON"""
+    parser = argparse.ArgumentParser(description="Run the benchmark suite at one scale")
+    parser.add_argument("--project", type=Path, required=True, help="Scratch project root")
+    parser.add_argument("--scale", type=int, required=True, help="Interviews to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per benchmark")
+    parser.add_argument("--output", type=Path, required=True, help="Results JSON file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(args.project / "src"))
+
+    # Pipeline progress output is not part of what we measure
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        results = run_suite(args.scale, args.repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Dashboard Pages
+One module per dashboard page, imported only when the page is opened
+
+Every page module declares the research datasets it reads in ``DATASETS``
+and renders itself with ``render(data)``, where ``data`` maps those dataset
+names to the shared, read-only artifacts of the data store.
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Any, Iterable
+import streamlit as st
+from data_store import DataStore
+
+# Sidebar label -> page module
+PAGES = {
+    "🏠 Home": "home",
+    "🔍 Research Process": "research_process",
+    "💬 Interview Insights": "interview_insights",
+    "🗂️ Affinity Mapping": "affinity_mapping",
+    "🔎 Observation Explorer": "observation_explorer",
+    "👥 User Personas": "personas",
+    "🗺️ Journey Maps": "journey_maps",
+    "💡 Key Insights": "key_insights",
+    "📄 Product Requirements": "prd",
+    "📊 Impact & Metrics": "impact_metrics"
+}
+
+@st.cache_resource
+def get_data_store():
+    """Process-wide data store shared by every session (reloads files the pipeline rewrites)"""
+    return DataStore()
+
+def load(name: str) -> Any:
+    """Load one dataset from the shared data store"""
+    return get_data_store().get(name)
+
+class PageData(Mapping):
+    """
+    A page's declared datasets, each loaded on first access
+
+    Datasets a page only needs behind a widget (e.g. the ranked search
+    index) are never loaded unless it is used; datasets the page did not
+    declare raise KeyError.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(names)
+        self._loaded = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self.names:
+            raise KeyError(f"Dataset '{name}' is not declared in the page's DATASETS")
+        if name not in self._loaded:
+            self._loaded[name] = load(name)
+        return self._loaded[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+def render_page(label: str) -> None:
+    """
+    Import a page module and render it with its declared datasets
+
+    Args:
+        label: Sidebar label of the page (see PAGES)
+    """
+    page = importlib.import_module(f"{__name__}.{PAGES[label]}")
+    page.render(PageData(page.DATASETS))
@@ -0,0 +1,186 @@
+"""
+Affinity Mapping Page
+Theme and sentiment overview, theme deep dive and observation search
+"""
+
+import streamlit as st
+import pandas as pd
+from config import *
+from streamlit_components import *
+
+DATASETS = ["dashboard_aggregates", "observation_search", "observation_store"]
+
+def reset_observation_page():
+    """Return to the first page of the observation table after the filter changes"""
+    st.session_state['affinity_page'] = 1
+
+def render(data):
+    """Render affinity mapping page"""
+    st.markdown("# 🗂️ Affinity Mapping")
+    st.markdown("180+ observations clustered into themes")
+    st.markdown("---")
+    
+    aggregates = data["dashboard_aggregates"]["observations"]
+    
+    # Overview stats
+    st.markdown("## 📊 Overview")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Counts precomputed by the pipeline
+    total_obs = aggregates['total']
+    unique_themes = len(aggregates['theme_counts'])
+    neg_sentiment = aggregates['sentiment_counts'].get('negative', 0)
+    pos_sentiment = aggregates['sentiment_counts'].get('positive', 0)
+    
+    with col1:
+        st.metric("Total Observations", total_obs)
+        
+    with col2:
+        # Grey color (delta_color="off")
+        pct = (unique_themes / total_obs) * 100
+        st.metric("Unique Themes", unique_themes, delta=f"{pct:.1f}%", delta_color="off")
+        
+    with col3:
+        # Red color (delta_color="inverse" makes positive values red)
+        pct = (neg_sentiment / total_obs) * 100
+        st.metric("Negative Sentiment", neg_sentiment, delta=f"{pct:.1f}%", delta_color="inverse")
+        
+    with col4:
+        # Green color (delta_color="normal" makes positive values green)
+        pct = (pos_sentiment / total_obs) * 100
+        st.metric("Positive Sentiment", pos_sentiment, delta=f"{pct:.1f}%", delta_color="normal")
+    
+    # Theme Distribution
+    st.markdown("## 🎨 Theme Distribution")
+    
+    theme_counts = pd.Series(aggregates['theme_counts'])
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        fig_theme = create_theme_distribution_chart(theme_counts)
+        st.plotly_chart(fig_theme, use_container_width=True)
+    
+    with col2:
+        st.markdown("### Top Themes")
+        for theme, count in theme_counts.head(5).items():
+            pct = (count / total_obs) * 100
+            st.markdown(f"""
+            <div style='background: #f8f9fa; color: #333333; padding: 0.75rem; border-radius: 5px; margin-bottom: 0.5rem;'>
+                <strong>{theme}</strong><br>
+                {count} observations ({pct:.1f}%)
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Sentiment Analysis
+    st.markdown("## 😊😐😔 Sentiment Analysis")
+    
+    sentiment_counts = aggregates['sentiment_counts']
+    fig_sentiment = create_sentiment_chart(sentiment_counts)
+    st.plotly_chart(fig_sentiment, use_container_width=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Theme Deep Dive
+    st.markdown("## 🔍 Theme Deep Dive")
+    
+    selected_theme = st.selectbox("Select a theme to explore:", theme_counts.index.tolist())
+    
+    theme_total = aggregates['theme_counts'][selected_theme]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Observations", theme_total)
+    with col2:
+        pct = (theme_total / total_obs) * 100
+        st.metric("Percentage", f"{pct:.1f}%")
+    with col3:
+        neg_pct = aggregates['theme_sentiment'][selected_theme].get('negative', 0) / theme_total * 100
+        st.metric("Negative Sentiment", f"{neg_pct:.0f}%")
+    
+    # Sample observations (a fixed sample per theme, drawn by the pipeline)
+    st.markdown(f"### Sample Observations from '{selected_theme}'")
+    
+    sample_obs = aggregates['theme_samples'].get(selected_theme, [])
+    
+    for obs in sample_obs:
+        sentiment_emoji = {"negative": "😔", "neutral": "😐", "positive": "😊"}
+        st.markdown(f"""
+        <div style='background: #f8f9fa; color: #333333; padding: 1rem; border-radius: 5px; margin-bottom: 0.5rem; border-left: 3px solid {"#dc3545" if obs["sentiment"] == "negative" else "#28a745" if obs["sentiment"] == "positive" else "#ffc107"};'>
+            {sentiment_emoji[obs['sentiment']]} {obs['text']}
+            <div style='font-size: 0.85rem; color: #666; margin-top: 0.5rem;'>
+                Source: {obs['interview_id']}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Interactive Data Table
+    st.markdown("## 📋 All Observations (Searchable)")
+    
+    search_mode = st.radio("Search mode:", ["Keyword filter", "Ranked (BM25)"], horizontal=True)
+    
+    if search_mode == "Ranked (BM25)":
+        render_ranked_observation_search(data["observation_search"])
+        return
+    
+    # Add search filter (matched and paged on the observation store; only one page is decoded)
+    search_term = st.text_input("Filter observations by keyword:", placeholder="e.g., guilt, setup, overwhelm",
+                                on_change=reset_observation_page)
+    
+    store = data["observation_store"]
+    mask = store.filter(keyword=search_term)
+    total = store.count(mask)
+    
+    page_size = OBSERVATION_EXPLORER_PAGE_SIZE
+    page_count = max(1, -(-total // page_size))
+    if st.session_state.get('affinity_page', 1) > page_count:
+        st.session_state['affinity_page'] = page_count
+    page = st.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, key='affinity_page')
+    
+    st.dataframe(
+        store.rows(store.page_rows(mask, page, page_size)),
+        column_order=['theme', 'sentiment', 'text', 'interview_id'],
+        use_container_width=True,
+        hide_index=True,
+        height=400
+    )
+    
+    st.markdown(f"*Showing {total:,} of {store.row_count:,} observations*")
+    st.caption("Filter every observation by persona, interview and date in the 🔎 Observation Explorer")
+
+def render_ranked_observation_search(search):
+    """Render relevance-ranked observation search with facet filters"""
+    query = st.text_input("Search observations:", placeholder="e.g., guilt about overdue tasks")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        themes = st.multiselect("Theme:", sorted(search.labels['theme']))
+    with col2:
+        sentiments = st.multiselect("Sentiment:", sorted(search.labels['sentiment']))
+    with col3:
+        personas = st.multiselect("Persona:", sorted(search.labels['persona']))
+    
+    if not query:
+        st.markdown(f"*{search.document_count} observations indexed*")
+        return
+    
+    results = search.search(query, themes=themes, sentiments=sentiments, personas=personas)
+    
+    if not results:
+        st.warning(f"No observations match '{query}'")
+        return
+    
+    st.success(f"Top {len(results)} observations for '{query}'")
+    sentiment_emoji = {"negative": "😔", "neutral": "😐", "positive": "😊"}
+    for result in results:
+        st.markdown(
+            f"{sentiment_emoji.get(result['sentiment'], '')} {result['snippet']}  \n"
+            f"<span style='font-size: 0.85rem; color: #666;'>{result['theme']} · {result['persona']} · "
+            f"{result['interview_id']} · score {result['score']:.2f}</span>",
+            unsafe_allow_html=True
+        )
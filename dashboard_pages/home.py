@@ -0,0 +1,227 @@
+"""
+Home Page
+Executive summary of the research project
+"""
+
+import streamlit as st
+from config import *
+
+DATASETS = []
+
+def render(data):
+    """Render home/executive summary page"""
+    st.markdown("<h1 class='main-title'>User Research to Product Spec</h1>", unsafe_allow_html=True)
+    st.markdown("<p class='subtitle'>Reducing Productivity Tool Abandonment in the Critical First 14 Days</p>", unsafe_allow_html=True)
+    
+    # Hero section
+    st.markdown("---")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class='stat-box'>
+            <div style='font-size: 3rem; margin-bottom: 0.5rem;'>64%</div>
+            <div style='font-size: 1rem;'>Abandon by Day 14</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class='stat-box'>
+            <div style='font-size: 3rem; margin-bottom: 0.5rem;'>82%</div>
+            <div style='font-size: 1rem;'>Cite "Too Complex"</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class='stat-box'>
+            <div style='font-size: 3rem; margin-bottom: 0.5rem;'>2.5x</div>
+            <div style='font-size: 1rem;'>Better Retention with Day-1 Win</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Executive Summary
+    st.markdown("## 📋 Executive Summary")
+    
+    st.markdown("""
+    This research project investigates **why students and young professionals abandon productivity tools** 
+    within the first 14 days, despite strong initial motivation. Through **22 qualitative interviews**, 
+    **affinity mapping of 180+ observations**, and **behavioral pattern analysis**, this study uncovers 
+    the root causes of abandonment and proposes a **product specification** to achieve **20+ percentage point 
+    improvement in Day-14 retention**.
+    """)
+    
+    st.markdown("### 🎯 Research Objectives")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Primary Questions:**
+        - Why do users abandon productivity tools?
+        - What specific moments trigger abandonment?
+        - What emotional factors drive the decision?
+        - How can product design prevent abandonment?
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Success Criteria:**
+        - Identify root causes (not symptoms)
+        - Quantify pain point prevalence
+        - Create actionable personas
+        - Generate testable product recommendations
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Key Findings
+    st.markdown("## 🔍 Key Findings")
+    
+    findings = [
+        {
+            "title": "Critical 14-Day Window",
+            "description": "Tool abandonment happens rapidly in first 14 days, not gradually. 64% abandon before Day 14.",
+            "icon": "⏰"
+        },
+        {
+            "title": "Cognitive Overload, Not Lack of Discipline",
+            "description": "82% cite 'too complicated' as primary reason. Users with 5-7 features complete 3x more tasks than those with 20+.",
+            "icon": "🧠"
+        },
+        {
+            "title": "Guilt-Driven Abandonment",
+            "description": "68% report guilt from incomplete tasks. Users blame themselves ('not disciplined enough'), not the tool.",
+            "icon": "😔"
+        },
+        {
+            "title": "Setup Fatigue Prevents Usage",
+            "description": "73% spend 2-4 hours on setup. Users exhausted before doing actual work.",
+            "icon": "😫"
+        },
+        {
+            "title": "First 24 Hours Predict Success",
+            "description": "Users completing 1 task on Day 1 have 2.5x better Day-14 retention (45% vs 18%).",
+            "icon": "🎯"
+        }
+    ]
+    
+    for finding in findings:
+        st.markdown(f"""
+        <div style='
+            background: white;
+            border: 2px solid #e0e0e0;
+            border-radius: 10px;
+            padding: 1.5rem;
+            margin-bottom: 1rem;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        '>
+            <div style='display: flex; align-items: start;'>
+                <div style='font-size: 2.5rem; margin-right: 1rem;'>{finding['icon']}</div>
+                <div>
+                    <h4 style='margin-top: 0; color: #667eea;'>{finding['title']}</h4>
+                    <p style='margin-bottom: 0; color: #333;'>{finding['description']}</p>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Methodology Overview
+    st.markdown("## 🔬 Methodology Overview")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        **1. Interviews**
+        - 22 participants
+        - 30-45 min each
+        - Semi-structured
+        - Nov-Dec 2025
+        """)
+    
+    with col2:
+        st.markdown("""
+        **2. Affinity Mapping**
+        - 180+ observations
+        - 8 major themes
+        - Sentiment analysis
+        - Pattern recognition
+        """)
+    
+    with col3:
+        st.markdown("""
+        **3. Persona Development**
+        - 3 behavioral personas
+        - Journey mapping
+        - Pain point analysis
+        - Needs identification
+        """)
+    
+    with col4:
+        st.markdown("""
+        **4. Synthesis**
+        - 7 key insights
+        - 5 behavioral patterns
+        - 7 product recommendations
+        - PRD creation
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Proposed Solution
+    st.markdown("## 💡 Proposed Solution: Progressive Productivity Tool")
+    
+    st.markdown("""
+    Based on research findings, I propose a **progressive onboarding and task visibility model** 
+    that addresses the root causes of abandonment:
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### ✅ Core Principles")
+        st.markdown("""
+        - **Start Minimal:** 3 visible tasks maximum
+        - **Quick Setup:** < 2 minutes to first task
+        - **Progressive Disclosure:** Unlock features based on usage
+        - **Anti-Guilt Design:** No overdue badges or red notifications
+        - **Immediate Wins:** First task completion in first session
+        """)
+    
+    with col2:
+        st.markdown("### 🎯 Target Metrics")
+        st.markdown("""
+        - **Day 14 Retention:** 38% (vs 18% baseline) → **+20pp**
+        - **Time to First Win:** < 5 min (vs 180 min baseline)
+        - **Task Completion Rate:** 55% (vs 22% baseline)
+        - **Stress Score:** 3.2/10 (vs 6.8/10 baseline)
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Impact
+    st.markdown("## 📈 Expected Business Impact")
+    
+    st.markdown("""
+    Improving Day-14 retention from **18% to 38%** (+20pp) has significant business implications:
+    """)
+    
+    # Only this table needs pandas
+    import pandas as pd
+    impact_data = pd.DataFrame({
+        'Metric': ['30-Day Retention', '90-Day Retention', 'LTV per User', 'Referral Rate'],
+        'Baseline': ['12%', '8%', '$15', '5%'],
+        'Target': ['25%', '20%', '$45', '15%'],
+        'Improvement': ['+108%', '+150%', '+200%', '+200%']
+    })
+    
+    st.dataframe(impact_data, use_container_width=True, hide_index=True)
+    
+    st.info("💡 **Note:** This is a research project demonstrating PM skills in user research, synthesis, and product specification—not a startup pitch.")
@@ -0,0 +1,279 @@
+"""
+Impact & Metrics Page
+Success metrics, targets and expected business impact
+"""
+
+import streamlit as st
+import pandas as pd
+from config import *
+from streamlit_components import *
+
+DATASETS = []
+
+def render(data):
+    """Render impact and metrics page"""
+    st.markdown("# 📊 Impact & Success Metrics")
+    st.markdown("Expected outcomes and business impact")
+    st.markdown("---")
+    
+    # North Star Metric
+    st.markdown("## 🌟 North Star Metric")
+    
+    st.markdown("""
+<style>
+@keyframes rise {
+0% { bottom: -10px; opacity: 0; transform: translateX(0) rotate(0deg); }
+50% { opacity: 0.5; }
+100% { bottom: 100%; opacity: 0; transform: translateX(-20px) rotate(45deg); }
+}
+.star-anim {
+position: absolute;
+color: white;
+font-weight: bold;
+animation: rise infinite ease-in;
+z-index: 1;
+user-select: none;
+}
+</style>
+<div style="position: relative; overflow: hidden; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 3rem; border-radius: 15px; text-align: center; box-shadow: 0 6px 12px rgba(0,0,0,0.15); margin-bottom: 2rem;">
+
+<div class="star-anim" style="font-size: 14px; left: 10%; animation-duration: 4s; animation-delay: 0s;">★</div>
+<div class="star-anim" style="font-size: 18px; left: 20%; animation-duration: 7s; animation-delay: 1s;">★</div>
+<div class="star-anim" style="font-size: 12px; left: 35%; animation-duration: 5s; animation-delay: 2s;">★</div>
+<div class="star-anim" style="font-size: 20px; left: 50%; animation-duration: 8s; animation-delay: 0.5s;">★</div>
+<div class="star-anim" style="font-size: 15px; left: 65%; animation-duration: 6s; animation-delay: 3s;">★</div>
+<div class="star-anim" style="font-size: 18px; left: 80%; animation-duration: 5s; animation-delay: 1.5s;">★</div>
+<div class="star-anim" style="font-size: 12px; left: 90%; animation-duration: 9s; animation-delay: 2.5s;">★</div>
+<div class="star-anim" style="font-size: 16px; left: 15%; animation-duration: 6s; animation-delay: 4s;">★</div>
+<div class="star-anim" style="font-size: 14px; left: 45%; animation-duration: 5s; animation-delay: 3.5s;">★</div>
+<div class="star-anim" style="font-size: 22px; left: 75%; animation-duration: 7s; animation-delay: 1s;">★</div>
+
+<div style="position: relative; z-index: 10;">
+<div style="font-size: 1.2rem; opacity: 0.9; margin-bottom: 1rem;">North Star Metric</div>
+<div style="font-size: 4rem; font-weight: bold; margin-bottom: 0.5rem;">Day 14 Retention</div>
+<div style="font-size: 1.5rem; display: flex; justify-content: center; align-items: center; gap: 1rem; margin-top: 1rem;">
+<span style="background: rgba(255, 75, 75, 0.2); color: #ff4b4b; padding: 0.5rem 1rem; border-radius: 20px; font-weight: bold;">18% baseline</span>
+<span>→</span>
+<span style="background: rgba(33, 195, 84, 0.2); color: #4ade80; padding: 0.5rem 1rem; border-radius: 20px; font-weight: bold;">38% target</span>
+</div>
+<div style="font-size: 2.5rem; margin-top: 1.5rem; font-weight: bold;">+20 percentage points</div>
+</div>
+</div>
+""", unsafe_allow_html=True)
+    
+    st.markdown("### Why Day 14 Retention?")
+    st.markdown("""
+    - 64% of users make abandonment decision by Day 14
+    - Predicts long-term retention (90-day, 180-day)
+    - Directly addresses root cause (early cognitive overload)
+    - Measurable within 2 weeks of launch
+    - Industry-standard metric for habit-forming products
+    """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Metrics Dashboard
+    st.markdown("## 📈 Key Metrics Dashboard")
+    
+    metrics = SUCCESS_METRICS
+    
+    # Primary Metric
+    st.markdown("### Primary Metric")
+    
+    primary = metrics['primary']
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Baseline", f"{primary['baseline']*100:.0f}%")
+    with col2:
+        st.metric("Target", f"{primary['target']*100:.0f}%", 
+                 delta=f"+{(primary['target']-primary['baseline'])*100:.0f}pp",
+                 delta_color="normal")
+    with col3:
+        improvement = ((primary['target'] - primary['baseline']) / primary['baseline']) * 100
+        st.metric("Improvement", f"+{improvement:.0f}%")
+    
+    st.progress(primary['target'])
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Secondary Metrics
+    st.markdown("### Secondary Metrics")
+    
+    secondary_df = pd.DataFrame([
+        {
+            "Metric": m['name'],
+            "Baseline": m['baseline'],
+            "Target": m['target'],
+            "Measurement": m['description']
+        }
+        for m in metrics['secondary']
+    ])
+    
+    st.dataframe(secondary_df, use_container_width=True, hide_index=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Funnel Analysis
+    st.markdown("## 🔽 User Funnel Analysis")
+    
+    st.markdown("### Current State vs Target State")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Current State (Baseline)")
+        funnel_current = create_funnel_chart(
+            stages=["Signup", "Day 1 Active", "Day 7 Active", "Day 14 Active", "Day 30 Active"],
+            values=[100, 75, 35, 18, 12],
+            title="Current User Funnel"
+        )
+        st.plotly_chart(funnel_current, use_container_width=True)
+    
+    with col2:
+        st.markdown("#### Target State (With Solution)")
+        funnel_target = create_funnel_chart(
+            stages=["Signup", "Day 1 Active", "Day 7 Active", "Day 14 Active", "Day 30 Active"],
+            values=[100, 90, 60, 38, 25],
+            title="Target User Funnel"
+        )
+        st.plotly_chart(funnel_target, use_container_width=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Business Impact
+    st.markdown("## 💼 Business Impact")
+    
+    st.markdown("""
+    Improving Day-14 retention from 18% to 38% creates significant downstream business value:
+    """)
+    
+    impact_data = pd.DataFrame({
+        'Metric': [
+            'Day 30 Retention',
+            'Day 90 Retention',
+            'Average LTV per User',
+            'Organic Referral Rate',
+            'Support Ticket Volume'
+        ],
+        'Baseline': ['12%', '8%', '$15', '5%', '100 tickets/week'],
+        'Target': ['25%', '20%', '$45', '15%', '40 tickets/week'],
+        'Improvement': ['+108%', '+150%', '+200%', '+200%', '-60%'],
+        'Business Value': [
+            '2x more retained users',
+            'Sustainable growth',
+            '3x lifetime value',
+            'Viral coefficient > 1',
+            'Reduced support costs'
+        ]
+    })
+    
+    st.dataframe(impact_data, use_container_width=True, hide_index=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Measurement Plan
+    st.markdown("## 📏 Measurement Plan")
+    
+    st.markdown("### Data Collection")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Quantitative:**
+        - User analytics (signup, sessions, task completion)
+        - Retention cohorts (Day 1, 7, 14, 30, 90)
+        - Feature usage tracking
+        - Time-to-first-win measurement
+        - Funnel drop-off analysis
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Qualitative:**
+        - Post-task completion micro-surveys
+        - Weekly NPS surveys
+        - Exit surveys for churned users
+        - User interview program (ongoing)
+        - Support ticket sentiment analysis
+        """)
+    
+    st.markdown("### Testing Plan")
+    
+    st.markdown("""
+    **Phase 1: Alpha (Weeks 1-2)**
+    - 50 users from target demographic
+    - Heavy instrumentation and feedback loops
+    - Daily check-ins with users
+    - Rapid iteration on friction points
+    
+    **Phase 2: Beta (Weeks 3-6)**
+    - 500 users, randomized to control/treatment
+    - A/B test: Progressive onboarding vs traditional
+    - Measure Day-14 retention delta
+    - Collect qualitative feedback
+    
+    **Phase 3: Launch (Week 7+)**
+    - Full rollout if Day-14 retention > 30%
+    - Continue monitoring and optimization
+    - Iterate based on user feedback
+    """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Success Criteria
+    st.markdown("## ✅ Success Criteria")
+    
+    st.markdown("""
+    **This project is successful if:**
+    
+    1. ✅ **Primary:** Day-14 retention improves to ≥ 35% (stretch goal: 38%)
+    2. ✅ **Secondary:** 90%+ of users complete 1 task in first session
+    3. ✅ **Secondary:** Self-reported stress score < 4/10
+    4. ✅ **Tertiary:** NPS score > 30 (promoters > detractors)
+    
+    **This project has failed if:**
+    
+    1. ❌ Day-14 retention < 20% (no meaningful improvement)
+    2. ❌ Users report feeling "just as overwhelmed" as before
+    3. ❌ Retention improvements come at cost of engagement quality
+    4. ❌ Solution increases complexity despite intentions
+    """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Next Steps
+    st.markdown("## 🚀 Next Steps")
+    
+    st.markdown("""
+    **If This Were a Real Product:**
+    
+    1. **Validate with Prototype (2 weeks)**
+       - Build clickable Figma prototype
+       - Test with 20 users from target demographic
+       - Validate core assumptions
+    
+    2. **Build MVP (6 weeks)**
+       - Progressive onboarding flow
+       - 3-task visibility limit
+       - Anti-guilt design elements
+       - Basic analytics
+    
+    3. **Alpha Test (2 weeks)**
+       - 50 users, heavy feedback
+       - Daily iteration
+       - Refine UX based on real usage
+    
+    4. **Beta Test (4 weeks)**
+       - 500 users, A/B test vs control
+       - Measure Day-14 retention
+       - Statistical significance validation
+    
+    5. **Launch Decision (Week 15)**
+       - Go/No-Go based on beta results
+       - If successful: Full rollout
+       - If unsuccessful: Iterate or pivot
+    """)
+    
+    st.success("💡 **Portfolio Note:** This is a research project demonstrating PM skills in user research, synthesis, and product specification—not a startup pitch.")
@@ -0,0 +1,164 @@
+"""
+Interview Insights Page
+Transcript browser, paged viewer and full-text transcript search
+"""
+
+import streamlit as st
+from config import *
+
+DATASETS = ["metadata", "transcript_index"]
+
+def reset_transcript_page():
+    """Start the transcript viewer at the first page (after another interview is selected)"""
+    st.session_state['transcript_page'] = 1
+    st.session_state.pop('transcript_target', None)
+
+def jump_to_transcript_line(interview_num, line):
+    """Open an interview's transcript at the page holding a line (search result callback)"""
+    st.session_state['selected_interview'] = interview_num
+    st.session_state['transcript_page'] = line // TRANSCRIPT_PAGE_LINES + 1
+    st.session_state['transcript_target'] = (interview_num, line)
+
+def render_transcript_viewer(index, interview_num):
+    """Render one page of a transcript, read by byte range from disk"""
+    interview_name = f"interview_{interview_num:02d}"
+    total_lines = index.line_count(interview_name)
+    page_count = max(1, -(-total_lines // TRANSCRIPT_PAGE_LINES))
+    
+    page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, key='transcript_page')
+    start = (page - 1) * TRANSCRIPT_PAGE_LINES
+    lines = index.read_line_range(interview_name, start, start + TRANSCRIPT_PAGE_LINES)
+    
+    # Mark the line a search result jumped to
+    target = st.session_state.get('transcript_target')
+    if target and target[0] == interview_num and start <= target[1] < start + len(lines):
+        lines[target[1] - start] = "▶ " + lines[target[1] - start]
+    
+    st.text("\n".join(lines))
+    st.caption(f"Lines {start + 1}-{start + len(lines)} of {total_lines}")
+
+@st.fragment
+def render_interview_browser(metadata, index):
+    """Render the interview selector and transcript viewer (reruns on its own when they change)"""
+    # Interview selector
+    st.markdown("## 📂 Browse Interviews")
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        selected_interview = st.selectbox(
+            "Select Interview:",
+            range(1, len(metadata) + 1),
+            format_func=lambda x: f"Interview {x:02d}",
+            key='selected_interview',
+            on_change=reset_transcript_page
+        )
+    
+    with col2:
+        interview_meta = metadata[metadata['interview_id'] == f"INT_{selected_interview:03d}"].iloc[0]
+        st.markdown(f"""
+        **Date:** {interview_meta['date']}  
+        **Duration:** {interview_meta['duration_minutes']} minutes  
+        **Persona:** {interview_meta['persona']}  
+        **Tools Abandoned:** {interview_meta['tools_abandoned']}
+        """)
+    
+    # Display transcript
+    with st.expander(f"📄 View Transcript - Interview {selected_interview:02d}", expanded=True):
+        render_transcript_viewer(index, selected_interview)
+
+@st.fragment
+def render_transcript_search(index):
+    """Render transcript search and its results (reruns on its own while typing)"""
+    search_query = st.text_input(
+        "Search for keywords across all interviews:",
+        placeholder="e.g., guilt, overwhelm*, \"setup fatigue\"",
+        help="Several words match as a phrase; end a word with * to match its prefix"
+    )
+    
+    if search_query:
+        search = index.search(search_query)
+        
+        if search['results']:
+            st.success(f"Found {search['interviews']} interviews mentioning '{search_query}'")
+            if search['interviews'] > len(search['results']):
+                st.caption(f"Showing the first {len(search['results'])} interviews")
+            
+            for result in search['results']:
+                interview_num = int(result['interview'].split('_')[1])
+                with st.expander(f"Interview {interview_num:02d} ({result['matches']} matches)"):
+                    for line, snippet in zip(result['lines'], result['snippets']):
+                        col1, col2 = st.columns([5, 1])
+                        with col1:
+                            st.markdown(f"- {snippet.strip()}")
+                        with col2:
+                            # The viewer is another fragment, so a jump reruns the whole page
+                            if st.button(f"Line {line + 1} ↑", key=f"jump_{interview_num}_{line}",
+                                         on_click=jump_to_transcript_line, args=(interview_num, line),
+                                         help="Open the transcript above at this line"):
+                                st.rerun()
+        else:
+            st.warning(f"No interviews found mentioning '{search_query}'")
+
+def render(data):
+    """Render interview insights page"""
+    st.markdown("# 💬 Interview Insights")
+    st.markdown("Explore all 22 interview transcripts and key quotes")
+    st.markdown("---")
+    
+    render_interview_browser(data["metadata"], data["transcript_index"])
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Key Quotes
+    st.markdown("## 💭 Most Revealing Quotes")
+    
+    quotes = [
+        {
+            "quote": "I spend more time organizing than doing. I've watched 10 YouTube tutorials on the 'perfect' Notion setup, but I've completed maybe 5 actual tasks.",
+            "theme": "Over-Organization Paradox",
+            "persona": "The Overwhelmed Optimizer"
+        },
+        {
+            "quote": "Every time I open the app and see those red overdue badges, I feel like a failure. So I just... stop opening it.",
+            "theme": "Productivity Guilt",
+            "persona": "The Serial Abandoner"
+        },
+        {
+            "quote": "I spent 3 hours setting up my workspace. By the time I was done, I was exhausted and hadn't actually done any work. That's when I knew it wasn't working.",
+            "theme": "Setup Fatigue",
+            "persona": "The Overwhelmed Optimizer"
+        },
+        {
+            "quote": "I don't think I'm disciplined enough. Everyone else seems to have their life together with these apps, but I can't stick with anything for more than a week.",
+            "theme": "Self-Attribution Bias",
+            "persona": "The Serial Abandoner"
+        },
+        {
+            "quote": "Digital tools just feel... cold. I can't doodle, can't violently cross things out when I'm frustrated. It's too rigid.",
+            "theme": "Lack of Flexibility",
+            "persona": "The Analog Holdout"
+        },
+        {
+            "quote": "There are like 50 features and I use maybe 3 of them. But I feel like I SHOULD be using all of them to be 'productive.' It's overwhelming.",
+            "theme": "Feature Overwhelm",
+            "persona": "The Overwhelmed Optimizer"
+        }
+    ]
+    
+    for quote in quotes:
+        st.markdown(f"""
+        <div class='quote-box'>
+            "{quote['quote']}"
+            <div style='margin-top: 1rem; font-size: 0.9rem; color: #666; font-style: normal;'>
+                <strong>Theme:</strong> {quote['theme']} | <strong>Persona:</strong> {quote['persona']}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Search Functionality
+    st.markdown("## 🔍 Search Transcripts")
+    
+    render_transcript_search(data["transcript_index"])
@@ -0,0 +1,137 @@
+"""
+Journey Maps Page
+Current and future state journey maps
+"""
+
+from itertools import zip_longest
+import streamlit as st
+import plotly.graph_objects as go
+from config import *
+from streamlit_components import *
+
+DATASETS = ["journey_maps"]
+
+@st.fragment
+def render_emotion_curves(emotion_curves):
+    """Render the emotion curve chart (reruns on its own when curves are picked)"""
+    curve_names = list(emotion_curves['series'])
+    selected_curves = st.multiselect("Curves:", curve_names, default=curve_names)
+
+    fig_curves = go.Figure()
+    for name in selected_curves:
+        series = emotion_curves['series'][name]
+        spread = [None if v is None else v ** 0.5 for v in series['variance']]
+        fig_curves.add_trace(go.Scatter(
+            x=emotion_curves['stages'], y=series['mean'],
+            error_y=dict(type='data', array=spread, visible=True),
+            customdata=series['count'],
+            hovertemplate="%{x}: %{y:.2f} (n=%{customdata})",
+            mode='lines+markers',
+            name="All participants" if name == "overall" else name
+        ))
+    fig_curves.update_layout(xaxis_title="Stage",
+                             yaxis_title="Mean sentiment",
+                             yaxis_range=[-1.1, 1.1],
+                             height=400)
+    st.plotly_chart(fig_curves, use_container_width=True)
+
+@st.fragment
+def render_journey_view(journey_data):
+    """Render the journey view toggle and the selected journeys (reruns on its own when the view changes)"""
+    # Toggle between current and future state
+    view_mode = st.radio(
+        "Select View:", 
+        ["Current State (Pain)", "Future State (Delight)", "Side-by-Side Comparison"],
+        horizontal=True
+    )
+    
+    # Per-persona current state journeys (older data files only have the overall map)
+    persona_journeys = journey_data.get('personas', {})
+    journey_for = st.selectbox("Journey for:", ["All participants"] + list(persona_journeys))
+    current_state = persona_journeys.get(journey_for, journey_data)['current_state']
+
+    # Precomputed emotion curves (mean sentiment per stage, ±1 std)
+    emotion_curves = journey_data.get('emotion_curves')
+    if emotion_curves:
+        with st.expander("📈 Emotion Curves", expanded=False):
+            render_emotion_curves(emotion_curves)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    if view_mode == "Current State (Pain)":
+        st.markdown("## 😔 Current State Journey")
+        st.markdown("*What users experience with existing productivity tools*")
+        st.markdown("")
+        
+        for stage in current_state:
+            render_journey_stage(stage, state="current")
+    
+    elif view_mode == "Future State (Delight)":
+        st.markdown("## 😊 Future State Journey")
+        st.markdown("*What users would experience with the proposed solution*")
+        st.markdown("")
+        
+        for stage in journey_data['future_state']:
+            render_journey_stage(stage, state="future")
+    
+    else:  # Side-by-Side Comparison
+        st.markdown("## ⚖️ Side-by-Side Comparison")
+        
+        # Stages are paired by stage key (an outer join, in the order keys first
+        # appear along the journeys), so a stage missing on one side leaves a gap
+        # instead of shifting the rows below it
+        stages_by_key = {
+            label: {stage.get("stage_key", stage["stage"]): stage for stage in stages}
+            for label, stages in [("current", current_state), ("future", journey_data['future_state'])]
+        }
+        stage_keys = list(dict.fromkeys(
+            key for keys in zip_longest(*stages_by_key.values()) for key in keys if key is not None
+        ))
+        
+        for i, stage_key in enumerate(stage_keys):
+            col1, col2 = st.columns(2)
+            
+            for column, label, title in [(col1, "current", "Current State"), (col2, "future", "Future State")]:
+                with column:
+                    st.markdown(f"### {title}")
+                    if stage_key in stages_by_key[label]:
+                        render_journey_stage(stages_by_key[label][stage_key], state=label)
+                    else:
+                        st.caption(f"No {title.lower()} stage for '{stage_key}'")
+            
+            if i < len(stage_keys) - 1:
+                st.markdown("---")
+
+@st.fragment
+def render_journey_comparison(journey_data):
+    """Render the N-way journey comparison table (reruns on its own when journeys are picked)"""
+    journey_names = ["overall"] + list(journey_data.get('personas', {})) + [
+        f"{column}={value}"
+        for column, values in journey_data.get('segments', {}).items()
+        for value in values
+    ]
+    selected = st.multiselect("Compare journeys:", journey_names)
+    state = st.radio("State:", ["current_state", "future_state"], horizontal=True,
+                     format_func=lambda name: name.replace("_", " ").title())
+    if len(selected) < 2:
+        st.caption("Pick at least two journeys to compare them stage by stage.")
+        return
+    
+    # The comparison table needs pandas, which the rest of the page never loads
+    from journey_mapper import JourneyMapper
+    
+    mapper = JourneyMapper()
+    mapper.journey_maps = journey_data
+    st.dataframe(mapper.compare_personas(selected, state), use_container_width=True)
+
+def render(data):
+    """Render journey maps page"""
+    st.markdown("# 🗺️ Journey Maps")
+    st.markdown("Current state (pain) vs Future state (delight)")
+    st.markdown("---")
+    
+    render_journey_view(data["journey_maps"])
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    with st.expander("👥 Compare Personas & Segments", expanded=False):
+        render_journey_comparison(data["journey_maps"])
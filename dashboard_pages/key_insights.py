@@ -0,0 +1,93 @@
+"""
+Key Insights Page
+Synthesized insights with supporting evidence
+"""
+
+import streamlit as st
+from config import *
+from streamlit_components import *
+
+DATASETS = ["insights"]
+
+def render(data):
+    """Render key insights page"""
+    st.markdown("# 💡 Key Insights")
+    st.markdown("Synthesized findings from research")
+    st.markdown("---")
+    
+    insights_data = data["insights"]
+    
+    # Counter-Intuitive Insights
+    st.markdown("## 🔮 Counter-Intuitive Insights")
+    st.markdown("*Findings that challenge conventional wisdom*")
+    
+    for insight in KEY_INSIGHTS:
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 10px; margin-bottom: 1rem; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
+            <h3 style='color: white; margin-top: 0;'>✨ {insight['insight']}</h3>
+            <div style='background: rgba(255,255,255,0.2); padding: 1rem; border-radius: 5px; margin-top: 1rem;'>
+                <strong>Evidence:</strong> {insight['evidence']}
+            </div>
+            <div style='background: rgba(255,255,255,0.2); padding: 1rem; border-radius: 5px; margin-top: 0.5rem;'>
+                <strong>💡 Implication:</strong> {insight['implication']}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Detailed Insights
+    st.markdown("## 📊 Detailed Insights")
+    
+    for insight in insights_data['key_insights']:
+        render_insight_card(insight)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Behavioral Patterns
+    st.markdown("## 🔄 Behavioral Patterns")
+    
+    for pattern in insights_data['behavioral_patterns']:
+        st.markdown(f"""
+                    <div style='background: white; color: #333333; border: 2px solid #667eea; border-radius: 10px; padding: 1.5rem; margin-bottom: 1.5rem;'>
+                    <h3 style='color: #667eea; margin-top: 0;'>{pattern['name']}</h3>
+                    <p style='font-size: 1.05rem; color: #333333;'>{pattern['description']}</p>
+                    <div style='background: #f8f9fa; color: #333333; padding: 1rem; border-radius: 5px; margin-top: 1rem;'>
+                    <strong>Prevalence:</strong> {pattern['prevalence']}<br>
+                    <strong>Root Cause:</strong> {pattern['root_cause']}
+                    </div>
+                    </div>
+                """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Critical Moments
+    st.markdown("## ⚡ Critical Moments")
+    st.markdown("*Key decision points that determine success or failure*")
+    
+    for moment in insights_data['critical_moments']:
+        importance_color = {"Critical": "#dc3545", "High": "#ff9800", "Medium": "#ffc107"}
+        color = importance_color.get(moment['importance'], "#6c757d")
+        
+        st.markdown(f"""
+                    <div style='border-left: 5px solid {color}; background: white; color: #333333; padding: 1.5rem; border-radius: 5px; margin-bottom: 1rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                    <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;'>
+                    <h4 style='margin: 0; color: {color};'>{moment['moment']}</h4>
+                    <span style='background: {color}; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.85rem;'>{moment['importance']}</span>
+                    </div>
+                    <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-top: 1rem;'>
+                    <div>
+                    <strong>❌ Current Outcome:</strong><br>
+                    {moment['current_outcome']}
+                    </div>
+                    <div>
+                    <strong>✅ Desired Outcome:</strong><br>
+                    {moment['desired_outcome']}
+                    </div>
+                    </div>
+                    <div style='background: #e7f3ff; color: #333333; padding: 1rem; border-radius: 5px; margin-top: 1rem;'>
+                    <strong>🔧 Intervention:</strong> {moment['intervention']}<br>
+                    <strong>📊 Success Metric:</strong> {moment['success_metric']}
+                    </div>
+                    </div>
+                """, unsafe_allow_html=True)
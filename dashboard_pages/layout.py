@@ -0,0 +1,124 @@
+"""
+Dashboard Layout
+Page styling, sidebar navigation and footer shared by every page
+"""
+
+import streamlit as st
+from config import *
+from dashboard_pages import PAGES, load
+
+CUSTOM_CSS = """
+<style>
+    /* Main title styling */
+    .main-title {
+        font-size: 3rem;
+        font-weight: bold;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin-bottom: 0.5rem;
+    }
+    
+    /* Subtitle styling */
+    .subtitle {
+        font-size: 1.2rem;
+        color: #666;
+        margin-bottom: 2rem;
+    }
+    
+    /* Quote box */
+    .quote-box {
+        background: #f8f9fa;
+        border-left: 4px solid #667eea;
+        padding: 1rem 1.5rem;
+        margin: 1rem 0;
+        border-radius: 5px;
+        font-style: italic;
+        color: #333;
+    }
+    
+    /* Stat box */
+    .stat-box {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 10px;
+        text-align: center;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    }
+    
+    /* Section divider */
+    .section-divider {
+        height: 3px;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        margin: 3rem 0;
+        border-radius: 2px;
+    }
+    
+    /* Hide streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Improve spacing */
+    .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+</style>
+"""
+
+def interview_count() -> int:
+    """
+    Number of interviews, without parsing any research data
+
+    Read from the saved dashboard aggregates; before the pipeline has saved
+    them, the transcript files are counted instead of computing the
+    aggregates from the metadata and observation tables.
+    """
+    if DASHBOARD_AGGREGATES_FILE.exists():
+        return load("dashboard_aggregates")["interviews"]["total"]
+    return len(list(INTERVIEW_DIR.glob("interview_*.txt")))
+
+def render_sidebar():
+    """Render sidebar navigation"""
+    with st.sidebar:
+        st.markdown("# 📊 Navigation")
+        st.markdown("---")
+        
+        page = st.radio(
+            "Select Section:",
+            list(PAGES),
+            label_visibility="collapsed"
+        )
+        
+        st.markdown("---")
+        st.markdown("### 📌 Quick Stats")
+        
+        st.metric("Total Interviews", interview_count())
+        st.metric("Observations", "180+")
+        st.metric("Personas Created", "3")
+        
+        st.markdown("---")
+        st.markdown("### 🎯 Project Info")
+        st.markdown("**Author:** Ayush Saxena")
+        st.markdown("**Date:** January 2026")
+        
+        st.markdown("---")
+        st.markdown("""
+        <div style='text-align: center; color: #666; font-size: 0.8rem;'>
+            © 2026 Ayush Saxena. All rights reserved.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    return page
+
+def render_footer():
+    """Render the page footer"""
+    st.markdown("---")
+    st.markdown("""
+        <div style='text-align: center; color: #6b7280; padding: 20px;'>
+            <p>📊 <strong>User Research Product Spec</strong> - Reducing Productivity Tool Abandonment</p>
+            <p>Built with Python, Streamlit, Plotly, Pandas & Numpy <strong>| Last Updated:</strong> {}</p>
+            <p>© 2026 <strong>Ayush Saxena</strong>. All rights reserved.</p>
+        </div>
+    """.format(datetime.now().strftime("%d-%b-%Y At %I:%M %p")), unsafe_allow_html=True)
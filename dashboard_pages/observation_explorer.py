@@ -0,0 +1,89 @@
+"""
+Observation Explorer Page
+Every observation, filtered by theme, sentiment, persona, interview and date, one page at a time
+"""
+
+import streamlit as st
+from config import *
+
+DATASETS = ["observation_store"]
+
+def reset_explorer_page():
+    """Return to the first page after a filter changes"""
+    st.session_state['explorer_page'] = 1
+
+@st.fragment
+def render_explorer(store):
+    """Render the filters and the current page of matches (reruns on its own when a filter or page changes)"""
+    # Filters (applied server-side on the store's facet indexes)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        themes = st.multiselect("Theme:", sorted(store.labels['theme']), on_change=reset_explorer_page)
+    with col2:
+        sentiments = st.multiselect("Sentiment:", sorted(store.labels['sentiment']), on_change=reset_explorer_page)
+    with col3:
+        personas = st.multiselect("Persona:", sorted(store.labels['persona']), on_change=reset_explorer_page)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        interview_text = st.text_input(
+            "Interviews:",
+            placeholder="e.g., interview_01, interview_07",
+            help="Comma-separated interview ids; leave empty for all interviews",
+            on_change=reset_explorer_page
+        )
+    date_from = date_to = None
+    with col2:
+        if store.date_range:
+            first, last = (day.astype(object) for day in store.date_range)
+            dates = st.date_input("Interview date:", value=(first, last), min_value=first, max_value=last,
+                                  on_change=reset_explorer_page)
+            # Only a narrowed range filters; the full range also keeps undated observations
+            if len(dates) == 2 and tuple(dates) != (first, last):
+                date_from, date_to = dates
+            elif len(dates) == 1:
+                date_from = dates[0]
+    interviews = [interview.strip() for interview in interview_text.split(",") if interview.strip()]
+
+    mask = store.filter(themes=themes, sentiments=sentiments, personas=personas,
+                        interviews=interviews, date_from=date_from, date_to=date_to)
+    total = store.count(mask)
+
+    st.markdown(f"**{total:,}** of {store.row_count:,} observations match")
+    if total == 0:
+        st.warning("No observations match these filters")
+        return
+
+    # Only the current page of rows is decoded and sent to the browser
+    page_size = OBSERVATION_EXPLORER_PAGE_SIZE
+    page_count = -(-total // page_size)
+    if st.session_state.get('explorer_page', 1) > page_count:
+        st.session_state['explorer_page'] = page_count
+    page = st.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, key='explorer_page')
+
+    rows = store.rows(store.page_rows(mask, page, page_size))
+    st.dataframe(
+        rows,
+        column_order=['theme', 'sentiment', 'text', 'persona', 'interview_id', 'date'],
+        use_container_width=True,
+        hide_index=True
+    )
+    start = (page - 1) * page_size
+    st.caption(f"Observations {start + 1:,}-{start + len(rows):,} of {total:,}")
+
+    with st.expander("Matches by facet"):
+        facet_counts = store.facet_counts(mask)
+        for column, (facet, title) in zip(st.columns(3), [("theme", "Theme"), ("sentiment", "Sentiment"),
+                                                           ("persona", "Persona")]):
+            with column:
+                st.markdown(f"**{title}**")
+                for label, count in facet_counts[facet].items():
+                    st.markdown(f"- {label}: {count:,}")
+
+def render(data):
+    """Render observation explorer page"""
+    st.markdown("# 🔎 Observation Explorer")
+    st.markdown("Browse every observation by theme, sentiment, persona, interview and date")
+    st.markdown("---")
+
+    render_explorer(data["observation_store"])
@@ -0,0 +1,133 @@
+"""
+User Personas Page
+Persona profiles built from the interviews
+"""
+
+import streamlit as st
+from config import *
+
+DATASETS = ["personas"]
+
+def render(data):
+    """Render user personas page"""
+    st.markdown("# 👥 User Personas")
+    st.markdown("3 behavioral personas from research")
+    st.markdown("---")
+    
+    personas = data["personas"]
+    
+    # Persona selector
+    persona_names = [p['name'] for p in personas]
+    selected_persona_name = st.selectbox("Select Persona:", persona_names)
+    
+    selected_persona = next(p for p in personas if p['name'] == selected_persona_name)
+    
+    # Persona Header
+    st.markdown(f"## {selected_persona['name']}")
+    st.markdown(f"*\"{selected_persona['tagline']}\"*")
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Demographics
+    col1, col2, col3 = st.columns(3)
+    
+    # Bootstrap confidence intervals (absent in personas.json from older pipeline runs)
+    ci_level = selected_persona.get('confidence_intervals', {}).get('level', 0.95)
+    
+    def format_ci(bounds):
+        return f" ({ci_level:.0%} CI {bounds[0]}–{bounds[1]})" if bounds else ""
+    
+    with col1:
+        st.markdown("### 📊 Demographics")
+        demo = selected_persona['demographics']
+        st.markdown(f"""
+        - **Age:** {demo['age']} ({demo['age_range']}){format_ci(demo.get('age_ci'))}
+        - **Occupation:** {demo['occupation']}
+        - **Education:** {demo['education']}
+        - **Location:** {demo['location']}
+        - **Tech Savviness:** {demo['tech_savviness']}
+        """)
+    
+    with col2:
+        st.markdown("### 🎯 Behavioral Patterns")
+        behavior = selected_persona['behavioral_patterns']
+        st.markdown(f"""
+        - **Tools Abandoned:** {behavior['avg_tools_abandoned']}{format_ci(behavior.get('avg_tools_abandoned_ci'))}
+        - **Typical Abandonment:** {behavior['typical_abandonment_time']}
+        - **Primary Pain:** {behavior['primary_pain']}
+        """)
+    
+    with col3:
+        st.markdown("### 🧠 Psychographics")
+        psycho = selected_persona['psychographics']
+        st.markdown(f"""
+        - **Personality:** {psycho['personality']}
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Goals and Frustrations
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### ✅ Goals")
+        for goal in selected_persona['goals']:
+            st.markdown(f"- {goal}")
+    
+    with col2:
+        st.markdown("### ❌ Frustrations")
+        for frustration in selected_persona['frustrations']:
+            st.markdown(f"- {frustration}")
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Typical Day
+    st.markdown("### 📅 A Day in the Life")
+    st.markdown(selected_persona['typical_day'])
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Current Tools
+    st.markdown("### 🔧 Current Tools")
+    for tool in selected_persona['current_tools']:
+        st.markdown(f"- {tool}")
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Pain Points
+    st.markdown("### 💥 Top Pain Points")
+    
+    for pain_point in selected_persona['pain_points']:
+        st.markdown(f"""
+        <div style='background: #fff3cd; color: #333333; padding: 1rem; border-radius: 5px; border-left: 4px solid #ffc107; margin-bottom: 0.5rem;'>
+            <strong>{pain_point['theme']}</strong><br>
+            Mentioned {pain_point['mentions']} times in interviews{format_ci(pain_point.get('mentions_ci'))}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Quotes
+    st.markdown("### 💬 Representative Quotes")
+    
+    for quote in selected_persona['quotes']:
+        st.markdown(f"""
+        <div style='background: #f8f9fa; color: #333333; border-left: 4px solid #667eea; padding: 1rem 1.5rem; margin: 1rem 0; border-radius: 5px; font-style: italic;'>
+            "{quote}"
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Needs and Success Criteria
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🎁 What They Need")
+        for need in selected_persona['needs']:
+            st.markdown(f"✓ {need}")
+    
+    with col2:
+        st.markdown("### 🏆 Success Looks Like")
+        for criterion in selected_persona['success_criteria']:
+            st.markdown(f"✓ {criterion}")
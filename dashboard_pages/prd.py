@@ -0,0 +1,289 @@
+"""
+Product Requirements Page
+Product requirements document and evidence-ranked recommendations
+"""
+
+import streamlit as st
+import pandas as pd
+from config import *
+
+DATASETS = ["insights"]
+
+def render(data):
+    """Render PRD page"""
+    st.markdown("# 📄 Product Requirements Document")
+    st.markdown("Progressive Productivity Tool: Reducing First-14-Day Abandonment")
+    st.markdown("---")
+    
+    # PRD Header
+    st.markdown("## 📋 Document Information")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Product Name:** Progressive Productivity Tool  
+        **Version:** 1.0  
+        **Author:** Ayush saxena  
+        **Date:** January 2026  
+        **Status:** Research-Based Proposal
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Target Users:** Students & Young Professionals (18-28)  
+        **Problem:** 64% abandon productivity tools by Day 14  
+        **Solution:** Progressive onboarding + Task visibility limits  
+        **Goal:** Improve Day-14 retention from 18% to 38%
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Problem Statement
+    st.markdown("## 🎯 Problem Statement")
+    
+    st.markdown("""
+    <div style='background: #fff3cd; padding: 2rem; border-radius: 10px; border-left: 5px solid #ffc107;'>
+        <h3 style='margin-top: 0; color: #856404;'>The Problem</h3>
+        <p style='font-size: 1.1rem; color: #333; margin-bottom: 0;'>
+            Students and young professionals abandon productivity tools within the first 14 days because 
+            <strong>initial setup complexity and task visibility creates cognitive overload and guilt</strong>, 
+            leading to an 82% abandonment rate.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("### Evidence")
+    st.markdown("""
+    - 64% of users abandon before Day 14 (industry baseline: 82% eventually abandon)
+    - 82% cite "too complicated" as primary reason
+    - 73% spend 2-4 hours on setup before seeing any value
+    - 68% experience guilt from incomplete tasks
+    - 18% Day-14 retention (industry baseline)
+    """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Solution Overview
+    st.markdown("## 💡 Solution Overview")
+    
+    st.markdown("""
+    A productivity tool that **starts minimal and grows progressively**, addressing the root causes of abandonment:
+    
+    1. **< 2-Minute Onboarding:** Guided setup ending with one completed task
+    2. **3-Task Visibility Limit:** Enforced focus, prevents overwhelm
+    3. **Progressive Feature Disclosure:** Unlock features based on usage patterns
+    4. **Anti-Guilt Design:** No overdue badges, focus on wins not failures
+    5. **Context-Aware Intelligence:** Adapt UI to time/location/calendar
+    """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # User Stories
+    st.markdown("## 📖 User Stories")
+    
+    user_stories = [
+        {
+            "as": "A new user",
+            "want": "Complete onboarding in under 2 minutes",
+            "so": "I can see value immediately without feeling overwhelmed",
+            "priority": "P0",
+            "acceptance_criteria": [
+                "Onboarding consists of exactly 3 steps",
+                "Step 1: 'What's your first task today?' (30 sec max)",
+                "Step 2: Help complete that task (2 min max)",
+                "Step 3: Celebrate completion + prompt for next task (30 sec)",
+                "Total time: < 2 minutes measured",
+                "90% of users complete onboarding"
+            ]
+        },
+        {
+            "as": "An active user",
+            "want": "See only 3 tasks at a time",
+            "so": "I can focus without feeling overwhelmed by my entire task list",
+            "priority": "P0",
+            "acceptance_criteria": [
+                "Default view shows max 3 tasks",
+                "Completed tasks auto-hide after celebration",
+                "New task addition only after completing one (or explicit 'show more')",
+                "Users can override limit but with clear warning",
+                "Task completion rate > 60% (vs 22% baseline)"
+            ]
+        },
+        {
+            "as": "A returning user",
+            "want": "Be greeted positively when I come back after absence",
+            "so": "I don't feel guilty about not using the app",
+            "priority": "P0",
+            "acceptance_criteria": [
+                "No 'overdue task' concept exists",
+                "Welcome message: 'Welcome back! Ready to start?' not punishment",
+                "Show completed tasks from last session, not incomplete",
+                "No red badges or alarming notifications",
+                "Self-reported stress score < 4/10"
+            ]
+        },
+        {
+            "as": "A growing user",
+            "want": "Unlock features gradually as I use the tool",
+            "so": "I'm not overwhelmed by options I don't understand yet",
+            "priority": "P1",
+            "acceptance_criteria": [
+                "Week 1: Only task add/complete visible",
+                "Week 2: Tags unlock (if 5+ tasks completed)",
+                "Week 3: Projects unlock (if tags used)",
+                "Feature discovery is contextual, never forced",
+                "Average active features < 7 for 70% of users"
+            ]
+        },
+        {
+            "as": "A first-day user",
+            "want": "Complete at least one task in my first session",
+            "so": "I feel successful and want to return",
+            "priority": "P0",
+            "acceptance_criteria": [
+                "Onboarding MUST end with one completed task",
+                "Celebration moment triggers (confetti/positive message)",
+                "Immediate prompt: 'Great! What's next?'",
+                "90% complete 1+ task in first session",
+                "Day-1 completion predicts 2.5x better retention"
+            ]
+        }
+    ]
+    
+    for i, story in enumerate(user_stories, 1):
+        # Define colors
+        # P0 = Red Border / Light Red Background (#ffebee)
+        # P1/P2 = Orange/Yellow Border / Light Yellow Background (#fff3cd)
+        color_map = {
+            "P0": {"main": "#dc3545", "light_bg": "#ffebee"},
+            "P1": {"main": "#ff9800", "light_bg": "#fff3cd"},
+            "P2": {"main": "#ffc107", "light_bg": "#fff3cd"}
+        }
+        
+        # Get colors for this story
+        colors = color_map.get(story['priority'], {"main": "#6c757d", "light_bg": "#ffffff"})
+        
+        st.markdown(f"""
+        <div style='border: 2px solid {colors['main']}; background: {colors['light_bg']}; color: #333333; border-radius: 10px; padding: 1.5rem; margin-bottom: 1.5rem;'>
+            <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem; width: 100%;'>
+                <h4 style='margin: 0; color: #333333;'>Story #{i}</h4>
+                <span style='background: {colors['main']}; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.85rem;'>{story['priority']}</span>
+            </div>
+            <p style='font-size: 1.05rem; margin-bottom: 1rem; color: #333333;'>
+                <strong>As</strong> {story['as']},<br>
+                <strong>I want</strong> {story['want']},<br>
+                <strong>So that</strong> {story['so']}
+            </p>
+            <div style='background: #f8f9fa; color: #333333; padding: 1rem; border-radius: 5px; border: 1px solid rgba(0,0,0,0.05);'>
+                <strong>Acceptance Criteria:</strong>
+                <ul style='margin-top: 0.5rem; margin-bottom: 0;'>
+                    {''.join([f'<li>{ac}</li>' for ac in story['acceptance_criteria']])}
+                </ul>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Success Metrics
+    st.markdown("## 📊 Success Metrics")
+    
+    metrics_data = pd.DataFrame([
+        {
+            "Metric": "Day 14 Retention",
+            "Baseline": "18%",
+            "Target": "38%",
+            "Improvement": "+20pp",
+            "Priority": "Primary"
+        },
+        {
+            "Metric": "Time to First Win",
+            "Baseline": "180 min",
+            "Target": "< 5 min",
+            "Improvement": "97% reduction",
+            "Priority": "Primary"
+        },
+        {
+            "Metric": "Task Completion Rate",
+            "Baseline": "22%",
+            "Target": "55%",
+            "Improvement": "+150%",
+            "Priority": "Secondary"
+        },
+        {
+            "Metric": "Self-Reported Stress",
+            "Baseline": "6.8/10",
+            "Target": "3.2/10",
+            "Improvement": "-53%",
+            "Priority": "Secondary"
+        },
+        {
+            "Metric": "Day 7 Retention",
+            "Baseline": "35%",
+            "Target": "60%",
+            "Improvement": "+25pp",
+            "Priority": "Secondary"
+        }
+    ])
+    
+    st.dataframe(metrics_data, use_container_width=True, hide_index=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Product Recommendations
+    st.markdown("## 🔧 Product Recommendations")
+    
+    insights_data = data["insights"]
+    
+    for rec in insights_data['product_recommendations']:
+        priority_color = {
+            "P0 (Critical)": "#dc3545",
+            "P1 (High)": "#ff9800",
+            "P2 (Medium)": "#ffc107"
+        }
+        color = priority_color.get(rec['priority'], "#6c757d")
+        evidence = rec.get('evidence')
+        evidence_line = (
+            f"<br><strong>🧮 Evidence Score:</strong> {evidence['score']:.2f} "
+            f"(reach {evidence['reach']:.0%}, intensity {evidence['intensity']:.0%}, "
+            f"persona coverage {evidence['persona_coverage']:.0%})"
+            if evidence else ""
+        )
+        
+        st.markdown(f"""
+        <div style='border-left: 5px solid {color}; background: white; color: #333333; padding: 1.5rem; border-radius: 5px; margin-bottom: 1.5rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+            <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;'>
+                <h4 style='margin: 0; color: {color};'>{rec['title']}</h4>
+                <span style='background: {color}; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.85rem;'>{rec['priority']}</span>
+            </div>
+            <p style='font-size: 1.05rem; color: #333333;'>{rec['description']}</p>
+            <div style='background: #f8f9fa; color: #333333; padding: 1rem; border-radius: 5px; margin-top: 1rem; margin-bottom: 1rem;'>
+                <strong>Rationale:</strong> {rec['rationale']}
+            </div>
+            <div style='background: #e7f3ff; color: #333333; padding: 1rem; border-radius: 5px;'>
+                <strong>📈 Expected Impact:</strong> {rec['expected_impact']}<br>
+                <strong>📊 Success Metric:</strong> {rec['success_metric']}{evidence_line}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Out of Scope
+    st.markdown("## 🚫 Out of Scope (V1)")
+    
+    st.markdown("""
+    The following features are intentionally excluded from V1 to maintain simplicity:
+    
+    - Team collaboration / shared workspaces
+    - Advanced automation / AI features
+    - Calendar integration (beyond context awareness)
+    - File attachments
+    - Subtasks / hierarchical structures
+    - Custom themes / extensive personalization
+    - Native integrations (Slack, email, etc.)
+    - Time tracking / Pomodoro timer
+    
+    **Rationale:** Feature richness contributes to abandonment. V1 focuses exclusively on solving the abandonment problem.
+    """)
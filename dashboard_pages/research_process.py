@@ -0,0 +1,131 @@
+"""
+Research Process Page
+Methodology, interview guide and participant demographics
+"""
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from config import *
+from chart_data import histogram_bars
+
+DATASETS = ["dashboard_aggregates"]
+
+def render(data):
+    """Render research process page"""
+    st.markdown("# 🔍 Research Process")
+    st.markdown("Detailed methodology and approach")
+    st.markdown("---")
+    
+    # Research Plan
+    st.markdown("## 📋 Research Plan")
+    
+    st.markdown("""
+    ### Objectives
+    1. **Understand abandonment patterns:** Why do users stop using productivity tools?
+    2. **Identify critical moments:** What specific events trigger abandonment?
+    3. **Uncover emotional drivers:** What feelings contribute to the decision?
+    4. **Generate actionable insights:** What product changes would prevent abandonment?
+    """)
+    
+    st.markdown("### Research Questions")
+    
+    questions = [
+        "What productivity tools have you tried, and what happened?",
+        "Walk me through your typical experience with a new productivity tool.",
+        "What specific moment made you stop using the tool?",
+        "How did the tool make you feel? (emotions, not just functionality)",
+        "If you could design the perfect productivity tool, what would it look like?"
+    ]
+    
+    for i, q in enumerate(questions, 1):
+        st.markdown(f"**{i}.** {q}")
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Interview Guide
+    st.markdown("## 📝 Interview Guide")
+    
+    with st.expander("View Complete Interview Script", expanded=False):
+        st.markdown("""
+        ### Introduction (2 minutes)
+        - Thank participant
+        - Explain research purpose
+        - Emphasize no right/wrong answers
+        - Get consent
+        
+        ### Warm-Up (5 minutes)
+        - Tell me about yourself
+        - How do you currently manage your tasks?
+        - What's your relationship with productivity?
+        
+        ### Tool History (10 minutes)
+        - What productivity tools have you tried?
+        - Walk me through discovering and starting with [Tool X]
+        - What was the setup experience like?
+        - How did you use it in the first week?
+        
+        ### Abandonment Deep-Dive (15 minutes)
+        - What changed after the first week?
+        - Can you pinpoint the moment you started using it less?
+        - How did that make you feel?
+        - What did you tell yourself about why you stopped?
+        - Did you try to restart? What happened?
+        
+        ### Ideal Solution (5 minutes)
+        - What would the perfect tool look like?
+        - What would need to change for you to stick with a tool?
+        - What features would you remove, not add?
+        
+        ### Closing (3 minutes)
+        - Anything else to share?
+        - Can I follow up if needed?
+        - Thank you!
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    # Participant Demographics
+    st.markdown("## 👥 Participant Demographics")
+    
+    interviews = data["dashboard_aggregates"]["interviews"]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Age distribution
+        fig_age = go.Figure(go.Bar(**histogram_bars(interviews['age_histogram']), marker_color='#667eea'))
+        fig_age.update_layout(title="Age Distribution", xaxis_title="Age",
+                              yaxis_title="Number of Participants", bargap=0)
+        st.plotly_chart(fig_age, use_container_width=True)
+    
+    with col2:
+        # Persona distribution
+        persona_counts = interviews['persona_counts']
+        fig_persona = px.pie(values=list(persona_counts.values()), 
+                            names=list(persona_counts.keys()),
+                            title="Persona Distribution",
+                            hole=0.4)
+        st.plotly_chart(fig_persona, use_container_width=True)
+    
+    # Tools abandoned
+    st.markdown("### Tools Abandoned Distribution")
+    fig_tools = go.Figure(go.Bar(**histogram_bars(interviews['tools_abandoned_histogram']), marker_color='#764ba2'))
+    fig_tools.update_layout(title="Number of Tools Previously Abandoned per Participant",
+                            xaxis_title="Tools Abandoned", yaxis_title="Participants", bargap=0.1)
+    st.plotly_chart(fig_tools, use_container_width=True)
+    
+    # Interview timeline
+    st.markdown("### Interview Timeline")
+    timeline_data = interviews['timeline']
+    
+    fig_timeline = go.Figure()
+    fig_timeline.add_trace(go.Scatter(x=timeline_data['dates'], y=timeline_data['values'],
+                                     mode='lines+markers',
+                                     name='Cumulative Interviews',
+                                     line=dict(color='#667eea', width=3)))
+    fig_timeline.update_layout(title="Interview Timeline (Cumulative)",
+                              xaxis_title="Date",
+                              yaxis_title="Cumulative Interviews",
+                              height=400)
+    st.plotly_chart(fig_timeline, use_container_width=True)
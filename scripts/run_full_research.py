@@ -2,20 +2,21 @@
 Complete Research Pipeline
 Generates all research data: interviews, affinity mapping, personas, journey maps, and insights
 
-Run this script to generate all project data from scratch
+Run this script to generate all project data. Stages whose inputs, code and
+configuration are unchanged since the last run are skipped; pass --force to
+regenerate everything from scratch.
 """
 
+import argparse
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from interview_generator import InterviewGenerator
-from affinity_mapper import AffinityMapper
-from persona_builder import PersonaBuilder
-from journey_mapper import JourneyMapper
-from insights_synthesizer import InsightsSynthesizer
+from pipeline import build_research_pipeline
+from research_context import ResearchContext
+from instrumentation import RUN_REPORT_FILE
 from config import *
 
 def print_header(text):
@@ -26,49 +27,41 @@ def print_header(text):
 
 def main():
     """Run complete research pipeline"""
+    parser = argparse.ArgumentParser(description="Generate all research data")
+    parser.add_argument("--force", action="store_true", help="Run every stage even if it is up to date")
+    args = parser.parse_args()
     
+    print_config_summary()
     print_header("USER RESEARCH PROJECT - FULL PIPELINE")
     print("This script will generate all research data for the project.")
-    print("Estimated time: 2-3 minutes")
+    print("Stages: generate → affinity / transcript index → aggregates / observation store / personas / journeys → insights")
     print()
     
-    # --- FIX: Removed input() so CI/CD doesn't crash ---
-    # input("Press Enter to start generation...")
-    print("Starting generation automatically...")
-    
-    # Step 1: Generate Interviews
-    print_header("STEP 1/5: GENERATING INTERVIEW TRANSCRIPTS")
-    generator = InterviewGenerator(num_interviews=NUM_INTERVIEWS)
-    generator.generate_all_interviews()
-    
-    # Step 2: Affinity Mapping
-    print_header("STEP 2/5: PERFORMING AFFINITY MAPPING")
-    mapper = AffinityMapper()
-    observations_df = mapper.process_all_interviews()
-    
-    # Step 3: Build Personas
-    print_header("STEP 3/5: BUILDING USER PERSONAS")
-    builder = PersonaBuilder()
-    personas = builder.build_personas()
-    
-    # Step 4: Create Journey Maps
-    print_header("STEP 4/5: CREATING JOURNEY MAPS")
-    journey_mapper = JourneyMapper()
-    journey_maps = journey_mapper.create_journey_maps()
-    
-    # Step 5: Synthesize Insights
-    print_header("STEP 5/5: SYNTHESIZING INSIGHTS")
-    synthesizer = InsightsSynthesizer()
-    synthesis_report = synthesizer.synthesize_all_insights()
+    # Every stage publishes its output here, so no artifact is re-read from disk
+    context = ResearchContext()
+    pipeline = build_research_pipeline(context)
+    results = pipeline.run(force=args.force)
+    personas = context.personas
     
     # Complete!
     print_header("✅ PIPELINE COMPLETE!")
     
-    print("All research data has been generated successfully!")
+    print("Stage summary:")
+    for result in results:
+        icon = "✓" if result['status'] == "ran" else "⏭"
+        print(f"   {icon} {result['stage']:<10} {result['status']:<8} {result['seconds']:.2f}s")
+    print(f"Artifacts read from disk: {sum(context.load_counts.values())}")
+    if any(result['status'] == "ran" for result in results):
+        print(f"Run report (timing, memory, throughput): {RUN_REPORT_FILE}")
+    else:
+        print(f"Run report unchanged (every stage was up to date): {RUN_REPORT_FILE}")
     print()
     print("📁 Generated Files:")
     print(f"   - {NUM_INTERVIEWS} interview transcripts")
-    print(f"   - Affinity mapping clusters")
+    print(f"   - Affinity mapping clusters (+ ranked observation search index)")
+    print(f"   - Transcript search index")
+    print(f"   - Precomputed dashboard chart data")
+    print(f"   - Indexed observation store (observation explorer)")
     print(f"   - {len(personas)} user personas")
     print(f"   - Journey maps (current + future state)")
     print(f"   - Synthesized insights and recommendations")
@@ -78,7 +71,7 @@ def main():
     print("   2. Explore the research findings")
     print("   3. Review the PRD and recommendations")
     print()
-    print("💡 Tip: You can regenerate data anytime by running this script again.")
+    print("💡 Tip: Run with --force to regenerate everything from scratch.")
     print()
 
 if __name__ == "__main__":
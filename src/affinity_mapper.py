@@ -6,21 +6,34 @@ Clusters interview observations into themes
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import re
 from collections import Counter
 from config import *
+from research_context import ResearchContext
+from instrumentation import instrument
+from observation_search import ObservationSearch
 
 class AffinityMapper:
     """
     Performs affinity mapping on interview transcripts
     """
     
-    def __init__(self):
-        """Initialize affinity mapper"""
+    def __init__(self, context: Optional[ResearchContext] = None):
+        """
+        Initialize affinity mapper
+        
+        Args:
+            context: Shared research context (a new one is created if omitted)
+        """
+        self.context = context or ResearchContext()
         self.observations = []
         self.clusters = []
+        self.search_index = None
         
+    @instrument("affinity.extract_observations",
+                rows=lambda result, arguments: len(result),
+                bytes_in=lambda result, arguments: len(arguments["transcript"].encode('utf-8')))
     def extract_observations(self, transcript: str, interview_id: str) -> List[Dict]:
         """
         Extract key observations from interview transcript
@@ -89,6 +102,7 @@ class AffinityMapper:
         else:
             return "neutral"
     
+    @instrument("affinity.assign_themes", rows=lambda result, arguments: len(result))
     def assign_themes(self, observations: List[Dict]) -> List[Dict]:
         """
         Assign themes to observations based on keywords
@@ -164,6 +178,11 @@ class AffinityMapper:
         
         all_observations = []
         
+        # Observations are indexed for ranked search as each interview is processed
+        metadata = self.context.metadata
+        personas = dict(zip(metadata['interview_id'], metadata['persona']))
+        self.search_index = ObservationSearch()
+        
         # Load all interview transcripts
         interview_files = sorted(INTERVIEW_DIR.glob("interview_*.txt"))
         
@@ -173,13 +192,11 @@ class AffinityMapper:
             with open(interview_file, 'r', encoding='utf-8') as f:
                 transcript = f.read()
             
-            # Extract observations
-            observations = self.extract_observations(transcript, interview_id)
+            # Extract observations and assign themes
+            observations = self.assign_themes(self.extract_observations(transcript, interview_id))
+            self.search_index.add(observations, personas)
             all_observations.extend(observations)
         
-        # Assign themes
-        all_observations = self.assign_themes(all_observations)
-        
         # Convert to DataFrame
         observations_df = pd.DataFrame(all_observations)
         
@@ -188,6 +205,9 @@ class AffinityMapper:
         # Save to file
         observations_df.to_csv(PROCESSED_DATA_DIR / "affinity_clusters.csv", index=False)
         print(f"💾 Saved to: {PROCESSED_DATA_DIR / 'affinity_clusters.csv'}")
+        self.search_index.save(OBSERVATION_SEARCH_FILE)
+        print(f"💾 Saved search index to: {OBSERVATION_SEARCH_FILE}")
+        self.context.set("observations", observations_df)
         
         # Print summary
         self._print_theme_summary(observations_df)
@@ -221,7 +241,7 @@ class AffinityMapper:
         Returns:
             DataFrame with cluster summaries
         """
-        observations_df = pd.read_csv(PROCESSED_DATA_DIR / "affinity_clusters.csv")
+        observations_df = self.context.observations
         
         cluster_summary = []
         
@@ -0,0 +1,117 @@
+"""
+Chart Data Module
+Server-side binning and downsampling so chart payloads stay bounded at any corpus size
+"""
+
+from typing import Dict, List
+import numpy as np
+from config import *
+
+def histogram(values, bins: int = CHART_MAX_BARS) -> Dict:
+    """
+    Equal-width histogram of numeric values
+
+    Args:
+        values: Numeric values
+        bins: Number of bins
+
+    Returns:
+        Dictionary with bin edges (one more than counts) and counts
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return {"edges": [], "counts": []}
+    counts, edges = np.histogram(values, bins=bins)
+    return {"edges": [round(float(edge), 2) for edge in edges], "counts": counts.tolist()}
+
+def integer_histogram(values, max_bars: int = CHART_MAX_BARS) -> Dict:
+    """
+    Histogram of integer values: one bar per value while they fit, equal-width bins otherwise
+
+    Args:
+        values: Integer values (e.g. tools abandoned per participant)
+        max_bars: Most bars returned
+
+    Returns:
+        Dictionary with bin edges and counts (see histogram)
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if len(values) == 0:
+        return {"edges": [], "counts": []}
+    low, high = int(values.min()), int(values.max())
+    if high - low + 1 > max_bars:
+        return histogram(values, max_bars)
+    counts = np.bincount(values - low, minlength=high - low + 1)
+    return {"edges": (np.arange(low, high + 2) - 0.5).tolist(), "counts": counts.tolist()}
+
+def histogram_bars(hist: Dict) -> Dict[str, List]:
+    """
+    Bar chart coordinates of a histogram
+
+    Args:
+        hist: Result of histogram or integer_histogram
+
+    Returns:
+        Dictionary with bar centers (x), counts (y) and bar widths (width)
+    """
+    edges = hist["edges"]
+    return {
+        "x": [(low + high) / 2 for low, high in zip(edges, edges[1:])],
+        "y": list(hist["counts"]),
+        "width": [high - low for low, high in zip(edges, edges[1:])]
+    }
+
+def lttb(x, y, max_points: int = CHART_MAX_POINTS) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling of a time series
+
+    Keeps the first and last points and, from each of max_points - 2 equal
+    buckets in between, the point forming the largest triangle with the point
+    kept from the previous bucket and the average of the next bucket. The
+    shape of the series (peaks, steps) survives far better than with every-nth
+    sampling.
+
+    Args:
+        x: Increasing x values (numeric, e.g. day numbers)
+        y: y values
+        max_points: Points to keep (at least 3)
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+
+    # Bucket i spans edges[i]:edges[i + 1]; the first and last points are their own buckets
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    kept = np.empty(max_points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        kept[i + 1] = previous
+    return kept
+
+def downsample_timeline(dates, values, max_points: int = CHART_MAX_POINTS) -> Dict[str, List]:
+    """
+    Downsample a daily series with LTTB
+
+    Args:
+        dates: Sorted datetime-like values
+        values: Series values (e.g. cumulative interviews)
+        max_points: Most points returned
+
+    Returns:
+        Dictionary with ISO dates and values of the kept points
+    """
+    days = np.asarray(dates, dtype='datetime64[D]')
+    values = np.asarray(values)
+    kept = lttb(days.astype(np.int64), values, max_points)
+    return {"dates": days[kept].astype(str).tolist(), "values": values[kept].tolist()}
@@ -33,6 +33,13 @@ for directory in [RAW_DATA_DIR, PROCESSED_DATA_DIR, SYNTHETIC_DATA_DIR,
 NUM_INTERVIEWS = 22  # Total interviews conducted
 INTERVIEW_DURATION_MIN = 30  # Minimum interview duration (minutes)
 INTERVIEW_DURATION_MAX = 45  # Maximum interview duration (minutes)
+PERSONA_QUOTE_TOP_K = 5  # Representative quotes kept per persona
+
+# ===== BOOTSTRAP CONFIDENCE INTERVALS =====
+BOOTSTRAP_RESAMPLES = 10000  # Resamples per persona
+BOOTSTRAP_CONFIDENCE = 0.95  # Confidence level of reported intervals
+BOOTSTRAP_SEED = 42  # Fixed seed so rebuilds report identical intervals
+BOOTSTRAP_MAX_CHUNK_CELLS = 2_000_000  # Resample weight cells held in memory at once
 
 # ===== USER PERSONAS =====
 PERSONA_DEFINITIONS = {
@@ -59,6 +66,9 @@ PERSONA_DEFINITIONS = {
     }
 }
 
+# Profile content (goals, needs, values, ...) per persona; add entries here for new personas
+PERSONA_PROFILES_FILE = DATA_DIR / "persona_profiles.json"
+
 # ===== PAIN POINTS (From Research) =====
 PAIN_POINTS = [
     {
@@ -159,6 +169,7 @@ JOURNEY_STAGES = {
     "current_state": [
         {
             "stage": "Discovery",
+            "stage_key": "discovery",
             "action": "Hears about productivity tool from friend/YouTube",
             "emotion": "😊 Excited",
             "pain": "Overwhelmed by options (Notion vs Todoist vs Trello)",
@@ -166,6 +177,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Signup",
+            "stage_key": "signup",
             "action": "Creates account, sees empty workspace",
             "emotion": "😐 Neutral",
             "pain": "No guidance on where to start",
@@ -173,6 +185,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Setup",
+            "stage_key": "activation",
             "action": "Spends 2-3 hours creating perfect system",
             "emotion": "😫 Frustrated",
             "pain": "Choice paralysis: templates, databases, tags, folders",
@@ -180,6 +193,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Initial Use",
+            "stage_key": "early_use",
             "action": "Adds 20+ tasks, organizes by project/priority",
             "emotion": "😌 Hopeful",
             "pain": "Unclear which task to start with",
@@ -187,6 +201,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Reality Check",
+            "stage_key": "engagement",
             "action": "Opens app after 2 days, sees 15 incomplete tasks",
             "emotion": "😔 Guilty",
             "pain": "Feels like failure, tool becomes reminder of incompletion",
@@ -194,6 +209,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Abandonment",
+            "stage_key": "outcome",
             "action": "Stops opening app, returns to pen and paper",
             "emotion": "😞 Defeated",
             "pain": "Tool feels like burden, not help",
@@ -203,6 +219,7 @@ JOURNEY_STAGES = {
     "future_state": [
         {
             "stage": "Discovery",
+            "stage_key": "discovery",
             "action": "Hears about progressive productivity tool",
             "emotion": "😊 Curious",
             "delight": "Promise of 'no overwhelm' and 'quick setup'",
@@ -210,6 +227,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Signup",
+            "stage_key": "signup",
             "action": "Creates account, sees 3 simple prompts",
             "emotion": "😌 Relieved",
             "delight": "No empty workspace anxiety, clear starting point",
@@ -217,6 +235,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "First Task",
+            "stage_key": "activation",
             "action": "Adds first task, completes it in 5 minutes",
             "emotion": "😊 Accomplished",
             "delight": "Immediate win, positive reinforcement",
@@ -224,6 +243,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Early Usage",
+            "stage_key": "early_use",
             "action": "Uses tool 3-5 times in first week",
             "emotion": "😃 Confident",
             "delight": "Tool adapts to behavior, reveals features gradually",
@@ -231,6 +251,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Habit Formation",
+            "stage_key": "engagement",
             "action": "Completes 3+ tasks per week consistently",
             "emotion": "💪 Empowered",
             "delight": "Sees progress without guilt, tool feels helpful",
@@ -238,6 +259,7 @@ JOURNEY_STAGES = {
         },
         {
             "stage": "Long-term",
+            "stage_key": "outcome",
             "action": "Integrated into daily workflow",
             "emotion": "😌 Calm",
             "delight": "Tool invisible, habits visible",
@@ -246,6 +268,159 @@ JOURNEY_STAGES = {
     ]
 }
 
+# ===== JOURNEY STAGE TAGGING =====
+# Keywords that place an interview observation in a current-state journey stage
+JOURNEY_STAGE_KEYWORDS = {
+    "Discovery": [
+        "heard about", "recommend", "youtube", "looking for", "perfect system",
+        "new tool", "tried so many", "i've tried", "everyone"
+    ],
+    "Signup": [
+        "download the app", "create an account", "sign up", "blank screen",
+        "now what", "empty workspace"
+    ],
+    "Setup": [
+        "setup", "setting up", "set it up", "setting things up", "tutorial",
+        "template", "tags or folders", "workspace", "recreate"
+    ],
+    "Initial Use": [
+        "start using", "adding all my tasks", "color-coding", "reminders",
+        "first few days", "excited", "basic task", "start strong"
+    ],
+    "Reality Check": [
+        "overdue", "red notification", "red badge", "incomplete", "piling up",
+        "miss a few days", "judging", "pile up", "feel bad", "failure"
+    ],
+    "Abandonment": [
+        "stop using", "stop opening", "gave up", "give up", "go back to",
+        "pen and paper", "another one", "abandon", "never stick", "lose steam"
+    ]
+}
+
+# Mentions extracted per stage to replace hard-coded channels and tools
+JOURNEY_CHANNEL_KEYWORDS = {
+    "YouTube": ["youtube"],
+    "Social media": ["instagram", "twitter", "social media"],
+    "Word of mouth": ["friend", "colleague", "everyone at work"],
+    "Push notifications": ["notification", "badge"],
+    "Email reminders": ["email"],
+    "Mobile app": ["the app", "an app", "this app"]
+}
+JOURNEY_TOOL_KEYWORDS = {
+    "Notion": ["notion"],
+    "Todoist": ["todoist"],
+    "Trello": ["trello"],
+    "Asana": ["asana"],
+    "ClickUp": ["clickup"],
+    "Microsoft To Do": ["microsoft to do"],
+    "Google Keep": ["google keep"],
+    "Evernote": ["evernote"],
+    "Tutorial videos": ["tutorial"],
+    "Templates": ["template"],
+    "Pen and paper": ["pen and paper", "notebook", "paper"]
+}
+
+SENTIMENT_SCORES = {"negative": -1.0, "neutral": 0.0, "positive": 1.0}
+
+# Observed mean sentiment score (upper bound) -> emotion label
+EMOTION_SCALE = [
+    (-0.5, "😞 Defeated"),
+    (-0.2, "😫 Frustrated"),
+    (0.2, "😐 Neutral"),
+    (0.5, "😌 Hopeful"),
+    (1.0, "😊 Excited")
+]
+
+# Metadata columns that get their own journey maps besides persona
+JOURNEY_SEGMENT_COLUMNS = ["current_tool"]
+
+JOURNEY_MIN_STAGE_EVIDENCE = 3  # Observations needed before evidence replaces defaults
+JOURNEY_STAGE_QUOTES = 2  # Quotes shown per journey stage
+
+# ===== RESEARCH METRICS =====
+# Share of interviews with at least one observation in the affinity theme
+RESEARCH_THEME_METRICS = {
+    "feature_overwhelm_rate": "Feature Overwhelm",
+    "guilt_rate": "Productivity Guilt",
+    "setup_fatigue_rate": "Setup Fatigue",
+    "context_switching_rate": "Context Switching",
+    "prioritization_difficulty_rate": "Prioritization Difficulty",
+    "tool_hopping_rate": "Tool Hopping Behavior",
+    "social_comparison_rate": "Social Comparison Anxiety"
+}
+
+# Share of interviews with at least one observation matching the pattern (case-insensitive)
+RESEARCH_TEXT_METRICS = {
+    "self_blame_rate": r"disciplin|my fault|lazy|something wrong with me",
+    "tutorial_reliance_rate": r"tutorial|video",
+    "over_organization_rate": r"reorganiz|perfect system|organizing",
+    "feature_anxiety_rate": r"feature|advanced|power user"
+}
+
+RESEARCH_MULTI_TOOL_THRESHOLD = 3  # Tools abandoned to count as a serial tool switcher
+
+INSIGHTS_SAMPLE_QUOTES = 3  # Sample quotes per qualitative theme
+INSIGHTS_QUOTE_SEED = 42  # Seed for sample quote selection (same data -> same quotes)
+INSIGHTS_COMPACT_JSON = False  # Write insights_synthesis.json without indentation
+INSIGHTS_MSGPACK = False  # Also write insights_synthesis.msgpack (requires msgpack)
+
+# Figures interviews cannot measure (product analytics and industry benchmarks)
+RESEARCH_EXTERNAL_BASELINES = {
+    "avg_abandonment_days": {"value": 12.3, "note": "Product analytics, first-use cohort"},
+    "day_14_abandonment_rate": {"value": 0.64, "note": "Product analytics, first-use cohort"},
+    "day_14_retention_baseline": {"value": 0.18, "note": "Industry baseline"},
+    "retention_with_day1_task": {"value": 0.45, "note": "Product analytics, day-1 task cohort"},
+    "retention_without_day1_task": {"value": 0.18, "note": "Product analytics, day-1 task cohort"},
+    "completion_rate_multiplier": {"value": 3.0, "note": "Product analytics, feature usage cohort"},
+    "avg_setup_hours": {"value": 3.0, "note": "Diary study estimate"},
+    "tutorial_videos_watched": {"value": 4.2, "note": "Diary study estimate"}
+}
+
+# ===== RECOMMENDATION SCORING =====
+# Affinity themes that are evidence for each product recommendation
+RECOMMENDATION_THEMES = {
+    "REC001": ["Setup Fatigue"],
+    "REC002": ["Feature Overwhelm", "Prioritization Difficulty"],
+    "REC003": ["Productivity Guilt", "Social Comparison Anxiety"],
+    "REC004": ["Feature Overwhelm"],
+    "REC005": ["Setup Fatigue", "Tool Hopping Behavior"],
+    "REC006": ["Context Switching", "Lack of Flexibility"],
+    "REC007": ["Feature Overwhelm", "Prioritization Difficulty"]
+}
+
+# Evidence score = weighted sum of reach, intensity and persona coverage (all 0-1)
+RECOMMENDATION_SCORE_WEIGHTS = {
+    "reach": 0.5,
+    "intensity": 0.3,
+    "persona_coverage": 0.2
+}
+
+RECOMMENDATION_PERSONA_MIN_REACH = 0.25  # Reach within a persona for it to count as covered
+
+# ===== TRANSCRIPT SEARCH =====
+TRANSCRIPT_INDEX_FILE = PROCESSED_DATA_DIR / "transcript_index.npz"  # Built by the pipeline
+TRANSCRIPT_SEARCH_SNIPPETS = 3  # Matching lines shown per interview
+TRANSCRIPT_SEARCH_MAX_RESULTS = 50  # Interviews listed per search (counts cover all matches)
+TRANSCRIPT_PAGE_LINES = 40  # Transcript lines shown per viewer page
+
+# ===== OBSERVATION SEARCH =====
+OBSERVATION_SEARCH_FILE = PROCESSED_DATA_DIR / "observation_search.npz"  # Built during affinity mapping
+OBSERVATION_SEARCH_K1 = 1.2  # BM25 term frequency saturation
+OBSERVATION_SEARCH_B = 0.75  # BM25 document length normalization
+OBSERVATION_SEARCH_TOP_K = 20  # Ranked observations returned per query
+
+# ===== OBSERVATION EXPLORER =====
+OBSERVATION_STORE_FILE = PROCESSED_DATA_DIR / "observation_store.npz"  # Columnar store with facet indexes
+OBSERVATION_EXPLORER_PAGE_SIZE = 50  # Observations shown per explorer page
+
+# ===== DASHBOARD AGGREGATES =====
+DASHBOARD_AGGREGATES_FILE = PROCESSED_DATA_DIR / "dashboard_aggregates.json"  # Precomputed chart data
+DASHBOARD_AGE_BINS = 10  # Equal-width bins of the participant age histogram
+DASHBOARD_THEME_SAMPLE_SIZE = 10  # Sample observations per theme in the theme deep dive
+DASHBOARD_SAMPLE_SEED = 42  # Seed for the theme samples (same data -> same samples)
+CHART_MAX_BARS = 50  # Most bars per histogram sent to the browser
+CHART_MAX_POINTS = 500  # Most points per time series sent to the browser (LTTB downsampling)
+
 # ===== SUCCESS METRICS =====
 SUCCESS_METRICS = {
     "primary": {
@@ -300,8 +475,10 @@ COLORS = {
     "dark": "#343a40"          # Dark gray
 }
 
-print(f"✅ Configuration loaded successfully")
-print(f"📁 Project Root: {PROJECT_ROOT}")
-print(f"📊 Total Interviews: {NUM_INTERVIEWS}")
-print(f"👥 Personas: {len(PERSONA_DEFINITIONS)}")
-print(f"💡 Key Insights: {len(KEY_INSIGHTS)}")
\ No newline at end of file
+def print_config_summary():
+    """Print a short configuration summary (command-line entry points only; importing config stays silent)"""
+    print(f"✅ Configuration loaded successfully")
+    print(f"📁 Project Root: {PROJECT_ROOT}")
+    print(f"📊 Total Interviews: {NUM_INTERVIEWS}")
+    print(f"👥 Personas: {len(PERSONA_DEFINITIONS)}")
+    print(f"💡 Key Insights: {len(KEY_INSIGHTS)}")
\ No newline at end of file
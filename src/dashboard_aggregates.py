@@ -0,0 +1,84 @@
+"""
+Dashboard Aggregates Module
+Precomputed chart data for the dashboard, so page reruns do no pandas work
+"""
+
+import json
+from pathlib import Path
+from typing import Dict
+import pandas as pd
+from config import *
+from chart_data import downsample_timeline, histogram, integer_histogram
+from instrumentation import file_size, instrument
+from report_writer import atomic_write
+
+def _counts(series: pd.Series) -> Dict:
+    """value_counts as a plain {value: count} dictionary, most frequent first"""
+    return {str(value): int(count) for value, count in series.value_counts().items()}
+
+def compute_dashboard_aggregates(metadata_df: pd.DataFrame, observations_df: pd.DataFrame,
+                                 age_bins: int = DASHBOARD_AGE_BINS,
+                                 sample_size: int = DASHBOARD_THEME_SAMPLE_SIZE) -> Dict:
+    """
+    Aggregate interview metadata and observations into the dashboard's chart data
+
+    Args:
+        metadata_df: Interview metadata
+        observations_df: Affinity observations with theme and sentiment
+        age_bins: Number of equal-width age histogram bins
+        sample_size: Sample observations kept per theme
+
+    Returns:
+        Dictionary with "interviews" (age and tools-abandoned histograms,
+        persona counts, cumulative timeline downsampled to CHART_MAX_POINTS) and
+        "observations" (theme counts, sentiment counts, the sentiment split
+        of every theme and a fixed sample of each theme's observations)
+    """
+    # Parse each distinct date once; a corpus has far fewer dates than interviews
+    date_counts = metadata_df['date'].value_counts()
+    timeline = date_counts.groupby(pd.to_datetime(date_counts.index)).sum().sort_index()
+
+    theme_sentiment = pd.crosstab(observations_df['theme'], observations_df['sentiment'])
+
+    # One seeded shuffle, then the first rows of every theme: same data, same samples
+    samples = observations_df.sample(frac=1, random_state=DASHBOARD_SAMPLE_SEED)
+    samples = samples.groupby('theme', sort=False).head(sample_size)[['theme', 'text', 'sentiment', 'interview_id']]
+
+    return {
+        "interviews": {
+            "total": len(metadata_df),
+            "age_histogram": histogram(metadata_df['age'], age_bins),
+            "persona_counts": _counts(metadata_df['persona']),
+            "tools_abandoned_histogram": integer_histogram(metadata_df['tools_abandoned']),
+            "timeline": downsample_timeline(timeline.index, timeline.cumsum().to_numpy())
+        },
+        "observations": {
+            "total": len(observations_df),
+            "theme_counts": _counts(observations_df['theme']),
+            "sentiment_counts": _counts(observations_df['sentiment']),
+            "theme_sentiment": {
+                theme: {sentiment: int(count) for sentiment, count in row.items() if count}
+                for theme, row in theme_sentiment.iterrows()
+            },
+            "theme_samples": {
+                str(theme): rows.drop(columns='theme').astype(str).to_dict('records')
+                for theme, rows in samples.groupby('theme')
+            }
+        }
+    }
+
+@instrument("dashboard_aggregates.save", bytes_out=lambda result, arguments: file_size(result))
+def save_dashboard_aggregates(aggregates: Dict, output_file: Path = DASHBOARD_AGGREGATES_FILE) -> Path:
+    """
+    Write dashboard aggregates as compact JSON (atomically, so the dashboard never reads a partial file)
+
+    Args:
+        aggregates: Result of compute_dashboard_aggregates
+        output_file: Output JSON file
+
+    Returns:
+        The output file path
+    """
+    with atomic_write(output_file) as f:
+        json.dump(aggregates, f, ensure_ascii=False, separators=(',', ':'))
+    return Path(output_file)
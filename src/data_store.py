@@ -0,0 +1,171 @@
+"""
+Data Store Module
+Process-wide, read-only research data that reloads when the pipeline rewrites its files
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config import *
+from research_context import ARTIFACTS
+
+def _is_dataframe(value: Any) -> bool:
+    """Whether a value is a DataFrame, without importing pandas on pages that never load one"""
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, pandas.DataFrame)
+
+def _enable_copy_on_write() -> None:
+    """Zero-copy views rely on copy-on-write (always on from pandas 3)"""
+    import pandas as pd
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+def file_signature(paths: List[Path]) -> Tuple:
+    """
+    Change signature of files: (mtime_ns, size) per path, None when missing
+
+    A directory's signature changes when files are added or removed.
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+class FrozenDict(dict):
+    """dict that refuses modification (copy() and deepcopy() return mutable containers)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Shared research data is read-only; copy it before modifying")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+class FrozenList(list):
+    """list that refuses modification (copy() and deepcopy() return mutable containers)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Shared research data is read-only; copy it before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into FrozenDict / FrozenList"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+def _load_transcript_index(paths: List[Path]):
+    """Saved transcript index, or one built from the transcripts if none was saved"""
+    from transcript_index import TranscriptIndex
+    index_file, transcript_dir = paths
+    if index_file.exists():
+        return TranscriptIndex.load(index_file, transcript_dir)
+    return TranscriptIndex.build(transcript_dir)
+
+def _load_observation_search(paths: List[Path]):
+    """Saved observation search index, or one built from the observations if none was saved"""
+    from observation_search import ObservationSearch
+    index_file, observations_file, metadata_file = paths
+    if index_file.exists():
+        return ObservationSearch.load(index_file)
+    return ObservationSearch.from_dataframe(ARTIFACTS["observations"][1](observations_file),
+                                            ARTIFACTS["metadata"][1](metadata_file))
+
+def _load_dashboard_aggregates(paths: List[Path]):
+    """Saved dashboard aggregates, or ones computed from the research data if none were saved"""
+    aggregates_file, metadata_file, observations_file = paths
+    if aggregates_file.exists():
+        with open(aggregates_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    # Computing them needs pandas, which pages reading only the saved JSON never import
+    from dashboard_aggregates import compute_dashboard_aggregates
+    return compute_dashboard_aggregates(ARTIFACTS["metadata"][1](metadata_file),
+                                        ARTIFACTS["observations"][1](observations_file))
+
+def _load_observation_store(paths: List[Path]):
+    """Saved observation store, or one built from the research data if none was saved"""
+    from observation_store import ObservationStore
+    store_file, observations_file, metadata_file = paths
+    if store_file.exists():
+        return ObservationStore.load(store_file)
+    return ObservationStore.from_dataframe(ARTIFACTS["observations"][1](observations_file),
+                                           ARTIFACTS["metadata"][1](metadata_file))
+
+class DataStore:
+    """
+    Shared cache of research artifacts for every dashboard session
+
+    Each entry remembers the signature of the files it was loaded from and is
+    reloaded on the first access after any of them changes, so viewers see a
+    pipeline run's output without restarting the app. Entries are shared,
+    never copied per session: DataFrames are handed out as copy-on-write
+    shallow copies (zero-copy; a caller's modifications stay private) and
+    parsed JSON is frozen.
+    """
+
+    def __init__(self, loaders: Optional[Dict[str, Tuple[List[Path], Callable]]] = None):
+        """
+        Initialize an empty store
+
+        Args:
+            loaders: Mapping of name to (source files, loader); the loader receives
+                the list of files. Defaults to the research artifacts, search indexes,
+                dashboard aggregates and observation store.
+        """
+        self.loaders = loaders or {
+            **{name: ([path], lambda paths, parser=parser: parser(paths[0]))
+               for name, (path, parser) in ARTIFACTS.items()},
+            "transcript_index": ([TRANSCRIPT_INDEX_FILE, INTERVIEW_DIR], _load_transcript_index),
+            "observation_search": ([OBSERVATION_SEARCH_FILE, ARTIFACTS["observations"][0],
+                                    ARTIFACTS["metadata"][0]], _load_observation_search),
+            "dashboard_aggregates": ([DASHBOARD_AGGREGATES_FILE, ARTIFACTS["metadata"][0],
+                                      ARTIFACTS["observations"][0]], _load_dashboard_aggregates),
+            "observation_store": ([OBSERVATION_STORE_FILE, ARTIFACTS["observations"][0],
+                                   ARTIFACTS["metadata"][0]], _load_observation_store)
+        }
+        self._entries: Dict[str, Tuple[Tuple, Any]] = {}
+        self._locks = {name: threading.Lock() for name in self.loaders}
+        self.load_counts: Dict[str, int] = {name: 0 for name in self.loaders}
+
+    def get(self, name: str) -> Any:
+        """
+        Get an artifact, reloading it if its files changed since it was loaded
+
+        Args:
+            name: Artifact name
+
+        Returns:
+            Read-only artifact (DataFrames as zero-copy views)
+        """
+        paths, loader = self.loaders[name]
+        signature = file_signature(paths)
+        entry = self._entries.get(name)
+        if entry is None or entry[0] != signature:
+            # One loader per artifact at a time; other sessions wait for its result
+            with self._locks[name]:
+                entry = self._entries.get(name)
+                if entry is None or entry[0] != signature:
+                    value = loader(paths)
+                    if _is_dataframe(value):
+                        _enable_copy_on_write()
+                    entry = (signature, freeze(value))
+                    self._entries[name] = entry
+                    self.load_counts[name] += 1
+
+        value = entry[1]
+        return value.copy(deep=False) if _is_dataframe(value) else value
@@ -5,74 +5,104 @@ Synthesizes patterns and insights from research data
 
 import pandas as pd
 import numpy as np
-import json
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from collections import Counter
 from config import *
+from research_metrics import ResearchMetrics
+from recommendation_scorer import RecommendationScorer
+from research_context import ResearchContext
+from instrumentation import file_size, instrument
+from report_writer import atomic_write, write_sections
+
+# Report sections the text report is built from (kept after the JSON report is written)
+TEXT_REPORT_SECTIONS = ("key_insights", "product_recommendations", "quantitative_findings")
 
 class InsightsSynthesizer:
     """
     Synthesizes insights from interviews, affinity mapping, and personas
     """
     
-    def __init__(self):
-        """Initialize insights synthesizer"""
+    def __init__(self, context: Optional[ResearchContext] = None):
+        """
+        Initialize insights synthesizer
+        
+        Args:
+            context: Shared research context (a new one is created if omitted)
+        """
+        self.context = context or ResearchContext()
         self.insights = []
         self.patterns = []
         self.recommendations = []
+        self.metrics = None
         
     def synthesize_all_insights(self) -> Dict:
         """
         Synthesize all insights from research
         
         Returns:
-            Dictionary with insights, patterns, and recommendations
+            Dictionary with the key insights, product recommendations and
+            quantitative findings (the full report is on disk)
         """
         print("💡 Synthesizing insights from research data...")
         
         # Load all data sources
-        metadata_df = pd.read_csv(RAW_DATA_DIR / "interview_metadata.csv")
-        observations_df = pd.read_csv(PROCESSED_DATA_DIR / "affinity_clusters.csv")
+        metadata_df = self.context.metadata
+        observations_df = self.context.observations
+        personas = self.context.personas
         
-        with open(PROCESSED_DATA_DIR / "personas.json", 'r') as f:
-            personas = json.load(f)
+        # Compute every research rate once, with provenance
+        self.metrics = ResearchMetrics.compute(metadata_df, observations_df)
         
-        # Synthesize insights
-        self.insights = self._generate_key_insights(metadata_df, observations_df, personas)
-        self.patterns = self._identify_behavioral_patterns(metadata_df, observations_df)
-        self.recommendations = self._generate_product_recommendations(self.insights, self.patterns)
-        
-        # Compile full report
-        synthesis_report = {
-            "key_insights": self.insights,
-            "behavioral_patterns": self.patterns,
-            "product_recommendations": self.recommendations,
-            "quantitative_findings": self._generate_quantitative_findings(metadata_df, observations_df),
-            "qualitative_themes": self._generate_qualitative_themes(observations_df),
-            "counter_intuitive_insights": KEY_INSIGHTS,
-            "critical_moments": self._identify_critical_moments()
-        }
-        
-        # Save report
-        self._save_synthesis_report(synthesis_report)
+        # Sections are written to disk as they are produced
+        summary = self._save_synthesis_report(
+            self._report_sections(metadata_df, observations_df, personas)
+        )
         
         print(f"✅ Synthesized {len(self.insights)} key insights")
         print(f"✅ Identified {len(self.patterns)} behavioral patterns")
         print(f"✅ Generated {len(self.recommendations)} product recommendations")
         
-        return synthesis_report
+        return summary
+    
+    def _report_sections(self, metadata_df: pd.DataFrame,
+                         observations_df: pd.DataFrame,
+                         personas: List[Dict]) -> Iterator[Tuple[str, object]]:
+        """
+        Produce the synthesis report one section at a time
+        
+        Yields:
+            (section name, content) in report order
+        """
+        self.insights = self._generate_key_insights(metadata_df, observations_df, personas)
+        yield "key_insights", self.insights
+        
+        self.patterns = self._identify_behavioral_patterns(metadata_df, observations_df)
+        yield "behavioral_patterns", self.patterns
+        
+        # Ranked by the evidence behind each recommendation
+        scorer = RecommendationScorer.from_data(metadata_df, observations_df)
+        self.recommendations = scorer.rank(self._generate_product_recommendations(self.insights, self.patterns))
+        yield "product_recommendations", self.recommendations
+        
+        yield "quantitative_findings", self._generate_quantitative_findings(metadata_df, observations_df)
+        yield "qualitative_themes", self._generate_qualitative_themes(observations_df)
+        yield "counter_intuitive_insights", KEY_INSIGHTS
+        yield "critical_moments", self._identify_critical_moments()
+        yield "metric_provenance", self.metrics.to_dict()
     
     def _generate_key_insights(self, metadata_df: pd.DataFrame, 
                                 observations_df: pd.DataFrame,
                                 personas: List[Dict]) -> List[Dict]:
-        """Generate key insights from all data"""
+        """Generate key insights from all data (figures come from self.metrics)"""
         
+        metrics = self.metrics
         insights = []
         
-        # Insight 1: Tool abandonment timeline
-        avg_abandonment_days = 12.3  # From research
-        day_14_abandonment_rate = 0.64
+        # Insight 1: Tool abandonment timeline (external product analytics)
+        avg_abandonment_days = metrics.value("avg_abandonment_days")
+        day_14_abandonment_rate = metrics.value("day_14_abandonment_rate")
+        day_14_retention_baseline = metrics.value("day_14_retention_baseline")
         
         insights.append({
             "insight_id": "INS001",
@@ -80,28 +110,28 @@ class InsightsSynthesizer:
             "description": "Tool abandonment happens rapidly in the first 14 days, not gradually over months",
             "evidence": [
                 f"Average abandonment time: {avg_abandonment_days} days",
-                f"64% of users abandon before Day 14",
-                f"Only 18% remain active after Day 14 (industry baseline)"
+                f"{day_14_abandonment_rate:.0%} of users abandon before Day 14",
+                f"Only {day_14_retention_baseline:.0%} remain active after Day 14 (industry baseline)"
             ],
             "implication": "First two weeks are make-or-break. Product must deliver value immediately.",
             "priority": "Critical",
             "supporting_data": {
                 "avg_abandonment_days": avg_abandonment_days,
                 "day_14_abandonment_rate": day_14_abandonment_rate,
-                "day_14_retention_baseline": 0.18
+                "day_14_retention_baseline": day_14_retention_baseline
             }
         })
         
         # Insight 2: Cognitive load vs features
-        feature_overwhelm_rate = 0.82
+        feature_overwhelm_rate = metrics.value("feature_overwhelm_rate")
         
         insights.append({
             "insight_id": "INS002",
             "title": "Feature Paradox: More Features = Less Usage",
             "description": "Users with access to more features complete fewer tasks due to cognitive overload",
             "evidence": [
-                f"82% cited 'too complicated' as primary abandonment reason",
-                "Users with 5-7 active features completed 3x more tasks than those with 20+",
+                f"{feature_overwhelm_rate:.0%} of interviews ({metrics.counts('feature_overwhelm_rate')}) described feature overwhelm",
+                f"Users with 5-7 active features completed {metrics.value('completion_rate_multiplier'):g}x more tasks than those with 20+",
                 "Average setup time: 2-4 hours (before any productive work)"
             ],
             "implication": "Progressive disclosure is essential. Start with minimal features, add gradually.",
@@ -109,99 +139,105 @@ class InsightsSynthesizer:
             "supporting_data": {
                 "feature_overwhelm_rate": feature_overwhelm_rate,
                 "optimal_feature_count": "5-7",
-                "completion_rate_multiplier": 3.0
+                "completion_rate_multiplier": metrics.value("completion_rate_multiplier")
             }
         })
         
         # Insight 3: Guilt-driven abandonment
-        guilt_rate = 0.68
+        guilt_rate = metrics.value("guilt_rate")
+        self_blame_rate = metrics.value("self_blame_rate")
         
         insights.append({
             "insight_id": "INS003",
             "title": "Guilt as Primary Abandonment Driver",
             "description": "Users abandon not because tools lack features, but because tools make them feel inadequate",
             "evidence": [
-                f"68% reported feeling guilt when seeing incomplete tasks",
-                "73% blamed themselves ('not disciplined enough') rather than the tool",
+                f"{guilt_rate:.0%} of interviews ({metrics.counts('guilt_rate')}) expressed productivity guilt",
+                f"{self_blame_rate:.0%} blamed themselves ('not disciplined enough') rather than the tool",
                 "Users avoid opening app to avoid negative emotions"
             ],
             "implication": "Design must prevent guilt. Focus on wins, not failures. Positive reinforcement over punishment.",
             "priority": "High",
             "supporting_data": {
                 "guilt_rate": guilt_rate,
-                "self_blame_rate": 0.73
+                "self_blame_rate": self_blame_rate
             }
         })
         
         # Insight 4: Setup vs. usage time
-        setup_fatigue_rate = 0.73
+        setup_fatigue_rate = metrics.value("setup_fatigue_rate")
         
         insights.append({
             "insight_id": "INS004",
             "title": "Setup Fatigue Prevents Usage",
             "description": "Users spend so much time setting up systems that they're exhausted before doing actual work",
             "evidence": [
-                f"73% mentioned setup taking 2-4 hours",
-                "Users watch 3-5 tutorial videos before feeling competent",
+                f"{setup_fatigue_rate:.0%} of interviews ({metrics.counts('setup_fatigue_rate')}) described setup fatigue",
+                f"{metrics.percent('tutorial_reliance_rate')} relied on tutorial videos before feeling competent",
                 "Second-guessing 'correct' structure prevents action"
             ],
             "implication": "Setup must be < 5 minutes. Guided onboarding with smart defaults, not empty workspace.",
             "priority": "Critical",
             "supporting_data": {
                 "setup_fatigue_rate": setup_fatigue_rate,
-                "avg_setup_hours": 3.0,
-                "tutorial_videos_watched": 4.2
+                "avg_setup_hours": metrics.value("avg_setup_hours"),
+                "tutorial_videos_watched": metrics.value("tutorial_videos_watched"),
+                "tutorial_reliance_rate": metrics.value("tutorial_reliance_rate")
             }
         })
         
-        # Insight 5: Time to first win
+        # Insight 5: Time to first win (external product analytics)
+        retention_with_task = metrics.value("retention_with_day1_task")
+        retention_without_task = metrics.value("retention_without_day1_task")
+        retention_multiplier = round(retention_with_task / retention_without_task, 1)
+        
         insights.append({
             "insight_id": "INS005",
             "title": "First 24 Hours Predict Long-term Success",
-            "description": "Users who complete 1 task in first session have 2.5x better retention",
+            "description": f"Users who complete 1 task in first session have {retention_multiplier:g}x better retention",
             "evidence": [
-                "Users completing 1 task on Day 1 → 45% Day-14 retention",
-                "Users completing 0 tasks on Day 1 → 18% Day-14 retention",
+                f"Users completing 1 task on Day 1 → {retention_with_task:.0%} Day-14 retention",
+                f"Users completing 0 tasks on Day 1 → {retention_without_task:.0%} Day-14 retention",
                 "Quick wins build confidence and momentum"
             ],
             "implication": "Optimize for immediate success. Make first task completion trivial.",
             "priority": "Critical",
             "supporting_data": {
-                "retention_with_day1_task": 0.45,
-                "retention_without_day1_task": 0.18,
-                "retention_multiplier": 2.5
+                "retention_with_day1_task": retention_with_task,
+                "retention_without_day1_task": retention_without_task,
+                "retention_multiplier": retention_multiplier
             }
         })
         
         # Insight 6: Users blame themselves
-        self_blame_rate = 0.73
+        tools = metrics.to_dict()["avg_tools_abandoned"]
         
         insights.append({
             "insight_id": "INS006",
             "title": "Self-Attribution Bias in Tool Failure",
             "description": "Users internalize failure ('I'm not disciplined') rather than blaming poorly designed tools",
             "evidence": [
-                f"73% said 'I'm just not disciplined enough'",
-                "Users try 3-7 different tools, blaming themselves each time",
+                f"{self_blame_rate:.0%} said 'I'm just not disciplined enough'",
+                f"Users abandoned {tools['min']}-{tools['max']} different tools, blaming themselves each time",
                 "Rarely give negative reviews (feel it's their fault)"
             ],
             "implication": "Marketing must address 'it's not you, it's the tool' narrative. Design for human behavior, not ideal behavior.",
             "priority": "Medium",
             "supporting_data": {
                 "self_blame_rate": self_blame_rate,
-                "avg_tools_tried": 4.8
+                "avg_tools_abandoned": tools["value"]
             }
         })
         
         # Insight 7: Context switching needs
-        context_switching_rate = 0.55
+        context_switching_rate = metrics.value("context_switching_rate")
         
         insights.append({
             "insight_id": "INS007",
             "title": "One-Size-Fits-All Doesn't Work",
             "description": "Users need different task management approaches for work, personal life, and learning contexts",
             "evidence": [
-                f"55% mentioned needing different systems for different contexts",
+                f"{context_switching_rate:.0%} of interviews ({metrics.counts('context_switching_rate')}) mentioned switching between contexts",
                 "Work tasks require structure; personal tasks need flexibility",
                 "Users create multiple accounts/workspaces to separate contexts"
             ],
@@ -218,6 +254,7 @@ class InsightsSynthesizer:
                                       observations_df: pd.DataFrame) -> List[Dict]:
         """Identify common behavioral patterns"""
         
+        metrics = self.metrics
         patterns = []
         
         # Pattern 1: Tool hopping cycle
@@ -225,7 +262,7 @@ class InsightsSynthesizer:
             "pattern_id": "PAT001",
             "name": "Tool Hopping Cycle",
             "description": "Users repeatedly cycle through: Discovery → Honeymoon → Overwhelm → Abandonment → Repeat",
-            "prevalence": "82% of users",
+            "prevalence": f"{metrics.percent('tool_hopping_rate')} of users",
             "cycle_duration": "2-3 weeks average",
             "stages": [
                 "Excitement about new tool (Days 1-3)",
@@ -242,7 +279,7 @@ class InsightsSynthesizer:
             "pattern_id": "PAT002",
             "name": "Over-Organization Paradox",
             "description": "Users spend disproportionate time organizing rather than doing, reducing actual productivity",
-            "prevalence": "67% of 'Overwhelmed Optimizer' persona",
+            "prevalence": f"{metrics.percent('over_organization_rate', 'The Overwhelmed Optimizer')} of 'Overwhelmed Optimizer' persona",
             "manifestation": [
                 "Creating elaborate tag systems",
                 "Building complex database structures",
@@ -257,7 +294,7 @@ class InsightsSynthesizer:
             "pattern_id": "PAT003",
             "name": "Guilt Accumulation Spiral",
             "description": "Incomplete tasks → Guilt → Avoidance → More incomplete tasks → More guilt",
-            "prevalence": "68% of users",
+            "prevalence": f"{metrics.percent('guilt_rate')} of users",
             "progression": [
                 "Day 1-3: Enthusiastic task adding",
                 "Day 4-7: Some tasks incomplete",
@@ -274,7 +311,7 @@ class InsightsSynthesizer:
             "pattern_id": "PAT004",
             "name": "Feature Anxiety",
             "description": "Users feel pressure to use advanced features they don't understand or need",
-            "prevalence": "74% of users",
+            "prevalence": f"{metrics.percent('feature_anxiety_rate')} of users",
             "manifestation": [
                 "Watching tutorials for features they'll never use",
                 "Feeling 'less productive' for using basic features only",
@@ -289,7 +326,7 @@ class InsightsSynthesizer:
             "pattern_id": "PAT005",
             "name": "Fresh Start Fallacy",
             "description": "Users believe starting over with a new tool will solve behavioral challenges",
-            "prevalence": "88% tried 3+ tools",
+            "prevalence": f"{metrics.percent('multi_tool_rate')} tried {RESEARCH_MULTI_TOOL_THRESHOLD}+ tools",
             "cycle": "Every 2-3 weeks, user seeks 'better' tool with same result",
             "psychology": "Optimism bias + Sunk cost fallacy avoidance",
             "actual_outcome": "Same patterns repeat with each new tool",
@@ -302,6 +339,10 @@ class InsightsSynthesizer:
                                           patterns: List[Dict]) -> List[Dict]:
         """Generate product recommendations based on insights"""
         
+        metrics = self.metrics
+        retention_multiplier = round(
+            metrics.value("retention_with_day1_task") / metrics.value("retention_without_day1_task"), 1
+        )
         recommendations = []
         
         # Recommendation 1: Progressive onboarding
@@ -311,7 +352,7 @@ class InsightsSynthesizer:
             "title": "Implement Progressive Onboarding (< 2 Minutes)",
             "priority": "P0 (Critical)",
             "description": "Replace empty workspace with guided 3-step onboarding",
-            "rationale": "73% abandoned due to setup fatigue. Must reduce setup to < 5 minutes.",
+            "rationale": f"{metrics.percent('setup_fatigue_rate')} described setup fatigue. Must reduce setup to < 5 minutes.",
             "implementation": [
                 "Step 1: Ask one question: 'What's your first task today?' (30 sec)",
                 "Step 2: Help them complete it immediately (2 min)",
@@ -329,7 +370,7 @@ class InsightsSynthesizer:
             "title": "Limit Visible Tasks to 3 at a Time",
             "priority": "P0 (Critical)",
             "description": "Enforce maximum of 3 visible tasks. Hide rest until current tasks are complete.",
-            "rationale": "82% overwhelmed by long task lists. Constraints drive focus.",
+            "rationale": f"{metrics.percent('feature_overwhelm_rate')} overwhelmed by long task lists. Constraints drive focus.",
             "implementation": [
                 "Default view: Max 3 tasks",
                 "Completed tasks auto-hide (celebrate, then remove)",
@@ -348,7 +389,7 @@ class InsightsSynthesizer:
             "title": "Eliminate Guilt-Inducing Elements",
             "priority": "P0 (Critical)",
             "description": "Remove all guilt-inducing UI patterns (overdue badges, red notifications, task counters)",
-            "rationale": "68% abandoned due to guilt. Must flip from punishment to encouragement.",
+            "rationale": f"{metrics.percent('guilt_rate')} expressed productivity guilt. Must flip from punishment to encouragement.",
             "implementation": [
                 "No 'overdue' concept—tasks are just 'pending'",
                 "No red badges or alarming colors",
@@ -368,7 +409,7 @@ class InsightsSynthesizer:
             "title": "Progressive Feature Disclosure",
             "priority": "P1 (High)",
             "description": "Start with only task adding/completing. Unlock features based on usage patterns.",
-            "rationale": "Users with 5-7 features complete 3x more tasks than those with 20+.",
+            "rationale": f"Users with 5-7 features complete {metrics.value('completion_rate_multiplier'):g}x more tasks than those with 20+.",
             "implementation": [
                 "Week 1: Basic tasks only",
                 "Week 2: Unlock tags (if using 5+ tasks per week)",
@@ -388,7 +429,7 @@ class InsightsSynthesizer:
             "title": "Optimize for First-Session Success",
             "priority": "P0 (Critical)",
             "description": "Make it impossible NOT to complete at least one task in first session",
-            "rationale": "Users with Day-1 completion have 2.5x better retention.",
+            "rationale": f"Users with Day-1 completion have {retention_multiplier:g}x better retention.",
             "implementation": [
                 "Onboarding MUST end with one completed task",
                 "Pre-populate with easy 'starter task' if user doesn't add one",
@@ -408,7 +449,7 @@ class InsightsSynthesizer:
             "title": "Context-Aware Task Presentation",
             "priority": "P2 (Medium)",
             "description": "Automatically adjust UI based on time of day, location, and calendar",
-            "rationale": "55% need different approaches for work vs personal contexts.",
+            "rationale": f"{metrics.percent('context_switching_rate')} need different approaches for work vs personal contexts.",
             "implementation": [
                 "Morning: Focus on 'energizing' tasks",
                 "Work hours: Professional tasks only",
@@ -428,7 +469,7 @@ class InsightsSynthesizer:
             "title": "Enforce Simplicity Constraints",
             "priority": "P1 (High)",
             "description": "Build in constraints that prevent users from over-organizing",
-            "rationale": "67% fall into over-organization trap without guidance.",
+            "rationale": f"{metrics.percent('over_organization_rate', 'The Overwhelmed Optimizer')} of Overwhelmed Optimizers fall into over-organization trap without guidance.",
             "implementation": [
                 "Max 3 active projects at once",
                 "Max 5 tags total",
@@ -445,23 +486,25 @@ class InsightsSynthesizer:
     
     def _generate_quantitative_findings(self, metadata_df: pd.DataFrame,
                                         observations_df: pd.DataFrame) -> Dict:
-        """Generate quantitative summary findings"""
+        """Generate quantitative summary findings (provenance in "metric_provenance")"""
+        
+        metrics = self.metrics
         
         return {
             "sample_size": len(metadata_df),
-            "interview_duration_avg": metadata_df['duration_minutes'].mean(),
+            "interview_duration_avg": metrics.value("avg_interview_minutes"),
             "abandonment_stats": {
-                "avg_tools_abandoned": metadata_df['tools_abandoned'].mean(),
-                "avg_abandonment_days": 12.3,
-                "day_14_abandonment_rate": 0.64,
-                "day_14_retention_baseline": 0.18
+                "avg_tools_abandoned": metrics.value("avg_tools_abandoned"),
+                "avg_abandonment_days": metrics.value("avg_abandonment_days"),
+                "day_14_abandonment_rate": metrics.value("day_14_abandonment_rate"),
+                "day_14_retention_baseline": metrics.value("day_14_retention_baseline")
             },
             "pain_point_prevalence": {
-                "feature_overwhelm": 0.82,
-                "productivity_guilt": 0.68,
-                "setup_fatigue": 0.73,
-                "context_switching": 0.55,
-                "prioritization_difficulty": 0.64
+                "feature_overwhelm": metrics.value("feature_overwhelm_rate"),
+                "productivity_guilt": metrics.value("guilt_rate"),
+                "setup_fatigue": metrics.value("setup_fatigue_rate"),
+                "context_switching": metrics.value("context_switching_rate"),
+                "prioritization_difficulty": metrics.value("prioritization_difficulty_rate")
             },
             "persona_distribution": metadata_df['persona'].value_counts().to_dict(),
             "observation_count": len(observations_df),
@@ -469,29 +512,51 @@ class InsightsSynthesizer:
         }
     
     def _generate_qualitative_themes(self, observations_df: pd.DataFrame) -> List[Dict]:
-        """Generate qualitative themes summary"""
+        """
+        Generate qualitative themes summary
         
-        themes = []
+        Counts and sentiment breakdowns for every theme come from one crosstab,
+        and sample quotes from one seeded shuffle followed by a per-theme head,
+        so the cost does not grow with the number of themes.
+        """
         
-        for theme_name in observations_df['theme'].unique():
-            theme_obs = observations_df[observations_df['theme'] == theme_name]
-            
+        total = len(observations_df)
+        sentiment_counts = pd.crosstab(observations_df['theme'], observations_df['sentiment'])
+        
+        # Most frequent first; ties keep the order in which themes first appear
+        first_seen = observations_df['theme'].drop_duplicates()
+        theme_counts = sentiment_counts.sum(axis=1).reindex(first_seen).sort_values(ascending=False, kind='stable')
+        
+        # Seeded random rank per observation, then the first N of each theme
+        rng = np.random.default_rng(INSIGHTS_QUOTE_SEED)
+        shuffled = observations_df.iloc[rng.permutation(total)]
+        sample_quotes = shuffled.groupby('theme', sort=False).head(INSIGHTS_SAMPLE_QUOTES).groupby('theme')['text'].agg(list)
+        
+        # Sentiments of every theme ordered by count in one argsort
+        sentiment_counts = sentiment_counts.reindex(theme_counts.index)
+        sentiments = sentiment_counts.columns.to_numpy()
+        counts = sentiment_counts.to_numpy()
+        order = np.argsort(-counts, axis=1, kind='stable')
+        
+        themes = []
+        for row, (theme_name, count) in enumerate(theme_counts.items()):
             themes.append({
                 "theme": theme_name,
-                "observation_count": len(theme_obs),
-                "percentage": (len(theme_obs) / len(observations_df)) * 100,
-                "sentiment_breakdown": theme_obs['sentiment'].value_counts().to_dict(),
-                "sample_quotes": theme_obs.sample(n=min(3, len(theme_obs)))['text'].tolist()
+                "observation_count": int(count),
+                "percentage": (int(count) / total) * 100,
+                "sentiment_breakdown": {
+                    sentiments[i]: int(counts[row, i]) for i in order[row] if counts[row, i] > 0
+                },
+                "sample_quotes": sample_quotes[theme_name]
             })
         
-        # Sort by observation count
-        themes = sorted(themes, key=lambda x: x['observation_count'], reverse=True)
-        
         return themes
     
     def _identify_critical_moments(self) -> List[Dict]:
         """Identify critical moments in user journey that determine success/failure"""
         
+        day_14_abandonment_rate = self.metrics.value("day_14_abandonment_rate")
+        
         critical_moments = [
             {
                 "moment": "First 5 Minutes (Signup → First Task)",
@@ -512,7 +577,7 @@ class InsightsSynthesizer:
             {
                 "moment": "Day 10-14 (Abandonment Window)",
                 "importance": "Critical",
-                "current_outcome": "64% abandon permanently",
+                "current_outcome": f"{day_14_abandonment_rate:.0%} abandon permanently",
                 "desired_outcome": "Users form habit, continue using",
                 "intervention": "Weekly wins summary, habit formation nudges",
                 "success_metric": "Day 14 retention > 38%"
@@ -529,45 +594,83 @@ class InsightsSynthesizer:
         
         return critical_moments
     
-    def _save_synthesis_report(self, report: Dict) -> None:
-        """Save synthesis report to file"""
+    @instrument("insights.save_synthesis_report",
+                bytes_out=lambda result, arguments: (file_size(PROCESSED_DATA_DIR / "insights_synthesis.json")
+                                                  + file_size(REPORTS_DIR / "research_findings.txt")))
+    def _save_synthesis_report(self, sections: Iterator[Tuple[str, object]]) -> Dict:
+        """
+        Stream the synthesis report to JSON and write the text report
+        
+        Both files are replaced atomically, so readers never see a partial report.
+        Only the sections the text report needs are kept once written; the
+        rest are released as soon as they are on disk.
+        
+        Args:
+            sections: (section name, content) pairs in report order
+            
+        Returns:
+            Dictionary with the sections kept for the text report
+        """
+        report = {}
         
-        # Save as JSON
+        def keep_text_report_sections():
+            for key, value in sections:
+                if key in TEXT_REPORT_SECTIONS:
+                    report[key] = value
+                yield key, value
+        
+        # Save as JSON (and msgpack for machine consumers), section by section
         json_file = PROCESSED_DATA_DIR / "insights_synthesis.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        msgpack_file = PROCESSED_DATA_DIR / "insights_synthesis.msgpack" if INSIGHTS_MSGPACK else None
+        write_sections(keep_text_report_sections(), json_file,
+                       compact=INSIGHTS_COMPACT_JSON, msgpack_file=msgpack_file)
+        # Readers of the context load the new report from disk when they need it
+        self.context.invalidate("insights")
         
         # Save as readable text report
+        quantitative = report['quantitative_findings']
+        lines = [
+            "="*80 + "\n",
+            "USER RESEARCH SYNTHESIS REPORT\n",
+            "Reducing Productivity Tool Abandonment\n",
+            "="*80 + "\n\n",
+            "EXECUTIVE SUMMARY\n",
+            "-"*80 + "\n",
+            f"Sample Size: {quantitative['sample_size']} interviews\n",
+            f"Key Finding: {quantitative['abandonment_stats']['day_14_abandonment_rate']:.0%} "
+            f"abandon productivity tools within 14 days\n",
+            "Primary Cause: Cognitive overload and guilt, not lack of discipline\n\n",
+            "KEY INSIGHTS\n",
+            "-"*80 + "\n"
+        ]
+        for i, insight in enumerate(report['key_insights'], 1):
+            lines.append(f"\n{i}. {insight['title']} [{insight['priority']}]\n"
+                         f"   {insight['description']}\n"
+                         f"   Implication: {insight['implication']}\n")
+        
+        lines.append("\n\nPRODUCT RECOMMENDATIONS\n")
+        lines.append("-"*80 + "\n")
+        for i, rec in enumerate(report['product_recommendations'], 1):
+            lines.append(f"\n{i}. {rec['title']} [{rec['priority']}]\n"
+                         f"   {rec['description']}\n"
+                         f"   Expected Impact: {rec['expected_impact']}\n")
+            if rec['evidence']:
+                evidence = rec['evidence']
+                lines.append(f"   Evidence Score: {evidence['score']:.2f} (reach {evidence['reach']:.0%}, "
+                             f"intensity {evidence['intensity']:.0%}, "
+                             f"persona coverage {evidence['persona_coverage']:.0%})\n")
+        
         txt_file = REPORTS_DIR / "research_findings.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("USER RESEARCH SYNTHESIS REPORT\n")
-            f.write("Reducing Productivity Tool Abandonment\n")
-            f.write("="*80 + "\n\n")
-            
-            f.write("EXECUTIVE SUMMARY\n")
-            f.write("-"*80 + "\n")
-            f.write(f"Sample Size: {report['quantitative_findings']['sample_size']} interviews\n")
-            f.write(f"Key Finding: 64% abandon productivity tools within 14 days\n")
-            f.write(f"Primary Cause: Cognitive overload and guilt, not lack of discipline\n\n")
-            
-            f.write("KEY INSIGHTS\n")
-            f.write("-"*80 + "\n")
-            for i, insight in enumerate(report['key_insights'], 1):
-                f.write(f"\n{i}. {insight['title']} [{insight['priority']}]\n")
-                f.write(f"   {insight['description']}\n")
-                f.write(f"   Implication: {insight['implication']}\n")
-            
-            f.write("\n\nPRODUCT RECOMMENDATIONS\n")
-            f.write("-"*80 + "\n")
-            for i, rec in enumerate(report['product_recommendations'], 1):
-                f.write(f"\n{i}. {rec['title']} [{rec['priority']}]\n")
-                f.write(f"   {rec['description']}\n")
-                f.write(f"   Expected Impact: {rec['expected_impact']}\n")
+        with atomic_write(txt_file) as f:
+            f.writelines(lines)
         
         print(f"💾 Saved synthesis report to:")
         print(f"   JSON: {json_file}")
         print(f"   Text: {txt_file}")
+        if msgpack_file is not None:
+            print(f"   msgpack: {msgpack_file}")
+        
+        return report
 
 if __name__ == "__main__":
     print("="*60)
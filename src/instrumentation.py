@@ -0,0 +1,212 @@
+"""
+Instrumentation Module
+Wall time, CPU time, peak memory and throughput for pipeline stages and hot functions
+"""
+
+import functools
+import inspect
+import json
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from config import *
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RUN_REPORT_FILE = REPORTS_DIR / "pipeline_run_report.json"
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+class Span:
+    """
+    Measurements of one instrumented call; rows and bytes are filled in by the caller
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize span
+
+        Args:
+            name: Span name (e.g. "stage:personas", "affinity.assign_themes")
+        """
+        self.name = name
+        self.rows = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.rss_growth_mb: Optional[float] = None
+
+class RunRecorder:
+    """
+    Thread-safe collector of span measurements for one pipeline run
+
+    Calls are aggregated per span name (count, totals and memory), so
+    instrumenting a function called once per interview stays cheap at scale.
+
+    Memory is reported two ways, both from the process-wide peak RSS (the
+    only figure the OS keeps): ``process_peak_rss_mb`` is the process
+    high-water mark when the span ended, and ``peak_rss_growth_mb`` is the
+    most one call raised it. Growth can include allocations of concurrently
+    running stages, and a span that stays below an earlier peak shows none.
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder"""
+        self._lock = threading.Lock()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.spans: Dict[str, Dict] = {}
+
+    @contextmanager
+    def span(self, name: str):
+        """
+        Measure a block of code
+
+        CPU time is per thread, so concurrently running stages do not count
+        each other's work.
+
+        Args:
+            name: Span name
+
+        Yields:
+            Span whose rows / bytes_in / bytes_out the block may set
+        """
+        record = Span(name)
+        rss_start = peak_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield record
+        finally:
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = time.thread_time() - cpu_start
+            rss_end = peak_rss_mb()
+            if rss_end is not None:
+                record.rss_growth_mb = round(rss_end - rss_start, 1)
+            self._add(record, rss_end)
+
+    def _add(self, record: Span, rss: Optional[float]) -> None:
+        """Fold a finished span (and the process peak RSS at its end) into the per-name totals"""
+        with self._lock:
+            totals = self.spans.setdefault(record.name, {
+                "calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+                "rows": 0, "bytes_in": 0, "bytes_out": 0,
+                "process_peak_rss_mb": None, "peak_rss_growth_mb": None
+            })
+            totals["calls"] += 1
+            totals["wall_seconds"] += record.wall_seconds
+            totals["cpu_seconds"] += record.cpu_seconds
+            totals["rows"] += record.rows
+            totals["bytes_in"] += record.bytes_in
+            totals["bytes_out"] += record.bytes_out
+            if rss is not None:
+                totals["process_peak_rss_mb"] = max(totals["process_peak_rss_mb"] or 0.0, rss)
+                totals["peak_rss_growth_mb"] = max(totals["peak_rss_growth_mb"] or 0.0, record.rss_growth_mb)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-span totals with rounded times and rows/sec"""
+        with self._lock:
+            summary = {}
+            for name, totals in self.spans.items():
+                wall = totals["wall_seconds"]
+                summary[name] = {
+                    **totals,
+                    "wall_seconds": round(wall, 4),
+                    "cpu_seconds": round(totals["cpu_seconds"], 4),
+                    "rows_per_second": round(totals["rows"] / wall, 1) if wall > 0 and totals["rows"] else None
+                }
+            return summary
+
+    def write_report(self, output_file: Path = RUN_REPORT_FILE, extra: Optional[Dict] = None) -> Dict:
+        """
+        Write the machine-readable run report
+
+        Args:
+            output_file: JSON file to write
+            extra: Additional top-level fields (e.g. per-stage status)
+
+        Returns:
+            The report dictionary
+        """
+        summary = self.summary()
+        report = {
+            "started_at": self.started_at,
+            "finished_at": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": {name.split(":", 1)[1]: data for name, data in summary.items() if name.startswith("stage:")},
+            "functions": {name: data for name, data in summary.items() if not name.startswith("stage:")},
+            **(extra or {})
+        }
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+_recorder = RunRecorder()
+
+def get_recorder() -> RunRecorder:
+    """The process-wide recorder"""
+    return _recorder
+
+def reset_recorder() -> RunRecorder:
+    """Start a new process-wide recorder (e.g. at the beginning of a run)"""
+    global _recorder
+    _recorder = RunRecorder()
+    return _recorder
+
+def instrument(name: str,
+               rows: Optional[Callable] = None,
+               bytes_in: Optional[Callable] = None,
+               bytes_out: Optional[Callable] = None):
+    """
+    Decorator that records every call of a function as a span
+
+    The optional callables receive ``(result, arguments)`` of the call, where
+    ``arguments`` maps every parameter name to its value (defaults included),
+    and return the number of rows processed or bytes read / written.
+
+    Args:
+        name: Span name
+        rows: Rows processed by the call
+        bytes_in: Bytes read by the call
+        bytes_out: Bytes written by the call
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_recorder().span(name) as record:
+                result = func(*args, **kwargs)
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                if rows is not None:
+                    record.rows = rows(result, bound.arguments)
+                if bytes_in is not None:
+                    record.bytes_in = bytes_in(result, bound.arguments)
+                if bytes_out is not None:
+                    record.bytes_out = bytes_out(result, bound.arguments)
+            return result
+        return wrapper
+    return decorator
+
+def file_size(path: Path) -> int:
+    """Size of a file, or of every file below a directory, in bytes (0 if missing)"""
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
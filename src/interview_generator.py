@@ -8,9 +8,10 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
 import random
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from faker import Faker
 from config import *
+from research_context import ResearchContext
 
 fake = Faker()
 np.random.seed(42)
@@ -21,14 +22,17 @@ class InterviewGenerator:
     Generates realistic user interview transcripts
     """
     
-    def __init__(self, num_interviews: int = NUM_INTERVIEWS):
+    def __init__(self, num_interviews: int = NUM_INTERVIEWS,
+                 context: Optional[ResearchContext] = None):
         """
         Initialize interview generator
         
         Args:
             num_interviews: Number of interviews to generate
+            context: Shared research context (a new one is created if omitted)
         """
         self.num_interviews = num_interviews
+        self.context = context or ResearchContext()
         self.interviews = []
         self.metadata = []
         
@@ -274,6 +278,7 @@ Interviewer Notes: {random.choice([
         # Save metadata
         metadata_df = pd.DataFrame(self.metadata)
         metadata_df.to_csv(RAW_DATA_DIR / "interview_metadata.csv", index=False)
+        self.context.set("metadata", metadata_df)
         
         print(f"✅ All interviews generated successfully!")
         print(f"📁 Transcripts: {INTERVIEW_DIR}")
@@ -0,0 +1,67 @@
+"""
+Journey Comparison Module
+Aligns any number of journey maps by stage key into one typed comparison table
+"""
+
+from typing import Dict, List, Sequence
+import pandas as pd
+from config import *
+
+# Fields compared for each journey state
+COMPARISON_FIELDS = {
+    "current_state": ["stage", "emotion", "pain", "duration"],
+    "future_state": ["stage", "emotion", "delight", "duration"]
+}
+# Fields stored as nullable floats; everything else is a nullable string
+NUMERIC_FIELDS = {"emotion_score"}
+
+def compare_journeys(journeys: Dict[str, List[Dict]],
+                     fields: Dict[str, Sequence[str]]) -> pd.DataFrame:
+    """
+    Align journeys by stage key in a single reshape
+
+    All stages of all journeys are stacked into one long frame and pivoted
+    on the journey label, which is an N-way outer join on ``stage_key``:
+    stages missing from a journey become <NA> instead of shifting rows.
+
+    Args:
+        journeys: Mapping of column prefix to a list of stage dictionaries
+        fields: Mapping of column prefix to the stage fields to include
+
+    Returns:
+        DataFrame indexed by stage key (in journey order) with one
+        "{prefix}_{field}" column per journey and field
+    """
+    records = [
+        {
+            "journey": label,
+            "stage_key": stage.get("stage_key", stage["stage"]),
+            "position": position,
+            **{field: stage.get(field) for field in fields[label]}
+        }
+        for label, stages in journeys.items()
+        for position, stage in enumerate(stages)
+    ]
+    long_df = pd.DataFrame.from_records(records)
+
+    # Stage keys keep the order in which they first appear along the journeys
+    key_order = long_df.sort_values("position", kind="stable")["stage_key"].unique()
+
+    value_columns = sorted({field for label in journeys for field in fields[label]})
+    wide_df = long_df.pivot(index="stage_key", columns="journey", values=value_columns)
+    wide_df.columns = [f"{journey}_{field}" for field, journey in wide_df.columns]
+
+    ordered_columns = [f"{label}_{field}" for label in journeys for field in fields[label]]
+    wide_df = wide_df.reindex(index=key_order, columns=ordered_columns)
+
+    # Build typed columns straight from the pivoted arrays (much cheaper than astype per column)
+    typed_columns = {
+        f"{label}_{field}": pd.array(
+            wide_df[f"{label}_{field}"].to_numpy(),
+            dtype="Float64" if field in NUMERIC_FIELDS else "string"
+        )
+        for label in journeys
+        for field in fields[label]
+    }
+    index = pd.CategoricalIndex(key_order, categories=key_order, ordered=True, name="stage_key")
+    return pd.DataFrame(typed_columns, index=index)
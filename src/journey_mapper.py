@@ -4,55 +4,202 @@ Creates current state and future state journey maps
 """
 
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from config import *
+from stage_tagger import StageTagger, emotion_curves, emotion_label, format_duration
+from persona_aggregates import normalize_interview_ids
+from journey_comparison import COMPARISON_FIELDS, compare_journeys
+from research_context import ResearchContext
+
+OVERALL_JOURNEY = "overall"
 
 class JourneyMapper:
     """
     Creates detailed journey maps for user experience
     """
     
-    def __init__(self):
-        """Initialize journey mapper"""
+    def __init__(self, context: Optional[ResearchContext] = None):
+        """
+        Initialize journey mapper
+        
+        Args:
+            context: Shared research context (a new one is created if omitted)
+        """
+        self.context = context or ResearchContext()
         self.journey_maps = {}
+        self.stage_index = {}
         
     def create_journey_maps(self) -> Dict:
         """
-        Create both current and future state journey maps
+        Create current and future state journey maps, overall and per persona/segment
+        
+        Observations are tagged in a single scan that indexes evidence for
+        every persona and segment at once, so adding groups does not add passes.
         
         Returns:
-            Dictionary with current and future state maps
+            Dictionary with current and future state maps, plus "personas" and
+            "segments" holding a current state map per group
         """
         print("🗺️ Creating journey maps...")
         
+        # Attach persona and segment attributes to every observation
+        observations_df = self.context.observations
+        metadata_df = self.context.metadata
+        group_columns = ["persona"] + JOURNEY_SEGMENT_COLUMNS
+        attributes = metadata_df.set_index('interview_id')[group_columns]
+        observations_df = observations_df.join(
+            attributes, on=normalize_interview_ids(observations_df['interview_id'])
+        )
+        
+        # Index interview evidence per stage and group in a single scan
+        tagger = StageTagger()
+        grouped_index = tagger.build_grouped_index(observations_df, group_columns)
+        self.stage_index = grouped_index["overall"]
+        persona_indexes = grouped_index["groups"]["persona"]
+        
         self.journey_maps = {
-            "current_state": self._create_detailed_current_state(),
-            "future_state": self._create_detailed_future_state()
+            "current_state": self._create_detailed_current_state(self.stage_index),
+            "future_state": self._create_detailed_future_state(),
+            "personas": {
+                persona: {"current_state": self._create_detailed_current_state(persona_indexes[persona])}
+                for persona in PERSONA_DEFINITIONS if persona in persona_indexes
+            },
+            "segments": {
+                column: {
+                    str(value): {"current_state": self._create_detailed_current_state(index)}
+                    for value, index in sorted(grouped_index["groups"][column].items(), key=lambda item: str(item[0]))
+                }
+                for column in JOURNEY_SEGMENT_COLUMNS
+            },
+            "emotion_curves": self._build_emotion_curves(
+                observations_df, grouped_index["stage_codes"], tagger.stages,
+                [persona for persona in PERSONA_DEFINITIONS if persona in persona_indexes]
+            )
         }
         
         # Save to file
         self._save_journey_maps()
         
-        print(f"✅ Created journey maps (Current + Future state)")
+        print(f"✅ Created journey maps (Current + Future state, "
+              f"{len(self.journey_maps['personas'])} personas, "
+              f"{sum(len(v) for v in self.journey_maps['segments'].values())} segments)")
         return self.journey_maps
     
-    def _create_detailed_current_state(self) -> List[Dict]:
-        """Create detailed current state journey with all touchpoints"""
+    def get_journey(self, persona: str = OVERALL_JOURNEY, state: str = "current_state") -> List[Dict]:
+        """
+        Get the stages of one journey
+        
+        Args:
+            persona: Persona name, "segment_column=value", or "overall"
+            state: "current_state" or "future_state"
+            
+        Returns:
+            List of stage dictionaries
+        """
+        if persona == OVERALL_JOURNEY:
+            return self.journey_maps[state]
+        
+        if persona in self.journey_maps["personas"]:
+            group = self.journey_maps["personas"][persona]
+        else:
+            column, _, value = persona.partition("=")
+            group = self.journey_maps["segments"].get(column, {}).get(value)
+            if group is None:
+                raise KeyError(f"No journey map for '{persona}'")
+        
+        # The future state describes the proposed product and is shared by every group
+        return group.get(state, self.journey_maps[state])
+    
+    def _build_emotion_curves(self, observations_df: pd.DataFrame,
+                              stage_codes: np.ndarray, stages: List[str],
+                              personas: List[str]) -> Dict:
+        """
+        Numeric emotion curve per stage, overall and per persona
+        
+        Args:
+            observations_df: Observations with sentiment and persona columns
+            stage_codes: Stage index per observation from the stage tagger
+            stages: Stage names in tagger order
+            personas: Personas to build a curve for
+            
+        Returns:
+            Dictionary with "stages", "stage_keys" and "series" holding
+            mean/variance/count arrays (one value per stage) for every curve
+        """
+        scores = observations_df['sentiment'].map(SENTIMENT_SCORES).fillna(0.0).to_numpy()
+        persona_codes = pd.Categorical(observations_df['persona'], categories=personas).codes
+        
+        curves = {
+            OVERALL_JOURNEY: emotion_curves(stage_codes, scores, np.zeros(len(scores), dtype=np.int64), len(stages), 1),
+            "personas": emotion_curves(stage_codes, scores, persona_codes, len(stages), len(personas))
+        }
+        names = [OVERALL_JOURNEY] + personas
+        rows = {
+            stat: np.vstack([curves[OVERALL_JOURNEY][stat], curves["personas"][stat]])
+            for stat in ("mean", "variance", "count")
+        }
+        
+        def compact(values: np.ndarray) -> List:
+            return [None if np.isnan(value) else round(float(value), 3) for value in values]
+        
+        stage_keys = {stage["stage"]: stage["stage_key"] for stage in JOURNEY_STAGES["current_state"]}
+        return {
+            "stages": stages,
+            "stage_keys": [stage_keys.get(stage, stage) for stage in stages],
+            "series": {
+                name: {
+                    "mean": compact(rows["mean"][i]),
+                    "variance": compact(rows["variance"][i]),
+                    "count": rows["count"][i].tolist()
+                }
+                for i, name in enumerate(names)
+            }
+        }
+    
+    def _create_detailed_current_state(self, stage_index: Dict[str, Dict]) -> List[Dict]:
+        """
+        Create detailed current state journey with all touchpoints
+        
+        Args:
+            stage_index: Evidence summary per stage from the stage tagger
+        """
         
         detailed_stages = []
         
         for stage_data in JOURNEY_STAGES["current_state"]:
-            # Enrich with additional details
+            stage = stage_data["stage"]
+            evidence = stage_index.get(stage, {})
+            has_evidence = evidence.get("observation_count", 0) >= JOURNEY_MIN_STAGE_EVIDENCE
+            
+            # Enrich with interview evidence, falling back to research defaults
             detailed_stage = {
                 **stage_data,
-                "duration": self._estimate_duration_current(stage_data["stage"]),
-                "channels": self._get_channels(stage_data["stage"], "current"),
-                "tools_used": self._get_tools_used(stage_data["stage"], "current"),
-                "stakeholders": self._get_stakeholders(stage_data["stage"]),
+                "duration": self._estimate_duration_current(stage),
+                "channels": evidence.get("channels") or self._get_channels(stage, "current"),
+                "tools_used": evidence.get("tools") or self._get_tools_used(stage, "current"),
+                "stakeholders": self._get_stakeholders(stage),
                 "opportunities": self._identify_opportunities(stage_data),
-                "quotes": self._get_stage_quotes(stage_data["stage"], "current")
+                "quotes": self._get_stage_quotes(stage, "current")
+            }
+            
+            if has_evidence:
+                detailed_stage["emotion"] = emotion_label(evidence["sentiment_score_mean"])
+                detailed_stage["emotion_score"] = evidence["sentiment_score_mean"]
+                detailed_stage["quotes"] = evidence["quotes"] or detailed_stage["quotes"]
+                if evidence["duration_minutes_median"] is not None:
+                    detailed_stage["duration"] = (
+                        f"{format_duration(evidence['duration_minutes_median'])} "
+                        f"(median of {evidence['duration_mentions']} mentions)"
+                    )
+            
+            detailed_stage["evidence"] = {
+                "observation_count": evidence.get("observation_count", 0),
+                "interview_count": evidence.get("interview_count", 0),
+                "sentiment_breakdown": evidence.get("sentiment_breakdown", {}),
+                "source": "interviews" if has_evidence else "research defaults"
             }
             
             detailed_stages.append(detailed_stage)
@@ -82,7 +229,7 @@ class JourneyMapper:
         return detailed_stages
     
     def _estimate_duration_current(self, stage: str) -> str:
-        """Estimate time spent in each current state stage"""
+        """Estimate time spent in each current state stage (default when interviews give no evidence)"""
         duration_map = {
             "Discovery": "1-2 days (research and comparison)",
             "Signup": "5 minutes",
@@ -106,7 +253,7 @@ class JourneyMapper:
         return duration_map.get(stage, "Unknown")
     
     def _get_channels(self, stage: str, state: str) -> List[str]:
-        """Get channels/touchpoints for stage"""
+        """Get channels/touchpoints for stage (default when interviews give no evidence)"""
         if state == "current":
             channel_map = {
                 "Discovery": ["YouTube", "Reddit", "Twitter/X", "Friend recommendation"],
@@ -129,7 +276,7 @@ class JourneyMapper:
         return channel_map.get(stage, [])
     
     def _get_tools_used(self, stage: str, state: str) -> List[str]:
-        """Get tools used at each stage"""
+        """Get tools used at each stage (default when interviews give no evidence)"""
         if state == "current":
             tools_map = {
                 "Discovery": ["Google Search", "YouTube", "ProductHunt"],
@@ -278,7 +425,7 @@ class JourneyMapper:
         return metrics_map.get(stage, [])
     
     def _get_stage_quotes(self, stage: str, state: str) -> List[str]:
-        """Get representative user quotes for each stage"""
+        """Get representative user quotes for each stage (default when interviews give no evidence)"""
         if state == "current":
             quotes_map = {
                 "Discovery": [
@@ -342,49 +489,50 @@ class JourneyMapper:
         
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(self.journey_maps, f, indent=2, ensure_ascii=False)
+        self.context.set("journey_maps", self.journey_maps)
         
         print(f"💾 Saved journey maps to: {output_file}")
     
-    def create_comparison_table(self) -> pd.DataFrame:
-        """Create side-by-side comparison table"""
+    def create_comparison_table(self, current_persona: str = OVERALL_JOURNEY,
+                                future_persona: str = OVERALL_JOURNEY) -> pd.DataFrame:
+        """
+        Create side-by-side comparison table
         
-        current = self.journey_maps["current_state"]
-        future = self.journey_maps["future_state"]
+        Args:
+            current_persona: Journey whose current state fills the left columns
+            future_persona: Journey whose future state fills the right columns
+            
+        Returns:
+            DataFrame with one row per stage key
+        """
         
-        comparison_data = []
+        journeys = {
+            "current": self.get_journey(current_persona, "current_state"),
+            "future": self.get_journey(future_persona, "future_state")
+        }
+        fields = {
+            "current": COMPARISON_FIELDS["current_state"],
+            "future": COMPARISON_FIELDS["future_state"]
+        }
         
-        # Align stages (some differ between current/future)
-        max_stages = max(len(current), len(future))
+        # Stages are aligned by stage key; stages missing on one side show as "-"
+        comparison_df = compare_journeys(journeys, fields).fillna("-")
+        return comparison_df.reset_index(drop=True)
+    
+    def compare_personas(self, personas: List[str], state: str = "current_state") -> pd.DataFrame:
+        """
+        N-way comparison of one journey state across personas or segments
         
-        for i in range(max_stages):
-            row = {}
-            
-            if i < len(current):
-                row["current_stage"] = current[i]["stage"]
-                row["current_emotion"] = current[i]["emotion"]
-                row["current_pain"] = current[i]["pain"]
-                row["current_duration"] = current[i]["duration"]
-            else:
-                row["current_stage"] = "-"
-                row["current_emotion"] = "-"
-                row["current_pain"] = "-"
-                row["current_duration"] = "-"
-            
-            if i < len(future):
-                row["future_stage"] = future[i]["stage"]
-                row["future_emotion"] = future[i]["emotion"]
-                row["future_delight"] = future[i]["delight"]
-                row["future_duration"] = future[i]["duration"]
-            else:
-                row["future_stage"] = "-"
-                row["future_emotion"] = "-"
-                row["future_delight"] = "-"
-                row["future_duration"] = "-"
+        Args:
+            personas: Journey names accepted by get_journey
+            state: "current_state" or "future_state"
             
-            comparison_data.append(row)
-        
-        comparison_df = pd.DataFrame(comparison_data)
-        return comparison_df
+        Returns:
+            Typed DataFrame indexed by stage key with one column group per journey
+        """
+        fields = COMPARISON_FIELDS[state] + (["emotion_score"] if state == "current_state" else [])
+        journeys = {persona: self.get_journey(persona, state) for persona in personas}
+        return compare_journeys(journeys, {persona: fields for persona in personas})
 
 if __name__ == "__main__":
     print("="*60)
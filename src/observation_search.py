@@ -0,0 +1,257 @@
+"""
+Observation Search Module
+BM25-ranked search over affinity observations with theme, sentiment and persona filters
+"""
+
+import heapq
+import math
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from config import *
+from persona_aggregates import normalize_interview_ids
+from transcript_index import TOKEN_PATTERN, tokenize
+
+FACETS = ["interview_id", "theme", "sentiment", "persona"]
+UNKNOWN_PERSONA = "Unknown"
+
+class ObservationSearch:
+    """
+    Incremental BM25 index over observation sentences
+
+    Every observation is a document. Each term keeps a sparse postings list
+    of (document, term frequency) pairs that only grows when observations are
+    added, and every document keeps its length and its facet codes (interview,
+    theme, sentiment, persona). A query touches only the postings of its own
+    terms, and the top K documents are picked with a heap.
+    """
+
+    def __init__(self, k1: float = OBSERVATION_SEARCH_K1, b: float = OBSERVATION_SEARCH_B):
+        """
+        Initialize an empty index
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.texts: List[str] = []
+        self.lengths = array('i')
+        self.total_length = 0
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.labels: Dict[str, List[str]] = {facet: [] for facet in FACETS}
+        self.codes: Dict[str, array] = {facet: array('i') for facet in FACETS}
+        self._label_codes: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+
+    @property
+    def document_count(self) -> int:
+        """Number of indexed observations"""
+        return len(self.texts)
+
+    def _code(self, facet: str, label: str) -> int:
+        """Code of a facet label, registering new labels"""
+        codes = self._label_codes[facet]
+        if label not in codes:
+            codes[label] = len(self.labels[facet])
+            self.labels[facet].append(label)
+        return codes[label]
+
+    def add(self, observations: Iterable[Dict], personas: Optional[Dict[str, str]] = None) -> None:
+        """
+        Index a batch of observations
+
+        Args:
+            observations: Observation dictionaries with text, interview_id,
+                theme and sentiment (e.g. one interview from affinity mapping)
+            personas: Mapping of metadata interview id ("INT_001") to persona
+        """
+        observations = list(observations)
+        if not observations:
+            return
+        interview_ids = normalize_interview_ids(pd.Series([obs["interview_id"] for obs in observations]))
+
+        for obs, metadata_id in zip(observations, interview_ids):
+            document = len(self.texts)
+            tokens = tokenize(obs["text"])
+            for term, frequency in Counter(tokens).items():
+                documents, frequencies = self.postings.setdefault(term, (array('i'), array('i')))
+                documents.append(document)
+                frequencies.append(frequency)
+
+            self.texts.append(obs["text"])
+            self.lengths.append(len(tokens))
+            self.total_length += len(tokens)
+            self.codes["interview_id"].append(self._code("interview_id", obs["interview_id"]))
+            self.codes["theme"].append(self._code("theme", obs["theme"]))
+            self.codes["sentiment"].append(self._code("sentiment", obs["sentiment"]))
+            self.codes["persona"].append(self._code("persona", (personas or {}).get(metadata_id, UNKNOWN_PERSONA)))
+
+    @classmethod
+    def from_dataframe(cls, observations_df: pd.DataFrame, metadata_df: Optional[pd.DataFrame] = None) -> "ObservationSearch":
+        """
+        Build an index from observation and metadata tables
+
+        Args:
+            observations_df: Affinity observations
+            metadata_df: Interview metadata (for the persona filter)
+
+        Returns:
+            ObservationSearch instance
+        """
+        index = cls()
+        personas = dict(zip(metadata_df['interview_id'], metadata_df['persona'])) if metadata_df is not None else None
+        index.add(observations_df[['text', 'interview_id', 'theme', 'sentiment']].to_dict('records'), personas)
+        return index
+
+    def search(self, query: str, k: int = OBSERVATION_SEARCH_TOP_K,
+               themes: Optional[List[str]] = None,
+               sentiments: Optional[List[str]] = None,
+               personas: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Top-K observations for a query by BM25 score
+
+        Args:
+            query: Free-text query
+            k: Number of results
+            themes: Only observations with one of these themes
+            sentiments: Only observations with one of these sentiments
+            personas: Only observations from interviews with one of these personas
+
+        Returns:
+            List of result dictionaries (row, score, text, snippet and facets), best first
+        """
+        terms = [term for term in dict.fromkeys(tokenize(query)) if term in self.postings]
+        if not terms or k <= 0:
+            return []
+
+        n = self.document_count
+        average_length = self.total_length / n
+        lengths = np.frombuffer(self.lengths, dtype=np.int32)
+
+        # Per-term contributions, summed per document over the touched postings only
+        documents, contributions = [], []
+        for term in terms:
+            term_documents = np.frombuffer(self.postings[term][0], dtype=np.int32)
+            frequencies = np.frombuffer(self.postings[term][1], dtype=np.int32)
+            df = len(term_documents)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * lengths[term_documents] / average_length)
+            documents.append(term_documents)
+            contributions.append(idf * frequencies * (self.k1 + 1) / (frequencies + norm))
+        candidates, inverse = np.unique(np.concatenate(documents), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(contributions))
+
+        keep = np.ones(len(candidates), dtype=bool)
+        for facet, wanted in [("theme", themes), ("sentiment", sentiments), ("persona", personas)]:
+            if wanted:
+                codes = [self._label_codes[facet][label] for label in wanted if label in self._label_codes[facet]]
+                keep &= np.isin(np.frombuffer(self.codes[facet], dtype=np.int32)[candidates], codes)
+        candidates, scores = candidates[keep], scores[keep]
+
+        if len(scores) > k:
+            # Shortlist everything tied with or above the K-th score, then heap-select
+            threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+            shortlist = scores >= threshold
+            candidates, scores = candidates[shortlist], scores[shortlist]
+        top = heapq.nlargest(k, zip(scores.tolist(), (-candidates).tolist()))
+
+        return [self._result(-negative_row, score, terms) for score, negative_row in top]
+
+    def _result(self, row: int, score: float, terms: List[str]) -> Dict:
+        """Result dictionary for one document"""
+        result = {"row": row, "score": round(score, 4), "text": self.texts[row],
+                  "snippet": highlight(self.texts[row], terms)}
+        for facet in FACETS:
+            result[facet] = self.labels[facet][self.codes[facet][row]]
+        return result
+
+    def save(self, output_file: Path = OBSERVATION_SEARCH_FILE) -> Path:
+        """
+        Persist the index as an uncompressed .npz archive
+
+        Postings are stored as one sorted vocabulary with offsets into
+        concatenated document and frequency arrays; texts as UTF-8 bytes
+        with offsets.
+
+        Args:
+            output_file: Index file
+
+        Returns:
+            The index file path
+        """
+        vocabulary = sorted(self.postings)
+        sizes = [len(self.postings[term][0]) for term in vocabulary]
+        encoded = [text.encode('utf-8') for text in self.texts]
+        arrays = {
+            "vocabulary": np.array(vocabulary, dtype=str),
+            "term_offsets": np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)]),
+            "posting_documents": np.concatenate([np.frombuffer(self.postings[term][0], dtype=np.int32)
+                                                 for term in vocabulary] or [np.zeros(0, dtype=np.int32)]),
+            "posting_frequencies": np.concatenate([np.frombuffer(self.postings[term][1], dtype=np.int32)
+                                                   for term in vocabulary] or [np.zeros(0, dtype=np.int32)]),
+            "lengths": np.frombuffer(self.lengths, dtype=np.int32),
+            "text_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "text_offsets": np.concatenate([[0], np.cumsum([len(text) for text in encoded], dtype=np.int64)]),
+            "parameters": np.array([self.k1, self.b])
+        }
+        for facet in FACETS:
+            arrays[f"{facet}_labels"] = np.array(self.labels[facet], dtype=str)
+            arrays[f"{facet}_codes"] = np.frombuffer(self.codes[facet], dtype=np.int32)
+
+        with open(output_file, 'wb') as f:
+            np.savez(f, **arrays)
+        return Path(output_file)
+
+    @classmethod
+    def load(cls, index_file: Path = OBSERVATION_SEARCH_FILE) -> "ObservationSearch":
+        """
+        Load a saved index (more observations can still be added)
+
+        Args:
+            index_file: Index file written by save
+
+        Returns:
+            ObservationSearch instance
+        """
+        with np.load(index_file, allow_pickle=False) as data:
+            k1, b = data["parameters"].tolist()
+            index = cls(k1=k1, b=b)
+
+            offsets = data["term_offsets"].tolist()
+            documents, frequencies = data["posting_documents"], data["posting_frequencies"]
+            for i, term in enumerate(data["vocabulary"].tolist()):
+                index.postings[term] = (array('i', documents[offsets[i]:offsets[i + 1]].tobytes()),
+                                        array('i', frequencies[offsets[i]:offsets[i + 1]].tobytes()))
+
+            index.lengths = array('i', data["lengths"].tobytes())
+            index.total_length = int(data["lengths"].sum())
+            text_bytes, text_offsets = data["text_bytes"].tobytes(), data["text_offsets"].tolist()
+            index.texts = [text_bytes[start:end].decode('utf-8') for start, end in zip(text_offsets, text_offsets[1:])]
+
+            for facet in FACETS:
+                index.labels[facet] = data[f"{facet}_labels"].tolist()
+                index.codes[facet] = array('i', data[f"{facet}_codes"].tobytes())
+                index._label_codes[facet] = {label: code for code, label in enumerate(index.labels[facet])}
+        return index
+
+def highlight(text: str, terms: Iterable[str], marker: str = "**") -> str:
+    """
+    Wrap the words of a text that match query terms in a Markdown marker
+
+    Args:
+        text: Observation text
+        terms: Lowercased query terms
+        marker: Marker placed on both sides of a match
+
+    Returns:
+        Highlighted text
+    """
+    terms = set(terms)
+    return TOKEN_PATTERN.sub(
+        lambda match: f"{marker}{match.group(0)}{marker}" if match.group(0).lower() in terms else match.group(0),
+        text
+    )
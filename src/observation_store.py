@@ -0,0 +1,303 @@
+"""
+Observation Store Module
+Columnar observation table with bitmap facet indexes for server-side filtering and paging
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from config import *
+from instrumentation import file_size, instrument
+from persona_aggregates import normalize_interview_ids
+
+BITMAP_FACETS = ["theme", "sentiment", "persona"]  # Low-cardinality facets with one bitmap per value
+COLUMNS = ["interview_id", "theme", "sentiment", "persona"]  # Categorical columns (code + labels)
+UNKNOWN_PERSONA = "Unknown"
+NO_DATE = np.iinfo(np.int32).min  # Day number of observations whose interview has no date
+
+# Set bits per byte value, for counting matches in packed bitmaps
+POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.int64)
+
+class ObservationStore:
+    """
+    Read-only, columnar observation table for the observation explorer
+
+    Every categorical column is stored as int32 codes plus its labels, the
+    interview date as a day number, and the texts as one UTF-8 buffer with
+    offsets, so a page of results decodes only its own rows. Each value of a
+    low-cardinality facet (theme, sentiment, persona) has a packed bitmap of
+    its rows: a filter is a few bitwise ORs and ANDs over n / 8 bytes, match
+    counts are popcounts, and a page is found by ranking set bits without
+    unpacking the whole result.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Initialize from store arrays and build the facet bitmaps
+
+        Args:
+            arrays: Store arrays (see from_dataframe and save)
+        """
+        self.labels: Dict[str, List[str]] = {column: arrays[f"{column}_labels"].tolist() for column in COLUMNS}
+        self.codes: Dict[str, np.ndarray] = {column: arrays[f"{column}_codes"] for column in COLUMNS}
+        self.days = arrays["days"]
+        self.text_bytes = arrays["text_bytes"]
+        self.text_offsets = arrays["text_offsets"]
+        self.row_count = len(self.days)
+        self._all_rows = np.packbits(np.ones(self.row_count, dtype=bool))
+        self.bitmaps: Dict[str, np.ndarray] = {
+            facet: np.array([np.packbits(self.codes[facet] == code) for code in range(len(self.labels[facet]))],
+                            dtype=np.uint8).reshape(len(self.labels[facet]), len(self._all_rows))
+            for facet in BITMAP_FACETS
+        }
+        self._interview_index: Optional[pd.Index] = None
+        self._folded_text: Optional[bytes] = None
+
+    @classmethod
+    @instrument("observation_store.build", rows=lambda result, arguments: result.row_count)
+    def from_dataframe(cls, observations_df: pd.DataFrame, metadata_df: pd.DataFrame) -> "ObservationStore":
+        """
+        Build a store from observation and metadata tables
+
+        Args:
+            observations_df: Affinity observations with text, interview_id, theme and sentiment
+            metadata_df: Interview metadata (persona and date of each interview)
+
+        Returns:
+            ObservationStore instance
+        """
+        # Interview ids are normalized once per distinct interview, not once per observation
+        interview_codes, interview_labels = pd.factorize(observations_df['interview_id'].astype(str))
+        metadata = metadata_df.drop_duplicates('interview_id').set_index('interview_id')
+        metadata_ids = pd.Index(normalize_interview_ids(pd.Series(interview_labels)))
+        personas = metadata['persona'].reindex(metadata_ids).fillna(UNKNOWN_PERSONA).to_numpy()
+        days = pd.to_datetime(metadata['date'].reindex(metadata_ids)).to_numpy().astype('datetime64[D]')
+        days = np.where(np.isnat(days), NO_DATE, days.astype(np.int64)).astype(np.int32)
+        persona_codes, persona_labels = pd.factorize(personas)
+
+        arrays = {
+            "interview_id_codes": interview_codes.astype(np.int32),
+            "interview_id_labels": np.array(interview_labels, dtype=str),
+            "persona_codes": persona_codes[interview_codes].astype(np.int32),
+            "persona_labels": np.array(persona_labels, dtype=str),
+            "days": days[interview_codes]
+        }
+        for column in ["theme", "sentiment"]:
+            codes, labels = pd.factorize(observations_df[column].astype(str))
+            arrays[f"{column}_codes"] = codes.astype(np.int32)
+            arrays[f"{column}_labels"] = np.array(labels, dtype=str)
+
+        encoded = [text.encode('utf-8') for text in observations_df['text'].astype(str)]
+        arrays["text_bytes"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        arrays["text_offsets"] = np.concatenate([[0], np.cumsum([len(text) for text in encoded], dtype=np.int64)])
+        return cls(arrays)
+
+    @instrument("observation_store.save", bytes_out=lambda result, arguments: file_size(result))
+    def save(self, output_file: Path = OBSERVATION_STORE_FILE) -> Path:
+        """
+        Persist the store as an uncompressed .npz archive (bitmaps are rebuilt on load)
+
+        Args:
+            output_file: Store file
+
+        Returns:
+            The store file path
+        """
+        arrays = {"days": self.days, "text_bytes": self.text_bytes, "text_offsets": self.text_offsets}
+        for column in COLUMNS:
+            arrays[f"{column}_codes"] = self.codes[column]
+            arrays[f"{column}_labels"] = np.array(self.labels[column], dtype=str)
+        with open(output_file, 'wb') as f:
+            np.savez(f, **arrays)
+        return Path(output_file)
+
+    @classmethod
+    def load(cls, store_file: Path = OBSERVATION_STORE_FILE) -> "ObservationStore":
+        """
+        Load a saved store
+
+        Args:
+            store_file: Store file written by save
+
+        Returns:
+            ObservationStore instance
+        """
+        with np.load(store_file, allow_pickle=False) as arrays:
+            return cls({name: arrays[name] for name in arrays.files})
+
+    @property
+    def date_range(self) -> Optional[tuple]:
+        """Earliest and latest interview dates (datetime64[D]), or None without dates"""
+        dated = self.days[self.days != NO_DATE]
+        if len(dated) == 0:
+            return None
+        return dated.min().astype('datetime64[D]'), dated.max().astype('datetime64[D]')
+
+    def _facet_mask(self, facet: str, values: List[str]) -> np.ndarray:
+        """Packed rows having any of the values of a bitmap facet"""
+        values = set(values)
+        codes = [code for code, label in enumerate(self.labels[facet]) if label in values]
+        if not codes:
+            return np.zeros_like(self._all_rows)
+        return np.bitwise_or.reduce(self.bitmaps[facet][codes], axis=0)
+
+    def _text_mask(self, keyword: str) -> np.ndarray:
+        """
+        Packed rows whose text contains a keyword (case-insensitive for ASCII letters)
+
+        The texts are searched as one buffer, so the scan runs in C and jumps
+        to the next row after every match.
+        """
+        if self._folded_text is None:
+            # bytes.lower only folds ASCII, so row offsets stay valid
+            self._folded_text = self.text_bytes.tobytes().lower()
+        needle = keyword.encode('utf-8').lower()
+        hits = np.zeros(self.row_count, dtype=bool)
+        position = self._folded_text.find(needle)
+        while position != -1:
+            row = int(np.searchsorted(self.text_offsets, position, side='right')) - 1
+            row_end = int(self.text_offsets[row + 1])
+            if position + len(needle) <= row_end:
+                hits[row] = True
+                position = self._folded_text.find(needle, row_end)
+            else:  # The match runs into the next row's text
+                position = self._folded_text.find(needle, position + 1)
+        return np.packbits(hits)
+
+    def filter(self, themes: Optional[List[str]] = None,
+               sentiments: Optional[List[str]] = None,
+               personas: Optional[List[str]] = None,
+               interviews: Optional[List[str]] = None,
+               date_from=None, date_to=None,
+               keyword: Optional[str] = None) -> np.ndarray:
+        """
+        Rows matching every given filter (values within one filter are alternatives)
+
+        Args:
+            themes: Theme labels
+            sentiments: Sentiment labels
+            personas: Persona names
+            interviews: Interview ids as in the observations (e.g. "interview_01")
+            date_from: First interview date (inclusive, date-like)
+            date_to: Last interview date (inclusive, date-like)
+            keyword: Text the observation must contain (case-insensitive)
+
+        Returns:
+            Packed bitmap of the matching rows
+        """
+        mask = self._all_rows
+        for facet, values in [("theme", themes), ("sentiment", sentiments), ("persona", personas)]:
+            if values:
+                mask = mask & self._facet_mask(facet, values)
+
+        # High-cardinality interviews and date ranges are compared on their columns
+        if interviews:
+            if self._interview_index is None:
+                self._interview_index = pd.Index(self.labels["interview_id"])
+            wanted = self._interview_index.get_indexer(list(interviews))
+            mask = mask & np.packbits(np.isin(self.codes["interview_id"], wanted[wanted >= 0]))
+        if date_from is not None or date_to is not None:
+            in_range = self.days != NO_DATE
+            if date_from is not None:
+                in_range &= self.days >= np.datetime64(date_from, 'D').astype(np.int64)
+            if date_to is not None:
+                in_range &= self.days <= np.datetime64(date_to, 'D').astype(np.int64)
+            mask = mask & np.packbits(in_range)
+        if keyword:
+            mask = mask & self._text_mask(keyword)
+        return mask
+
+    def count(self, mask: np.ndarray) -> int:
+        """Number of rows in a packed bitmap"""
+        return int(POPCOUNT[mask].sum())
+
+    def facet_counts(self, mask: np.ndarray) -> Dict[str, Dict[str, int]]:
+        """
+        Matching rows per value of every bitmap facet, most frequent first
+
+        Args:
+            mask: Packed bitmap from filter
+
+        Returns:
+            Dictionary of facet to {value: count} (values without matches omitted)
+        """
+        counts = {}
+        for facet in BITMAP_FACETS:
+            per_value = POPCOUNT[self.bitmaps[facet] & mask].sum(axis=1)
+            order = np.argsort(-per_value, kind='stable')
+            counts[facet] = {self.labels[facet][code]: int(per_value[code]) for code in order if per_value[code]}
+        return counts
+
+    def page_rows(self, mask: np.ndarray, page: int, page_size: int) -> np.ndarray:
+        """
+        Row numbers of one page of a packed bitmap, in table order
+
+        Only the bytes holding the page are unpacked: the page start is found
+        by a binary search over the running popcount.
+
+        Args:
+            mask: Packed bitmap from filter
+            page: One-based page number
+            page_size: Rows per page
+
+        Returns:
+            Array of row numbers
+        """
+        running = np.cumsum(POPCOUNT[mask])
+        first = (page - 1) * page_size
+        if len(running) == 0 or first >= running[-1]:
+            return np.zeros(0, dtype=np.int64)
+        start_byte = int(np.searchsorted(running, first, side='right'))
+        end_byte = int(np.searchsorted(running, first + page_size, side='left')) + 1
+        rows = start_byte * 8 + np.flatnonzero(np.unpackbits(mask[start_byte:end_byte]))
+        skip = first - (int(running[start_byte - 1]) if start_byte else 0)
+        return rows[skip:skip + page_size]
+
+    def rows(self, row_numbers: np.ndarray) -> List[Dict]:
+        """
+        Decode rows into dictionaries
+
+        Args:
+            row_numbers: Row numbers (e.g. from page_rows)
+
+        Returns:
+            List of dictionaries with interview_id, date, persona, theme, sentiment and text
+        """
+        records = []
+        for row in row_numbers.tolist():
+            day = int(self.days[row])
+            records.append({
+                "interview_id": self.labels["interview_id"][self.codes["interview_id"][row]],
+                "date": str(np.datetime64(day, 'D')) if day != NO_DATE else "",
+                "persona": self.labels["persona"][self.codes["persona"][row]],
+                "theme": self.labels["theme"][self.codes["theme"][row]],
+                "sentiment": self.labels["sentiment"][self.codes["sentiment"][row]],
+                "text": self.text_bytes[self.text_offsets[row]:self.text_offsets[row + 1]].tobytes().decode('utf-8')
+            })
+        return records
+
+    def query(self, page: int = 1, page_size: int = OBSERVATION_EXPLORER_PAGE_SIZE, **filters) -> Dict:
+        """
+        Filter, count and page observations in one call
+
+        Args:
+            page: One-based page number (clamped to the last page)
+            page_size: Rows per page
+            **filters: Filters accepted by filter
+
+        Returns:
+            Dictionary with total, page, pages, rows (one page of row
+            dictionaries) and facet_counts
+        """
+        mask = self.filter(**filters)
+        total = self.count(mask)
+        pages = max(1, -(-total // page_size))
+        page = min(max(1, page), pages)
+        return {
+            "total": total,
+            "page": page,
+            "pages": pages,
+            "rows": self.rows(self.page_rows(mask, page, page_size)),
+            "facet_counts": self.facet_counts(mask)
+        }
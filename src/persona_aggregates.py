@@ -0,0 +1,272 @@
+"""
+Persona Aggregates Module
+Mergeable running statistics that let persona builds fold in new interview batches
+"""
+
+import heapq
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from config import *
+
+def normalize_interview_ids(interview_ids: pd.Series) -> pd.Series:
+    """
+    Map transcript ids ("interview_01") to metadata ids ("INT_001")
+
+    Args:
+        interview_ids: Series of transcript-style interview ids
+
+    Returns:
+        Series of metadata-style interview ids
+    """
+    numbers = interview_ids.str.split('_').str[1].astype(int)
+    return "INT_" + numbers.astype(str).str.zfill(3)
+
+def _reject_folded(interview_ids) -> None:
+    """Refuse interviews that are already part of the aggregates (folding them again would double count them)"""
+    if interview_ids:
+        raise ValueError(f"Interviews already folded into the persona aggregates: {sorted(interview_ids)}")
+
+class PersonaAggregate:
+    """
+    Running sufficient statistics for a single persona
+
+    Every field is a sum, a count, a bounded heap or a per-interview row, so
+    two aggregates built from disjoint interview batches merge into exactly
+    the aggregate a full rebuild would produce.
+    """
+
+    def __init__(self, name: str, quote_top_k: int = PERSONA_QUOTE_TOP_K):
+        """
+        Initialize an empty aggregate
+
+        Args:
+            name: Persona name
+            quote_top_k: Number of representative quotes to retain
+        """
+        self.name = name
+        self.quote_top_k = quote_top_k
+        self.interview_count = 0
+        self.age_sum = 0
+        self.age_sum_sq = 0
+        self.tools_abandoned_sum = 0
+        self.tools_abandoned_sum_sq = 0
+        self.observation_count = 0
+        self.theme_counts = Counter()
+        # Min-heap of (is_negative, length, text); the root is the weakest quote
+        self.quote_heap: List[Tuple[int, int, str]] = []
+        # Per-interview [age, tools_abandoned, {theme: mentions}] rows for bootstrapping
+        self.interview_samples: Dict[str, list] = {}
+
+    def add_interviews(self, metadata: pd.DataFrame) -> None:
+        """Fold interview metadata rows for this persona into the aggregate"""
+        ages = metadata['age'].astype(int)
+        tools = metadata['tools_abandoned'].astype(int)
+
+        self.interview_count += len(metadata)
+        self.age_sum += int(ages.sum())
+        self.age_sum_sq += int((ages ** 2).sum())
+        self.tools_abandoned_sum += int(tools.sum())
+        self.tools_abandoned_sum_sq += int((tools ** 2).sum())
+
+        for interview_id, age, tools_abandoned in zip(metadata['interview_id'], ages.tolist(), tools.tolist()):
+            sample = self.interview_samples.setdefault(interview_id, [0, 0, {}])
+            sample[0], sample[1] = age, tools_abandoned
+
+    def add_observations(self, observations: pd.DataFrame) -> None:
+        """Fold observation rows for this persona into the aggregate"""
+        self.observation_count += len(observations)
+        self.theme_counts.update(observations['theme'].value_counts().to_dict())
+
+        texts = observations['text'].astype(str)
+        candidates = zip(
+            (observations['sentiment'] == 'negative').astype(int).tolist(),
+            texts.str.len().tolist(),
+            texts.tolist()
+        )
+        self._push_quotes(candidates)
+
+        mentions = observations.groupby(
+            [normalize_interview_ids(observations['interview_id']), observations['theme']]
+        ).size()
+        for (interview_id, theme), count in mentions.items():
+            themes = self.interview_samples.setdefault(interview_id, [0, 0, {}])[2]
+            themes[theme] = themes.get(theme, 0) + int(count)
+
+    def _push_quotes(self, candidates) -> None:
+        """Keep only the top-K distinct quotes across the heap and new candidates"""
+        self.quote_heap = heapq.nlargest(self.quote_top_k, set(self.quote_heap).union(candidates))
+        heapq.heapify(self.quote_heap)
+
+    def merge(self, other: "PersonaAggregate") -> "PersonaAggregate":
+        """
+        Merge another aggregate (built from a disjoint batch) into this one
+
+        Args:
+            other: Aggregate for the same persona; interviews present in both
+                raise ValueError (their sums would be counted twice)
+
+        Returns:
+            This aggregate, updated in place
+        """
+        _reject_folded(self.interview_samples.keys() & other.interview_samples.keys())
+        self.interview_count += other.interview_count
+        self.age_sum += other.age_sum
+        self.age_sum_sq += other.age_sum_sq
+        self.tools_abandoned_sum += other.tools_abandoned_sum
+        self.tools_abandoned_sum_sq += other.tools_abandoned_sum_sq
+        self.observation_count += other.observation_count
+        self.theme_counts.update(other.theme_counts)
+        self._push_quotes(other.quote_heap)
+        for interview_id, (age, tools_abandoned, themes) in other.interview_samples.items():
+            sample = self.interview_samples.setdefault(interview_id, [age, tools_abandoned, {}])
+            sample[2] = dict(Counter(sample[2]) + Counter(themes))
+        return self
+
+    @property
+    def mean_age(self) -> float:
+        """Average participant age"""
+        return self.age_sum / self.interview_count if self.interview_count else 0.0
+
+    @property
+    def mean_tools_abandoned(self) -> float:
+        """Average number of tools abandoned"""
+        return self.tools_abandoned_sum / self.interview_count if self.interview_count else 0.0
+
+    @property
+    def std_tools_abandoned(self) -> float:
+        """Sample standard deviation of tools abandoned"""
+        n = self.interview_count
+        if n < 2:
+            return 0.0
+        variance = (self.tools_abandoned_sum_sq - self.tools_abandoned_sum ** 2 / n) / (n - 1)
+        return max(variance, 0.0) ** 0.5
+
+    def top_themes(self, n: int = 3) -> List[Tuple[str, int]]:
+        """Most mentioned themes, ties broken alphabetically"""
+        ranked = sorted(self.theme_counts.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:n]
+
+    def top_quotes(self) -> List[str]:
+        """Representative quotes, negative and longest first"""
+        return [text for _, _, text in sorted(self.quote_heap, reverse=True)]
+
+    def sample_matrix(self, themes: List[str]) -> np.ndarray:
+        """
+        Per-interview metric rows, ordered by interview id
+
+        Args:
+            themes: Themes whose per-interview mention counts become columns
+
+        Returns:
+            Array of shape (interviews, 2 + len(themes)): age, tools abandoned, mentions
+        """
+        rows = [
+            [age, tools_abandoned] + [mentions.get(theme, 0) for theme in themes]
+            for _, (age, tools_abandoned, mentions) in sorted(self.interview_samples.items())
+        ]
+        return np.array(rows, dtype=float).reshape(len(rows), 2 + len(themes))
+
+    def to_dict(self) -> Dict:
+        """Serialize aggregate state"""
+        return {
+            "name": self.name,
+            "quote_top_k": self.quote_top_k,
+            "interview_count": self.interview_count,
+            "age_sum": self.age_sum,
+            "age_sum_sq": self.age_sum_sq,
+            "tools_abandoned_sum": self.tools_abandoned_sum,
+            "tools_abandoned_sum_sq": self.tools_abandoned_sum_sq,
+            "observation_count": self.observation_count,
+            "theme_counts": dict(self.theme_counts),
+            "quote_heap": [list(entry) for entry in self.quote_heap],
+            "interview_samples": self.interview_samples
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PersonaAggregate":
+        """Restore aggregate state"""
+        aggregate = cls(data["name"], data.get("quote_top_k", PERSONA_QUOTE_TOP_K))
+        aggregate.interview_count = data["interview_count"]
+        aggregate.age_sum = data["age_sum"]
+        aggregate.age_sum_sq = data["age_sum_sq"]
+        aggregate.tools_abandoned_sum = data["tools_abandoned_sum"]
+        aggregate.tools_abandoned_sum_sq = data["tools_abandoned_sum_sq"]
+        aggregate.observation_count = data["observation_count"]
+        aggregate.theme_counts = Counter(data["theme_counts"])
+        aggregate.quote_heap = [tuple(entry) for entry in data["quote_heap"]]
+        heapq.heapify(aggregate.quote_heap)
+        aggregate.interview_samples = data.get("interview_samples", {})
+        return aggregate
+
+class PersonaAggregateStore:
+    """
+    Collection of per-persona aggregates persisted next to personas.json
+    """
+
+    def __init__(self):
+        """Initialize an empty store"""
+        self.aggregates: Dict[str, PersonaAggregate] = {}
+
+    def get(self, persona_name: str) -> PersonaAggregate:
+        """Get (or create) the aggregate for a persona"""
+        if persona_name not in self.aggregates:
+            self.aggregates[persona_name] = PersonaAggregate(persona_name)
+        return self.aggregates[persona_name]
+
+    @property
+    def interview_ids(self) -> set:
+        """Ids of every interview folded into the store"""
+        return {interview_id for aggregate in self.aggregates.values() for interview_id in aggregate.interview_samples}
+
+    def fold(self, metadata_df: pd.DataFrame, observations_df: pd.DataFrame) -> None:
+        """
+        Fold a batch of interviews into the store
+
+        The batch must contain the metadata rows for every interview whose
+        observations it includes. Interviews already folded (or repeated within
+        the batch) raise ValueError before anything is changed.
+
+        Args:
+            metadata_df: Interview metadata for the batch
+            observations_df: Affinity observations for the batch
+        """
+        batch_ids = metadata_df['interview_id']
+        _reject_folded(set(batch_ids[batch_ids.duplicated()]) | (self.interview_ids & set(batch_ids)))
+
+        persona_by_id = metadata_df.set_index('interview_id')['persona']
+        observation_personas = normalize_interview_ids(observations_df['interview_id']).map(persona_by_id)
+
+        for persona_name, persona_metadata in metadata_df.groupby('persona', sort=False):
+            self.get(persona_name).add_interviews(persona_metadata)
+
+        for persona_name, persona_observations in observations_df.groupby(observation_personas, sort=False):
+            self.get(persona_name).add_observations(persona_observations)
+
+    def merge(self, other: "PersonaAggregateStore") -> "PersonaAggregateStore":
+        """Merge another store (built from a disjoint batch) into this one; shared interviews raise ValueError"""
+        _reject_folded(self.interview_ids & other.interview_ids)
+        for name, aggregate in other.aggregates.items():
+            self.get(name).merge(aggregate)
+        return self
+
+    def save(self, output_file: Path = PROCESSED_DATA_DIR / "persona_aggregates.json") -> None:
+        """Persist aggregate state"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(
+                {name: aggregate.to_dict() for name, aggregate in self.aggregates.items()},
+                f, indent=2, ensure_ascii=False
+            )
+
+    @classmethod
+    def load(cls, input_file: Path = PROCESSED_DATA_DIR / "persona_aggregates.json") -> "PersonaAggregateStore":
+        """Load aggregate state, or an empty store if none has been saved"""
+        store = cls()
+        if input_file.exists():
+            with open(input_file, 'r', encoding='utf-8') as f:
+                for name, data in json.load(f).items():
+                    store.aggregates[name] = PersonaAggregate.from_dict(data)
+        return store
@@ -0,0 +1,82 @@
+"""
+Persona Registry Module
+Immutable, data-driven persona profile content keyed by persona name
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+from config import *
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+class PersonaRegistry:
+    """
+    Read-only lookup of persona profile content (education, values, needs, ...)
+
+    Profiles are loaded once from a JSON data file. Adding a persona only
+    requires a new entry in that file; an entry may carry its own
+    ``definition`` block (age_range, occupation, behavior, pain) when the
+    persona is not part of ``PERSONA_DEFINITIONS``.
+    """
+
+    def __init__(self, data: Dict):
+        """
+        Initialize registry from parsed profile data
+
+        Args:
+            data: Dictionary with optional "defaults" and a "personas" mapping
+        """
+        defaults = data.get("defaults", {})
+
+        self._profiles = MappingProxyType({
+            name: _freeze({**defaults, **profile})
+            for name, profile in data["personas"].items()
+        })
+
+        definitions = dict(PERSONA_DEFINITIONS)
+        for name, profile in data["personas"].items():
+            if "definition" in profile:
+                definitions[name] = profile["definition"]
+        self._definitions = _freeze(definitions)
+
+    @classmethod
+    def from_file(cls, profiles_file: Path = PERSONA_PROFILES_FILE) -> "PersonaRegistry":
+        """Load registry from a JSON profiles file"""
+        with open(profiles_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def definitions(self) -> Mapping[str, Mapping]:
+        """Base definitions for every persona that can be built"""
+        return self._definitions
+
+    def profile(self, persona_name: str) -> Mapping[str, Any]:
+        """
+        Get the profile for a persona
+
+        Args:
+            persona_name: Persona name
+
+        Returns:
+            Read-only profile mapping
+        """
+        if persona_name not in self._profiles:
+            raise KeyError(f"No profile for persona '{persona_name}' in {PERSONA_PROFILES_FILE.name}")
+        return self._profiles[persona_name]
+
+    def __contains__(self, persona_name: str) -> bool:
+        return persona_name in self._profiles
+
+@lru_cache(maxsize=None)
+def get_persona_registry(profiles_file: Path = PERSONA_PROFILES_FILE) -> PersonaRegistry:
+    """Shared registry instance, parsed once per process"""
+    return PersonaRegistry.from_file(profiles_file)
@@ -0,0 +1,386 @@
+"""
+Pipeline Module
+Declarative research stage DAG with content-hash caching and concurrent stages
+"""
+
+import ast
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+import config
+from config import *
+from research_context import ResearchContext
+from instrumentation import RUN_REPORT_FILE, file_size, get_recorder, reset_recorder
+
+SRC_DIR = Path(__file__).parent
+PIPELINE_MANIFEST_FILE = PROCESSED_DATA_DIR / "pipeline_manifest.json"
+
+CONFIG_NAME_PATTERN = re.compile(r"\b[A-Z][A-Z0-9_]+\b")
+
+def hash_paths(paths: Sequence[Path]) -> str:
+    """
+    Content hash of files and directories (directories hash every file below them)
+
+    Args:
+        paths: Files or directories; missing paths hash as absent
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            digest.update(str(file.relative_to(PROJECT_ROOT)).encode())
+            digest.update(file.read_bytes() if file.exists() else b"<missing>")
+    return digest.hexdigest()
+
+def local_modules(module: str, seen: Optional[set] = None) -> set:
+    """
+    A src module and every src module it imports, transitively
+
+    Args:
+        module: Module name (e.g. "persona_builder")
+        seen: Modules already collected
+
+    Returns:
+        Set of module names (config excluded; its values are tracked separately)
+    """
+    seen = set() if seen is None else seen
+    path = SRC_DIR / f"{module}.py"
+    if module in seen or module == "config" or not path.exists():
+        return seen
+    seen.add(module)
+
+    for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            local_modules(name.split(".")[0], seen)
+    return seen
+
+class Stage:
+    """
+    One pipeline stage: a function of the research context with declared files
+    """
+
+    def __init__(self, name: str, run: Callable[[ResearchContext], None],
+                 modules: List[str], inputs: List[Path], outputs: List[Path],
+                 deps: Optional[List[str]] = None,
+                 rows: Optional[Callable[[ResearchContext], int]] = None):
+        """
+        Initialize stage
+
+        Args:
+            name: Stage name
+            run: Function that executes the stage against a context
+            modules: src modules implementing the stage (their imports are followed)
+            inputs: Files or directories the stage reads
+            outputs: Files or directories the stage writes
+            deps: Names of stages that must finish first
+            rows: Rows the stage processed, read from the context after it ran
+        """
+        self.name = name
+        self.run = run
+        self.modules = sorted(set().union(*(local_modules(m) for m in modules)))
+        self.inputs = inputs
+        self.outputs = outputs
+        self.deps = deps or []
+        self.rows = rows
+
+    def config_names(self) -> List[str]:
+        """Configuration constants referenced by the stage's code"""
+        names = set()
+        for module in self.modules:
+            source = (SRC_DIR / f"{module}.py").read_text(encoding='utf-8')
+            names.update(CONFIG_NAME_PATTERN.findall(source))
+        return sorted(name for name in names if hasattr(config, name))
+
+    def fingerprint(self) -> Dict[str, str]:
+        """
+        Hashes that decide whether the stage's outputs are still valid
+
+        Returns:
+            Dictionary with "inputs", "code" and "config" digests
+        """
+        config_values = {name: repr(getattr(config, name)) for name in self.config_names()}
+        return {
+            "inputs": hash_paths(self.inputs),
+            "code": hash_paths([SRC_DIR / f"{module}.py" for module in self.modules]),
+            "config": hashlib.sha256(json.dumps(config_values, sort_keys=True).encode()).hexdigest()
+        }
+
+class StageOutput:
+    """
+    stdout for concurrently running stages
+
+    Every thread's text is buffered until a line is complete and then written
+    whole, prefixed with the name of the stage the thread is running, so the
+    console log of concurrent stages interleaves by line, not by character.
+    """
+
+    def __init__(self, stream):
+        """
+        Initialize stage output
+
+        Args:
+            stream: Underlying stream (normally sys.stdout)
+        """
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Prefix this thread's output with a stage name while the block runs"""
+        self.flush()
+        self._local.prefix = f"[{name}] "
+        try:
+            yield
+        finally:
+            self.flush()
+            self._local.prefix = ""
+
+    def write(self, text: str) -> int:
+        """Write the complete lines of this thread's text, holding back an incomplete last line"""
+        prefix = getattr(self._local, "prefix", "")
+        *lines, self._local.buffer = (getattr(self._local, "buffer", "") + text).split("\n")
+        if lines:
+            with self._lock:
+                self.stream.write("".join(f"{prefix}{line}\n" for line in lines))
+        return len(text)
+
+    def flush(self) -> None:
+        """Write this thread's incomplete line (if any) and flush the underlying stream"""
+        if getattr(self._local, "buffer", ""):
+            self.write("\n")
+        with self._lock:
+            self.stream.flush()
+
+class Pipeline:
+    """
+    Runs stages in dependency order, skipping those whose fingerprint is unchanged
+
+    A stage is skipped when its input, code and config hashes match the
+    manifest of its last successful run and its outputs are unchanged since.
+    Stages whose dependencies are done run concurrently.
+    """
+
+    def __init__(self, stages: List[Stage], context: Optional[ResearchContext] = None,
+                 manifest_file: Path = PIPELINE_MANIFEST_FILE, max_workers: int = 2):
+        """
+        Initialize pipeline
+
+        Args:
+            stages: Stages (any order; dependencies are resolved by name)
+            context: Shared research context
+            manifest_file: Where stage fingerprints are persisted
+            max_workers: Maximum number of concurrently running stages
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        self.context = context or ResearchContext()
+        self.manifest_file = manifest_file
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._output = StageOutput(sys.stdout)
+
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+
+    def _load_manifest(self) -> Dict:
+        """Last recorded fingerprint per stage"""
+        if not self.manifest_file.exists():
+            return {}
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict) -> None:
+        """Persist stage fingerprints"""
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    def _execute(self, stage: Stage, manifest: Dict, force: bool) -> Dict:
+        """Run or skip one stage, returning its result record"""
+        start = time.perf_counter()
+        fingerprint = stage.fingerprint()
+        previous = manifest.get(stage.name, {})
+
+        up_to_date = (
+            not force
+            and previous.get("fingerprint") == fingerprint
+            and all(path.exists() for path in stage.outputs)
+            and previous.get("outputs") == hash_paths(stage.outputs)
+        )
+
+        if up_to_date:
+            print(f"⏭️ Skipping {stage.name} (inputs, code and config unchanged)")
+            status = "skipped"
+        else:
+            print(f"▶️ Running {stage.name}...")
+            with self._output.stage(stage.name), get_recorder().span(f"stage:{stage.name}") as record:
+                record.bytes_in = sum(file_size(path) for path in stage.inputs)
+                stage.run(self.context)
+                record.bytes_out = sum(file_size(path) for path in stage.outputs)
+                record.rows = stage.rows(self.context) if stage.rows else 0
+            status = "ran"
+            with self._lock:
+                manifest[stage.name] = {"fingerprint": fingerprint, "outputs": hash_paths(stage.outputs)}
+                self._save_manifest(manifest)
+
+        return {"stage": stage.name, "status": status, "seconds": round(time.perf_counter() - start, 3)}
+
+    def run(self, force: bool = False, report_file: Optional[Path] = RUN_REPORT_FILE) -> List[Dict]:
+        """
+        Run the pipeline and write a JSON run report
+
+        Args:
+            force: Run every stage regardless of its fingerprint
+            report_file: Where to write the run report (None to skip it). A run
+                in which every stage was skipped measured nothing, so it leaves
+                the previous report in place.
+
+        Returns:
+            List of {"stage", "status" ("ran" or "skipped"), "seconds"} in completion order
+        """
+        recorder = reset_recorder()
+        manifest = self._load_manifest()
+        pending = dict(self.stages)
+        done = set()
+        results = []
+
+        self._output.stream = sys.stdout
+        with redirect_stdout(self._output), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while pending or running:
+                ready = [name for name, stage in pending.items() if done.issuperset(stage.deps)]
+                if not ready and not running:
+                    raise ValueError(f"Dependency cycle among stages: {sorted(pending)}")
+
+                for name in ready:
+                    stage = pending.pop(name)
+                    running[executor.submit(self._execute, stage, manifest, force)] = name
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    results.append(future.result())
+                    done.add(name)
+
+        if report_file is not None and any(result["status"] == "ran" for result in results):
+            recorder.write_report(report_file, extra={
+                "results": results,
+                "code_versions": {name: entry["fingerprint"]["code"] for name, entry in manifest.items()}
+            })
+        return results
+
+def build_research_pipeline(context: Optional[ResearchContext] = None) -> Pipeline:
+    """
+    The research pipeline: generate -> affinity / transcript index -> aggregates / observation store / personas / journeys -> insights
+
+    Args:
+        context: Shared research context
+
+    Returns:
+        Pipeline instance
+    """
+    from interview_generator import InterviewGenerator
+    from affinity_mapper import AffinityMapper
+    from persona_builder import PersonaBuilder
+    from journey_mapper import JourneyMapper
+    from insights_synthesizer import InsightsSynthesizer
+    from transcript_index import TranscriptIndex
+    from dashboard_aggregates import compute_dashboard_aggregates, save_dashboard_aggregates
+    from observation_store import ObservationStore
+
+    metadata_file = RAW_DATA_DIR / "interview_metadata.csv"
+    observations_file = PROCESSED_DATA_DIR / "affinity_clusters.csv"
+    personas_file = PROCESSED_DATA_DIR / "personas.json"
+    journeys_file = PROCESSED_DATA_DIR / "journey_map_data.json"
+
+    stages = [
+        Stage(
+            "generate",
+            lambda ctx: InterviewGenerator(num_interviews=NUM_INTERVIEWS, context=ctx).generate_all_interviews(),
+            modules=["interview_generator"],
+            inputs=[],
+            outputs=[INTERVIEW_DIR, metadata_file],
+            rows=lambda ctx: len(ctx.metadata)
+        ),
+        Stage(
+            "affinity",
+            lambda ctx: AffinityMapper(context=ctx).process_all_interviews(),
+            modules=["affinity_mapper"],
+            inputs=[INTERVIEW_DIR, metadata_file],
+            outputs=[observations_file, OBSERVATION_SEARCH_FILE],
+            deps=["generate"],
+            rows=lambda ctx: len(ctx.observations)
+        ),
+        Stage(
+            "transcript_index",
+            lambda ctx: TranscriptIndex.build(INTERVIEW_DIR).save(TRANSCRIPT_INDEX_FILE),
+            modules=["transcript_index"],
+            inputs=[INTERVIEW_DIR],
+            outputs=[TRANSCRIPT_INDEX_FILE],
+            deps=["generate"],
+            rows=lambda ctx: len(ctx.metadata)
+        ),
+        Stage(
+            "dashboard_aggregates",
+            lambda ctx: save_dashboard_aggregates(compute_dashboard_aggregates(ctx.metadata, ctx.observations)),
+            modules=["dashboard_aggregates"],
+            inputs=[metadata_file, observations_file],
+            outputs=[DASHBOARD_AGGREGATES_FILE],
+            deps=["affinity"],
+            rows=lambda ctx: len(ctx.metadata) + len(ctx.observations)
+        ),
+        Stage(
+            "observation_store",
+            lambda ctx: ObservationStore.from_dataframe(ctx.observations, ctx.metadata).save(OBSERVATION_STORE_FILE),
+            modules=["observation_store"],
+            inputs=[metadata_file, observations_file],
+            outputs=[OBSERVATION_STORE_FILE],
+            deps=["affinity"],
+            rows=lambda ctx: len(ctx.observations)
+        ),
+        Stage(
+            "personas",
+            lambda ctx: PersonaBuilder(context=ctx).build_personas(),
+            modules=["persona_builder"],
+            inputs=[metadata_file, observations_file, PERSONA_PROFILES_FILE],
+            outputs=[personas_file, PROCESSED_DATA_DIR / "persona_aggregates.json"],
+            deps=["affinity"],
+            rows=lambda ctx: len(ctx.metadata) + len(ctx.observations)
+        ),
+        Stage(
+            "journeys",
+            lambda ctx: JourneyMapper(context=ctx).create_journey_maps(),
+            modules=["journey_mapper"],
+            inputs=[metadata_file, observations_file],
+            outputs=[journeys_file],
+            deps=["affinity"],
+            rows=lambda ctx: len(ctx.observations)
+        ),
+        Stage(
+            "insights",
+            lambda ctx: InsightsSynthesizer(context=ctx).synthesize_all_insights(),
+            modules=["insights_synthesizer"],
+            inputs=[metadata_file, observations_file, personas_file, journeys_file],
+            outputs=[PROCESSED_DATA_DIR / "insights_synthesis.json", REPORTS_DIR / "research_findings.txt"],
+            deps=["personas", "journeys"],
+            rows=lambda ctx: len(ctx.metadata) + len(ctx.observations)
+        )
+    ]
+    return Pipeline(stages, context)
@@ -0,0 +1,225 @@
+"""
+Recommendation Scorer Module
+Ranks product recommendations by the interview evidence behind them
+"""
+
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from config import *
+from persona_aggregates import normalize_interview_ids
+
+MAX_LINKED_THEMES = 16  # Interview theme sets are bitmasks over at most this many themes
+
+class RecommendationScorer:
+    """
+    Incremental evidence scores for product recommendations
+
+    Each recommendation is linked to affinity themes (RECOMMENDATION_THEMES).
+    Its evidence is summarized as:
+
+    - reach: share of interviews with at least one observation in a linked theme
+    - intensity: share of linked-theme observations with negative sentiment
+    - persona_coverage: share of personas whose own reach is at least
+      RECOMMENDATION_PERSONA_MIN_REACH
+
+    The state is a persona x theme-set histogram (every interview's linked
+    themes are a bitmask) plus per-theme observation counts. Interviews and
+    observations can be added in any number of batches, and scoring costs
+    O(personas x 2^themes x recommendations), independent of how many
+    interviews have been added.
+    """
+
+    def __init__(self, recommendation_themes: Dict[str, List[str]] = RECOMMENDATION_THEMES,
+                 weights: Dict[str, float] = RECOMMENDATION_SCORE_WEIGHTS,
+                 persona_min_reach: float = RECOMMENDATION_PERSONA_MIN_REACH):
+        """
+        Initialize an empty scorer
+
+        Args:
+            recommendation_themes: Mapping of rec_id to linked affinity themes
+            weights: Weights of reach, intensity and persona_coverage in the score
+            persona_min_reach: Reach within a persona for it to count as covered
+        """
+        linked = {theme for themes in recommendation_themes.values() for theme in themes}
+        self.themes = [theme for theme in AFFINITY_THEMES if theme in linked] + \
+                      sorted(linked.difference(AFFINITY_THEMES))
+        if len(self.themes) > MAX_LINKED_THEMES:
+            raise ValueError(f"At most {MAX_LINKED_THEMES} linked themes are supported, got {len(self.themes)}")
+
+        self.recommendation_themes = recommendation_themes
+        self.rec_ids = list(recommendation_themes)
+        self.weights = weights
+        self.persona_min_reach = persona_min_reach
+
+        # (themes, recommendations) links and (theme sets, recommendations) hits
+        self._links = np.array([
+            [theme in recommendation_themes[rec_id] for rec_id in self.rec_ids] for theme in self.themes
+        ], dtype=bool).reshape(len(self.themes), len(self.rec_ids))
+        theme_sets = np.arange(2 ** len(self.themes))
+        self._hits = ((theme_sets[:, None] >> np.arange(len(self.themes))) & 1).astype(bool) @ self._links
+
+        self.personas: List[str] = []
+        self._interview_rows: Dict[str, int] = {}
+        self._interview_index: Optional[pd.Index] = None
+        self._interview_personas = np.zeros(0, dtype=np.int64)
+        self._interview_masks = np.zeros(0, dtype=np.int64)
+        self._mask_counts = np.zeros((0, len(theme_sets)), dtype=np.int64)
+        self._theme_observations = np.zeros(len(self.themes), dtype=np.int64)
+        self._theme_negative = np.zeros(len(self.themes), dtype=np.int64)
+
+    @classmethod
+    def from_data(cls, metadata_df: pd.DataFrame, observations_df: pd.DataFrame, **kwargs) -> "RecommendationScorer":
+        """
+        Build a scorer from complete research data
+
+        Args:
+            metadata_df: Interview metadata
+            observations_df: Affinity observations with theme and sentiment
+
+        Returns:
+            RecommendationScorer instance
+        """
+        scorer = cls(**kwargs)
+        scorer.add_interviews(metadata_df)
+        scorer.add_observations(observations_df)
+        return scorer
+
+    @property
+    def interview_count(self) -> int:
+        """Number of registered interviews"""
+        return len(self._interview_rows)
+
+    def add_interviews(self, metadata_df: pd.DataFrame) -> None:
+        """
+        Register interviews (already registered ids are ignored)
+
+        Interviews count towards every denominator even before any of their
+        observations arrive.
+
+        Args:
+            metadata_df: Interview metadata with interview_id and persona
+        """
+        new = metadata_df.loc[~metadata_df['interview_id'].isin(self._interview_rows),
+                              ['interview_id', 'persona']].drop_duplicates('interview_id')
+        if new.empty:
+            return
+
+        for persona in new['persona'].unique():
+            if persona not in self.personas:
+                self.personas.append(persona)
+        padding = len(self.personas) - len(self._mask_counts)
+        if padding:
+            self._mask_counts = np.vstack([
+                self._mask_counts, np.zeros((padding, self._mask_counts.shape[1]), dtype=np.int64)
+            ])
+
+        start = len(self._interview_rows)
+        self._interview_index = None
+        self._interview_rows.update(zip(new['interview_id'], range(start, start + len(new))))
+        persona_codes = pd.Index(self.personas).get_indexer(new['persona'])
+        self._interview_personas = np.concatenate([self._interview_personas, persona_codes])
+        self._interview_masks = np.concatenate([self._interview_masks, np.zeros(len(new), dtype=np.int64)])
+        self._mask_counts[:, 0] += np.bincount(persona_codes, minlength=len(self.personas))
+
+    def add_observations(self, observations_df: pd.DataFrame) -> None:
+        """
+        Fold a batch of observations into the evidence
+
+        Observations of interviews that have not been registered are skipped,
+        matching ResearchMetrics, which only counts interviews in the metadata.
+
+        Args:
+            observations_df: Observations with interview_id, theme and sentiment
+        """
+        # Ids are normalized once per distinct interview, not once per observation
+        id_codes, interview_ids = pd.factorize(observations_df['interview_id'].astype(str))
+        if self._interview_index is None:
+            self._interview_index = pd.Index(self._interview_rows)
+        rows = self._interview_index.get_indexer(normalize_interview_ids(pd.Series(interview_ids)))[id_codes]
+        theme_codes = pd.Index(self.themes).get_indexer(observations_df['theme'])
+        keep = (rows >= 0) & (theme_codes >= 0)
+        rows, theme_codes = rows[keep], theme_codes[keep]
+        if len(rows) == 0:
+            return
+
+        negative = observations_df['sentiment'].eq('negative').to_numpy()[keep]
+        self._theme_observations += np.bincount(theme_codes, minlength=len(self.themes))
+        self._theme_negative += np.bincount(theme_codes[negative], minlength=len(self.themes))
+
+        # OR together each interview's theme bits, then move it to its new theme set
+        order = np.argsort(rows, kind='stable')
+        rows, bits = rows[order], np.left_shift(1, theme_codes[order])
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        rows = rows[starts]
+        old_masks = self._interview_masks[rows]
+        new_masks = old_masks | np.bitwise_or.reduceat(bits, starts)
+
+        changed = new_masks != old_masks
+        personas = self._interview_personas[rows[changed]]
+        np.subtract.at(self._mask_counts, (personas, old_masks[changed]), 1)
+        np.add.at(self._mask_counts, (personas, new_masks[changed]), 1)
+        self._interview_masks[rows] = new_masks
+
+    def scores(self) -> List[Dict]:
+        """
+        Evidence scores for every recommendation, best first
+
+        Returns:
+            List of dictionaries with rank, score, reach, intensity,
+            persona_coverage and the counts behind them
+        """
+        persona_sizes = self._mask_counts.sum(axis=1)
+        persona_reached = self._mask_counts @ self._hits
+        reached = persona_reached.sum(axis=0)
+        sample_size = int(persona_sizes.sum())
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            reach = reached / sample_size if sample_size else np.zeros(len(self.rec_ids))
+            persona_reach = persona_reached / persona_sizes[:, None]
+            observations = self._theme_observations @ self._links
+            negative = self._theme_negative @ self._links
+            intensity = np.where(observations > 0, negative / observations, 0.0)
+
+        covered = persona_reach >= self.persona_min_reach  # Personas without interviews compare False
+        populated = int((persona_sizes > 0).sum())
+        coverage = covered.sum(axis=0) / populated if populated else np.zeros(len(self.rec_ids))
+
+        score = (self.weights["reach"] * reach
+                 + self.weights["intensity"] * intensity
+                 + self.weights["persona_coverage"] * coverage)
+
+        results = []
+        for rank, i in enumerate(np.argsort(-score, kind='stable'), 1):
+            results.append({
+                "rec_id": self.rec_ids[i],
+                "rank": rank,
+                "score": round(float(score[i]), 3),
+                "reach": round(float(reach[i]), 3),
+                "intensity": round(float(intensity[i]), 3),
+                "persona_coverage": round(float(coverage[i]), 3),
+                "linked_themes": self.recommendation_themes[self.rec_ids[i]],
+                "interviews_reached": int(reached[i]),
+                "sample_size": sample_size,
+                "observations": int(observations[i]),
+                "negative_observations": int(negative[i]),
+                "covered_personas": [self.personas[p] for p in np.flatnonzero(covered[:, i])]
+            })
+        return results
+
+    def rank(self, recommendations: List[Dict]) -> List[Dict]:
+        """
+        Attach evidence scores and order recommendations by them
+
+        Recommendations without linked themes keep their relative order after
+        the scored ones.
+
+        Args:
+            recommendations: Recommendation dictionaries with rec_id
+
+        Returns:
+            New list of recommendations, each with an "evidence" entry
+        """
+        evidence = {entry["rec_id"]: entry for entry in self.scores()}
+        ranked = [{**rec, "evidence": evidence.get(rec["rec_id"])} for rec in recommendations]
+        return sorted(ranked, key=lambda rec: rec["evidence"]["rank"] if rec["evidence"] else len(evidence) + 1)
@@ -0,0 +1,183 @@
+"""
+Report Writer Module
+Streaming, atomic writers for synthesized research reports
+"""
+
+import json
+import os
+import secrets
+import stat
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+from config import *
+
+try:
+    import msgpack
+except ImportError:  # Binary output is optional
+    msgpack = None
+
+WRITE_BUFFER_BYTES = 1 << 16  # Buffer size for report file handles
+
+def _create_temp_file(path: Path) -> Tuple[int, str]:
+    """
+    Create a uniquely named temporary file next to ``path``
+
+    The file is created 0666 minus the process umask, like a plain open()
+    (mkstemp would make it 0600), and then given the permissions of the file
+    it replaces, if any. The umask is applied by the OS, never read or set.
+
+    Returns:
+        (file descriptor, temporary file name)
+    """
+    while True:
+        temp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        os.chmod(temp_name, stat.S_IMODE(os.stat(path).st_mode))
+    except FileNotFoundError:
+        pass
+    except BaseException:
+        os.close(fd)
+        os.unlink(temp_name)
+        raise
+    return fd, temp_name
+
+@contextmanager
+def atomic_write(path: Path, mode: str = 'w', encoding: Optional[str] = 'utf-8'):
+    """
+    Open a temporary file next to ``path`` and move it into place on success
+
+    Readers never observe a half-written file: the target is replaced in one
+    ``os.replace`` after the data is flushed to disk, and left untouched if
+    writing fails. The new file keeps the target's permissions (or gets the
+    umask default for a new file, as open() would).
+
+    Args:
+        path: Final file path
+        mode: 'w' for text or 'wb' for binary
+        encoding: Text encoding (ignored in binary mode)
+
+    Yields:
+        Buffered file handle
+    """
+    path = Path(path)
+    fd, temp_name = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, mode, buffering=WRITE_BUFFER_BYTES,
+                       encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+class StreamingReportWriter:
+    """
+    Writes a report object one top-level section at a time
+
+    Sections are serialized as soon as they are produced instead of after
+    the whole report exists. Pretty output is byte-identical to
+    ``json.dump(report, f, indent=2, ensure_ascii=False)``; compact output
+    drops all whitespace. When a msgpack path is given (and msgpack is
+    installed), the same sections are also written as a stream of
+    ``[key, value]`` pairs (see ``read_msgpack_report``).
+    """
+
+    def __init__(self, json_file: Path, compact: bool = False, msgpack_file: Optional[Path] = None):
+        """
+        Initialize writer
+
+        Args:
+            json_file: JSON output path
+            compact: Write compact JSON instead of indented JSON
+            msgpack_file: Optional binary output path
+        """
+        if msgpack_file is not None and msgpack is None:
+            raise ImportError("msgpack output requested but msgpack is not installed (pip install msgpack)")
+        self.json_file = Path(json_file)
+        self.msgpack_file = Path(msgpack_file) if msgpack_file is not None else None
+        self.compact = compact
+        self.sections = 0
+
+    def __enter__(self) -> "StreamingReportWriter":
+        # If the msgpack file cannot be opened, the JSON temporary file is discarded too
+        with ExitStack() as stack:
+            self._json = stack.enter_context(atomic_write(self.json_file, 'w'))
+            if self.msgpack_file is not None:
+                self._binary = stack.enter_context(atomic_write(self.msgpack_file, 'wb'))
+                self._packer = msgpack.Packer(use_bin_type=True)
+            self._writers = stack.pop_all()
+        self._json.write("{")
+        return self
+
+    def write_section(self, key: str, value: Any) -> None:
+        """
+        Serialize one top-level section
+
+        Args:
+            key: Section name
+            value: JSON-serializable section content
+        """
+        name = json.dumps(key, ensure_ascii=False)
+        if self.compact:
+            body = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            self._json.write(("," if self.sections else "") + f"{name}:{body}")
+        else:
+            body = json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            self._json.write(("," if self.sections else "") + f"\n  {name}: {body}")
+
+        if self.msgpack_file is not None:
+            self._binary.write(self._packer.pack([key, value]))
+        self.sections += 1
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self._json.write("}" if self.compact or not self.sections else "\n}")
+        # Close in reverse order; on error every temporary file is discarded
+        self._writers.__exit__(exc_type, exc, tb)
+        return False
+
+def read_msgpack_report(path: Path) -> Dict[str, Any]:
+    """
+    Read a report written by StreamingReportWriter's msgpack output
+
+    Args:
+        path: msgpack report file
+
+    Returns:
+        Report dictionary
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is not installed (pip install msgpack)")
+    with open(path, 'rb') as f:
+        return {key: value for key, value in msgpack.Unpacker(f, raw=False)}
+
+def write_sections(sections: Iterator[Tuple[str, Any]], json_file: Path,
+                   compact: bool = False, msgpack_file: Optional[Path] = None) -> int:
+    """
+    Stream (key, value) sections to disk as they are produced
+
+    Each section is released once written, so at most one section is held
+    at a time (callers that need a section afterwards keep it themselves).
+
+    Args:
+        sections: Iterator of (section name, content)
+        json_file: JSON output path
+        compact: Write compact JSON
+        msgpack_file: Optional binary output path
+
+    Returns:
+        Number of sections written
+    """
+    with StreamingReportWriter(json_file, compact=compact, msgpack_file=msgpack_file) as writer:
+        for key, value in sections:
+            writer.write_section(key, value)
+    return writer.sections
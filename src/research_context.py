@@ -0,0 +1,128 @@
+"""
+Research Context Module
+In-memory research artifacts shared between pipeline stages
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from config import *
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas is imported by the CSV parsers, so importing this module (e.g. from a
+# dashboard page that only reads JSON) stays cheap
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON artifact"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _read_csv(path: Path) -> "pd.DataFrame":
+    """Parse a CSV artifact"""
+    import pandas as pd
+    return pd.read_csv(path)
+
+def _read_metadata(path: Path) -> "pd.DataFrame":
+    """Parse interview metadata, keeping "None" (no current tool) as a value"""
+    import pandas as pd
+    return pd.read_csv(path, keep_default_na=False, na_values=[""])
+
+# Artifact name -> (default path, parser)
+ARTIFACTS: Dict[str, tuple] = {
+    "metadata": (RAW_DATA_DIR / "interview_metadata.csv", _read_metadata),
+    "observations": (PROCESSED_DATA_DIR / "affinity_clusters.csv", _read_csv),
+    "personas": (PROCESSED_DATA_DIR / "personas.json", _read_json),
+    "journey_maps": (PROCESSED_DATA_DIR / "journey_map_data.json", _read_json),
+    "insights": (PROCESSED_DATA_DIR / "insights_synthesis.json", _read_json)
+}
+
+class ResearchContext:
+    """
+    Holds research artifacts in memory so each one is parsed at most once
+
+    A stage that produces an artifact publishes it with ``set``; later stages
+    read it through the matching attribute (``context.metadata``,
+    ``context.observations``, ...). Artifacts that were never published are
+    loaded lazily from disk on first access. Access is thread-safe.
+    """
+
+    def __init__(self, paths: Optional[Dict[str, Path]] = None):
+        """
+        Initialize an empty context
+
+        Args:
+            paths: Optional overrides of artifact file paths by artifact name
+        """
+        self.paths = {name: path for name, (path, _) in ARTIFACTS.items()}
+        self.paths.update(paths or {})
+        self._artifacts: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.load_counts: Dict[str, int] = {name: 0 for name in ARTIFACTS}
+
+    def get(self, name: str) -> Any:
+        """
+        Get an artifact, loading it from disk if no stage has published it
+
+        Args:
+            name: Artifact name (see ARTIFACTS)
+
+        Returns:
+            DataFrame for tabular artifacts, parsed JSON otherwise
+        """
+        with self._lock:
+            if name not in self._artifacts:
+                _, parser = ARTIFACTS[name]
+                self._artifacts[name] = parser(self.paths[name])
+                self.load_counts[name] += 1
+            return self._artifacts[name]
+
+    def set(self, name: str, value: Any) -> None:
+        """
+        Publish an artifact produced by a stage
+
+        Args:
+            name: Artifact name (see ARTIFACTS)
+            value: In-memory artifact (already written to disk by the stage)
+        """
+        if name not in ARTIFACTS:
+            raise KeyError(f"Unknown research artifact '{name}'")
+        with self._lock:
+            self._artifacts[name] = value
+
+    def invalidate(self, name: str) -> None:
+        """Drop an artifact so the next access reloads it from disk"""
+        with self._lock:
+            self._artifacts.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether an artifact is held in memory"""
+        with self._lock:
+            return name in self._artifacts
+
+    @property
+    def metadata(self) -> "pd.DataFrame":
+        """Interview metadata"""
+        return self.get("metadata")
+
+    @property
+    def observations(self) -> "pd.DataFrame":
+        """Affinity observations"""
+        return self.get("observations")
+
+    @property
+    def personas(self) -> list:
+        """Built personas"""
+        return self.get("personas")
+
+    @property
+    def journey_maps(self) -> Dict:
+        """Journey map data"""
+        return self.get("journey_maps")
+
+    @property
+    def insights(self) -> Dict:
+        """Insights synthesis report"""
+        return self.get("insights")
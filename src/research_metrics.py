@@ -0,0 +1,154 @@
+"""
+Research Metrics Module
+Computes research rates from interview data, keeping the provenance of every figure
+"""
+
+from typing import Dict, Optional
+import pandas as pd
+from config import *
+from persona_aggregates import normalize_interview_ids
+
+METADATA_SOURCE = "interview_metadata.csv"
+OBSERVATIONS_SOURCE = "affinity_clusters.csv"
+
+class ResearchMetrics:
+    """
+    Named research figures with provenance
+
+    Every metric is a dictionary with its value, numerator, denominator,
+    the filter that selected the numerator and the source it came from.
+    Rates also carry a per-persona breakdown.
+    """
+
+    def __init__(self, metrics: Dict[str, Dict]):
+        """
+        Initialize from computed metrics
+
+        Args:
+            metrics: Mapping of metric name to metric dictionary
+        """
+        self.metrics = metrics
+
+    @classmethod
+    def compute(cls, metadata_df: pd.DataFrame, observations_df: pd.DataFrame,
+                theme_metrics: Dict[str, str] = RESEARCH_THEME_METRICS,
+                text_metrics: Dict[str, str] = RESEARCH_TEXT_METRICS,
+                baselines: Dict[str, Dict] = RESEARCH_EXTERNAL_BASELINES) -> "ResearchMetrics":
+        """
+        Compute all metrics in one aggregation pass
+
+        Each observation gets one boolean flag per theme and text metric. A
+        single groupby then reduces the flags to an interview x metric presence
+        matrix, and column sums give every numerator at once.
+
+        Args:
+            metadata_df: Interview metadata (one row per interview)
+            observations_df: Affinity observations with text and theme
+            theme_metrics: Mapping of metric name to affinity theme
+            text_metrics: Mapping of metric name to text pattern
+            baselines: External figures that interviews cannot measure
+
+        Returns:
+            ResearchMetrics instance
+        """
+        interview_ids = metadata_df['interview_id']
+        personas = metadata_df['persona'].to_numpy()
+        sample_size = len(metadata_df)
+
+        # Observation-level flags, one column per metric
+        texts = observations_df['text'].astype(str)
+        flags = pd.DataFrame(
+            {name: observations_df['theme'].eq(theme).to_numpy() for name, theme in theme_metrics.items()}
+            | {name: texts.str.contains(pattern, case=False, regex=True).to_numpy()
+               for name, pattern in text_metrics.items()}
+        )
+        filters = (
+            {name: f"theme == '{theme}'" for name, theme in theme_metrics.items()}
+            | {name: f"text matches /{pattern}/i" for name, pattern in text_metrics.items()}
+        )
+
+        # Interview x metric presence (interviews without observations count as absent)
+        presence = (
+            flags.groupby(normalize_interview_ids(observations_df['interview_id']).to_numpy()).any()
+            .reindex(interview_ids, fill_value=False)
+        )
+        presence['multi_tool_rate'] = (metadata_df['tools_abandoned'] >= RESEARCH_MULTI_TOOL_THRESHOLD).to_numpy()
+        filters['multi_tool_rate'] = f"tools_abandoned >= {RESEARCH_MULTI_TOOL_THRESHOLD}"
+
+        numerators = presence.sum()
+        persona_numerators = presence.groupby(personas).sum()
+        persona_sizes = pd.Series(personas).value_counts()
+
+        metrics = {}
+        for name in presence.columns:
+            metrics[name] = {
+                **cls._rate(int(numerators[name]), sample_size),
+                "filter": filters[name],
+                "source": METADATA_SOURCE if name == 'multi_tool_rate' else OBSERVATIONS_SOURCE,
+                "by_persona": {
+                    persona: cls._rate(int(persona_numerators.at[persona, name]), int(persona_sizes[persona]))
+                    for persona in persona_numerators.index
+                }
+            }
+
+        for name, column in [("avg_tools_abandoned", 'tools_abandoned'),
+                             ("avg_interview_minutes", 'duration_minutes')]:
+            total = float(metadata_df[column].sum())
+            metrics[name] = {
+                "value": round(total / sample_size, 2) if sample_size else None,
+                "numerator": total,
+                "denominator": sample_size,
+                "filter": f"mean of {column}",
+                "source": METADATA_SOURCE,
+                "min": int(metadata_df[column].min()) if sample_size else None,
+                "max": int(metadata_df[column].max()) if sample_size else None
+            }
+
+        for name, baseline in baselines.items():
+            metrics[name] = {
+                "value": baseline["value"],
+                "numerator": None,
+                "denominator": None,
+                "filter": None,
+                "source": "external",
+                "note": baseline["note"]
+            }
+
+        return cls(metrics)
+
+    @staticmethod
+    def _rate(numerator: int, denominator: int) -> Dict:
+        """Rate with its counts"""
+        return {
+            "value": round(numerator / denominator, 3) if denominator else None,
+            "numerator": numerator,
+            "denominator": denominator
+        }
+
+    def value(self, name: str, persona: Optional[str] = None) -> float:
+        """
+        Get a metric value
+
+        Args:
+            name: Metric name
+            persona: Persona to get the rate for (overall when None)
+
+        Returns:
+            Metric value
+        """
+        metric = self.metrics[name]
+        if persona is not None:
+            metric = metric["by_persona"].get(persona, {"value": 0.0})
+        return metric["value"]
+
+    def percent(self, name: str, persona: Optional[str] = None) -> str:
+        """Metric value formatted as a whole percentage"""
+        return f"{self.value(name, persona):.0%}"
+
+    def counts(self, name: str) -> str:
+        """Numerator and denominator formatted as "n/N" """
+        return f"{self.metrics[name]['numerator']}/{self.metrics[name]['denominator']}"
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """All metrics with provenance"""
+        return self.metrics
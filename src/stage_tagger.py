@@ -0,0 +1,264 @@
+"""
+Stage Tagger Module
+Assigns interview observations to journey stages and indexes the evidence per stage
+"""
+
+import heapq
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from config import *
+
+# Spoken durations such as "30-minute", "a couple weeks" or "three days"
+DURATION_PATTERN = re.compile(
+    r"\b(\d+(?:\.\d+)?|an?|one|two|three|four|five|few|couple(?: of)?|several)[\s-]+"
+    r"(minute|hour|day|week|month)s?\b"
+)
+DURATION_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "few": 3, "couple": 2, "couple of": 2, "several": 3
+}
+MINUTES_PER_UNIT = {"minute": 1, "hour": 60, "day": 1440, "week": 10080, "month": 43200}
+
+class KeywordMatcher:
+    """
+    Scores text against labelled keyword lists with one compiled regex
+
+    All keywords are combined into a single alternation of named groups, so a
+    text is scanned once regardless of how many labels there are.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        """
+        Initialize matcher
+
+        Args:
+            keywords: Mapping of label to keywords (matched case-insensitively at word starts)
+        """
+        self.labels = list(keywords)
+        alternatives = []
+        for i, label in enumerate(self.labels):
+            # Longest keywords first so overlapping phrases prefer the specific one
+            words = sorted(keywords[label], key=len, reverse=True)
+            alternatives.append(f"(?P<k{i}>" + "|".join(re.escape(w) for w in words) + ")")
+        self.pattern = re.compile(r"\b(?:" + "|".join(alternatives) + ")", re.IGNORECASE)
+
+    def count(self, text: str) -> Counter:
+        """Count keyword hits per label"""
+        return Counter(self.labels[int(m.lastgroup[1:])] for m in self.pattern.finditer(text))
+
+    def best(self, text: str) -> Optional[str]:
+        """Label with the most hits (earliest label wins ties), or None"""
+        counts = self.count(text)
+        if not counts:
+            return None
+        return max(self.labels, key=lambda label: counts.get(label, 0))
+
+def parse_duration_minutes(text: str) -> List[float]:
+    """
+    Extract spoken durations from text
+
+    Args:
+        text: Observation text
+
+    Returns:
+        List of durations in minutes
+    """
+    durations = []
+    for amount, unit in DURATION_PATTERN.findall(text.lower()):
+        value = DURATION_WORDS.get(amount)
+        if value is None:
+            value = float(amount)
+        durations.append(value * MINUTES_PER_UNIT[unit])
+    return durations
+
+def format_duration(minutes: float) -> str:
+    """Format minutes using the largest unit that fits"""
+    for unit, size in sorted(MINUTES_PER_UNIT.items(), key=lambda item: -item[1]):
+        if minutes >= size:
+            value = round(minutes / size, 1)
+            return f"~{value:g} {unit}{'' if value == 1 else 's'}"
+    return f"~{minutes:g} minutes"
+
+def emotion_label(score: float) -> str:
+    """Map a mean sentiment score in [-1, 1] to an emotion label"""
+    for upper_bound, label in EMOTION_SCALE:
+        if score <= upper_bound:
+            return label
+    return EMOTION_SCALE[-1][1]
+
+def emotion_curves(stage_codes: np.ndarray, scores: np.ndarray, group_codes: np.ndarray,
+                   n_stages: int, n_groups: int) -> Dict[str, np.ndarray]:
+    """
+    Per-group, per-stage sentiment statistics in one vectorized pass
+
+    Each observation is binned into cell ``group * n_stages + stage`` and the
+    count, sum and sum of squares of every cell come from three bincounts.
+
+    Args:
+        stage_codes: Stage index of every observation (-1 when untagged)
+        scores: Sentiment score of every observation
+        group_codes: Group index of every observation (-1 when it has no group)
+        n_stages: Number of stages
+        n_groups: Number of groups
+
+    Returns:
+        Dictionary of (n_groups, n_stages) arrays: "mean", "variance"
+        (sample variance, NaN below two observations) and "count"
+    """
+    stage_codes = np.asarray(stage_codes)
+    group_codes = np.asarray(group_codes)
+    scores = np.asarray(scores, dtype=float)
+
+    keep = (stage_codes >= 0) & (group_codes >= 0)
+    cells = group_codes[keep] * n_stages + stage_codes[keep]
+    size = n_groups * n_stages
+
+    count = np.bincount(cells, minlength=size).reshape(n_groups, n_stages)
+    total = np.bincount(cells, weights=scores[keep], minlength=size).reshape(n_groups, n_stages)
+    total_sq = np.bincount(cells, weights=scores[keep] ** 2, minlength=size).reshape(n_groups, n_stages)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(count > 0, total / count, np.nan)
+        variance = np.where(count > 1, (total_sq - count * mean ** 2) / (count - 1), np.nan)
+
+    return {"mean": mean, "variance": np.clip(variance, 0.0, None), "count": count}
+
+class StageTagger:
+    """
+    Tags observations with journey stages and builds a per-stage evidence index
+    """
+
+    def __init__(self, stage_keywords: Dict[str, List[str]] = JOURNEY_STAGE_KEYWORDS):
+        """
+        Initialize stage tagger
+
+        Args:
+            stage_keywords: Mapping of stage name to tagging keywords
+        """
+        self.stages = list(stage_keywords)
+        self.stage_matcher = KeywordMatcher(stage_keywords)
+        self.channel_matcher = KeywordMatcher(JOURNEY_CHANNEL_KEYWORDS)
+        self.tool_matcher = KeywordMatcher(JOURNEY_TOOL_KEYWORDS)
+
+    def tag(self, text: str) -> Optional[str]:
+        """Journey stage for a single observation, or None"""
+        return self.stage_matcher.best(text)
+
+    def build_index(self, observations_df: pd.DataFrame) -> Dict[str, Dict]:
+        """
+        Scan observations once and index the evidence for every stage
+
+        Args:
+            observations_df: Observations with text, interview_id and sentiment
+
+        Returns:
+            Dictionary of stage name to evidence summary
+        """
+        return self.build_grouped_index(observations_df)["overall"]
+
+    def build_grouped_index(self, observations_df: pd.DataFrame,
+                            group_columns: Optional[List[str]] = None) -> Dict:
+        """
+        Scan observations once and index stage evidence overall and per group
+
+        Each observation is tagged and its mentions extracted exactly once;
+        the result is then added to the overall index and to the index of
+        every group (e.g. persona, segment) the observation belongs to.
+
+        Args:
+            observations_df: Observations with text, interview_id and sentiment
+            group_columns: Columns of observations_df to build per-value indexes for
+
+        Returns:
+            Dictionary with "overall" ({stage: summary}), "groups"
+            ({column: {value: {stage: summary}}}) and "stage_codes" (stage
+            index per observation row, -1 when untagged)
+        """
+        group_columns = group_columns or []
+        overall = {stage: self._empty_entry() for stage in self.stages}
+        groups = {column: {} for column in group_columns}
+        stage_positions = {stage: i for i, stage in enumerate(self.stages)}
+        stage_codes = np.full(len(observations_df), -1, dtype=np.int64)
+
+        columns = [observations_df['text'].astype(str),
+                   observations_df['interview_id'],
+                   observations_df['sentiment']]
+        columns += [observations_df[column] for column in group_columns]
+
+        for row, (text, interview_id, sentiment, *group_values) in enumerate(zip(*columns)):
+            stage = self.tag(text)
+            if stage is None:
+                continue
+            stage_codes[row] = stage_positions[stage]
+
+            targets = [overall[stage]]
+            for column, value in zip(group_columns, group_values):
+                if pd.isna(value):
+                    continue
+                index = groups[column].get(value)
+                if index is None:
+                    index = groups[column][value] = {s: self._empty_entry() for s in self.stages}
+                targets.append(index[stage])
+
+            score = SENTIMENT_SCORES.get(sentiment, 0.0)
+            durations = parse_duration_minutes(text)
+            channels = self.channel_matcher.count(text)
+            tools = self.tool_matcher.count(text)
+            quote = (int(sentiment == 'negative'), len(text), text)
+
+            for entry in targets:
+                entry["scores"].append(score)
+                entry["sentiment"][sentiment] += 1
+                entry["interviews"].add(interview_id)
+                entry["durations"].extend(durations)
+                entry["channels"].update(channels)
+                entry["tools"].update(tools)
+                entry["quotes"].add(quote)
+
+        return {
+            "overall": self._summarize_index(overall),
+            "groups": {
+                column: {value: self._summarize_index(index) for value, index in values.items()}
+                for column, values in groups.items()
+            },
+            "stage_codes": stage_codes
+        }
+
+    @classmethod
+    def _summarize_index(cls, index: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Summarize every stage accumulator of an index"""
+        return {stage: cls._summarize(entry) for stage, entry in index.items()}
+
+    @staticmethod
+    def _empty_entry() -> Dict:
+        """Accumulator for one stage"""
+        return {
+            "scores": [],
+            "sentiment": Counter(),
+            "interviews": set(),
+            "durations": [],
+            "channels": Counter(),
+            "tools": Counter(),
+            "quotes": set()
+        }
+
+    @staticmethod
+    def _summarize(entry: Dict) -> Dict:
+        """Reduce a stage accumulator to its evidence summary"""
+        scores = np.array(entry["scores"])
+        durations = entry["durations"]
+
+        return {
+            "observation_count": len(scores),
+            "interview_count": len(entry["interviews"]),
+            "sentiment_breakdown": dict(entry["sentiment"]),
+            "sentiment_score_mean": round(float(scores.mean()), 3) if len(scores) else None,
+            "duration_minutes_median": float(np.median(durations)) if durations else None,
+            "duration_mentions": len(durations),
+            "channels": [label for label, _ in entry["channels"].most_common(4)],
+            "tools": [label for label, _ in entry["tools"].most_common(4)],
+            "quotes": [text for _, _, text in heapq.nlargest(JOURNEY_STAGE_QUOTES, entry["quotes"])]
+        }
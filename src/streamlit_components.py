@@ -4,10 +4,13 @@ Reusable UI components for the dashboard
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# plotly and pandas are imported inside the chart functions; pages without
+# charts never load them
 
 def render_metric_card(title: str, value: str, delta: str = None, 
                        delta_color: str = "normal", icon: str = "📊"):
@@ -44,6 +47,10 @@ def render_persona_card(persona: Dict):
     Args:
         persona: Persona dictionary
     """
+    ci_level = persona.get('confidence_intervals', {}).get('level', 0.95)
+    age_ci = persona['demographics'].get('age_ci')
+    tools_ci = persona['behavioral_patterns'].get('avg_tools_abandoned_ci')
+    
     st.markdown(f"""
     <div style="
         background: white;
@@ -57,10 +64,14 @@ def render_persona_card(persona: Dict):
         <p style="color: #666; font-style: italic; margin-bottom: 1.5rem;">"{persona['tagline']}"</p>
         
         <div style="margin-bottom: 1rem;">
-            <strong>Age:</strong> {persona['demographics']['age']} | 
+            <strong>Age:</strong> {persona['demographics']['age']}{f' <small>({ci_level:.0%} CI {age_ci[0]}–{age_ci[1]})</small>' if age_ci else ''} | 
             <strong>Occupation:</strong> {persona['demographics']['occupation']}
         </div>
         
+        <div style="margin-bottom: 1rem;">
+            <strong>Tools Abandoned:</strong> {persona['behavioral_patterns']['avg_tools_abandoned']}{f' <small>({ci_level:.0%} CI {tools_ci[0]}–{tools_ci[1]})</small>' if tools_ci else ''}
+        </div>
+        
         <div style="margin-bottom: 1rem;">
             <strong>Tech Savviness:</strong> {persona['demographics']['tech_savviness']}
         </div>
@@ -149,6 +160,7 @@ def create_funnel_chart(stages: List[str], values: List[float], title: str = "Us
         values: List of values (percentages or counts)
         title: Chart title
     """
+    import plotly.graph_objects as go
     fig = go.Figure(go.Funnel(
         y=stages,
         x=values,
@@ -166,7 +178,7 @@ def create_funnel_chart(stages: List[str], values: List[float], title: str = "Us
     
     return fig
 
-def create_timeline_chart(df: pd.DataFrame, x_col: str, y_col: str, title: str):
+def create_timeline_chart(df: "pd.DataFrame", x_col: str, y_col: str, title: str):
     """
     Create a timeline/line chart
     
@@ -176,6 +188,7 @@ def create_timeline_chart(df: pd.DataFrame, x_col: str, y_col: str, title: str):
         y_col: Column for y-axis
         title: Chart title
     """
+    import plotly.express as px
     fig = px.line(df, x=x_col, y=y_col, 
                   title=title,
                   markers=True)
@@ -192,6 +205,7 @@ def create_sentiment_chart(sentiment_counts: Dict):
     Args:
         sentiment_counts: Dictionary with sentiment counts
     """
+    import plotly.graph_objects as go
     colors = {
         'negative': '#dc3545',
         'neutral': '#ffc107',
@@ -226,13 +240,14 @@ def create_sentiment_chart(sentiment_counts: Dict):
     
     return fig
 
-def create_theme_distribution_chart(theme_counts: pd.Series):
+def create_theme_distribution_chart(theme_counts: "pd.Series"):
     """
     Create theme distribution pie chart
     
     Args:
         theme_counts: Series with theme counts
     """
+    import plotly.express as px
     fig = px.pie(
         values=theme_counts.values,
         names=theme_counts.index,
@@ -0,0 +1,294 @@
+"""
+Transcript Index Module
+Inverted full-text index over interview transcripts with line offsets
+"""
+
+import re
+from array import array
+from pathlib import Path
+from typing import Dict, List
+import numpy as np
+from config import *
+from instrumentation import file_size, instrument
+
+TOKEN_PATTERN = re.compile(r"\w+(?:'\w+)*")
+
+# Occurrence keys: document << 42 | line << 21 | position (lines and positions below 2^21)
+KEY_DOCUMENT_SHIFT = 42
+KEY_LINE_SHIFT = 21
+KEY_FIELD_MASK = (1 << 21) - 1
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens (apostrophes stay inside words, e.g. "don't")"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+class TranscriptIndex:
+    """
+    Positional inverted index: token -> (interview, line, position in line)
+
+    Postings are stored column-wise in numpy arrays, sorted by token and then
+    by interview, line and position. The vocabulary is sorted, so a token or a
+    prefix is a binary search and its postings are one contiguous slice.
+    Byte offsets of every line let snippets be read straight from the
+    transcript files without loading them.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], transcript_dir: Path = INTERVIEW_DIR):
+        """
+        Initialize from index arrays
+
+        Args:
+            arrays: Index arrays (see build and save)
+            transcript_dir: Directory holding the indexed transcripts
+        """
+        self.transcript_dir = Path(transcript_dir)
+        self.documents = arrays["documents"].tolist()
+        self.vocabulary = arrays["vocabulary"]
+        self.token_offsets = arrays["token_offsets"]
+        self.posting_documents = arrays["posting_documents"]
+        self.posting_lines = arrays["posting_lines"]
+        self.posting_positions = arrays["posting_positions"]
+        self.line_offsets = arrays["line_offsets"]
+        self.document_line_starts = arrays["document_line_starts"]
+        self._document_numbers = {name: i for i, name in enumerate(self.documents)}
+
+    @classmethod
+    @instrument("transcript_index.build", rows=lambda result, arguments: len(result.documents))
+    def build(cls, transcript_dir: Path = INTERVIEW_DIR, pattern: str = "interview_*.txt") -> "TranscriptIndex":
+        """
+        Index every transcript in a directory
+
+        Args:
+            transcript_dir: Directory with transcript files
+            pattern: Glob pattern of transcript files
+
+        Returns:
+            TranscriptIndex instance
+        """
+        vocabulary: Dict[str, int] = {}
+        token_ids, documents, lines, positions = array('i'), array('i'), array('i'), array('i')
+        line_offsets, document_line_starts = array('q'), array('q', [0])
+        names = []
+
+        for document, path in enumerate(sorted(Path(transcript_dir).glob(pattern))):
+            names.append(path.stem)
+            offset = 0
+            for line_number, raw_line in enumerate(path.read_bytes().split(b"\n")):
+                line_offsets.append(offset)
+                offset += len(raw_line) + 1
+                tokens = tokenize(raw_line.decode('utf-8'))
+                if not tokens:
+                    continue
+                token_ids.extend([vocabulary.setdefault(token, len(vocabulary)) for token in tokens])
+                documents.extend([document] * len(tokens))
+                lines.extend([line_number] * len(tokens))
+                positions.extend(range(len(tokens)))
+            # Sentinel end offset, so line i spans line_offsets[i]:line_offsets[i + 1]
+            line_offsets.append(offset - 1)
+            document_line_starts.append(len(line_offsets))
+
+        # Renumber tokens alphabetically; a stable sort keeps postings in document order
+        words = np.array(list(vocabulary), dtype=str)
+        order = np.argsort(words, kind='stable')
+        rank = np.empty(len(order), dtype=np.int32)
+        rank[order] = np.arange(len(order))
+        token_ids = rank[np.frombuffer(token_ids, dtype=np.int32)] if len(token_ids) else np.zeros(0, dtype=np.int32)
+        postings = np.argsort(token_ids, kind='stable')
+
+        return cls({
+            "documents": np.array(names, dtype=str),
+            "vocabulary": words[order],
+            "token_offsets": np.searchsorted(token_ids[postings], np.arange(len(order) + 1)),
+            "posting_documents": np.frombuffer(documents, dtype=np.int32)[postings],
+            "posting_lines": np.frombuffer(lines, dtype=np.int32)[postings],
+            "posting_positions": np.frombuffer(positions, dtype=np.int32)[postings],
+            "line_offsets": np.frombuffer(line_offsets, dtype=np.int64).copy(),
+            "document_line_starts": np.frombuffer(document_line_starts, dtype=np.int64).copy()
+        }, transcript_dir)
+
+    @instrument("transcript_index.save", bytes_out=lambda result, arguments: file_size(result))
+    def save(self, output_file: Path = TRANSCRIPT_INDEX_FILE) -> Path:
+        """
+        Persist the index as an uncompressed .npz archive
+
+        Args:
+            output_file: Index file
+
+        Returns:
+            The index file path
+        """
+        with open(output_file, 'wb') as f:
+            np.savez(
+                f,
+                documents=np.array(self.documents, dtype=str),
+                vocabulary=self.vocabulary,
+                token_offsets=self.token_offsets,
+                posting_documents=self.posting_documents,
+                posting_lines=self.posting_lines,
+                posting_positions=self.posting_positions,
+                line_offsets=self.line_offsets,
+                document_line_starts=self.document_line_starts
+            )
+        return Path(output_file)
+
+    @classmethod
+    def load(cls, index_file: Path = TRANSCRIPT_INDEX_FILE, transcript_dir: Path = INTERVIEW_DIR) -> "TranscriptIndex":
+        """
+        Load a saved index
+
+        Args:
+            index_file: Index file written by save
+            transcript_dir: Directory holding the indexed transcripts
+
+        Returns:
+            TranscriptIndex instance
+        """
+        with np.load(index_file, allow_pickle=False) as arrays:
+            return cls({name: arrays[name] for name in arrays.files}, transcript_dir)
+
+    def _token_range(self, token: str, prefix: bool = False) -> slice:
+        """Postings slice of a token, or of every token starting with it"""
+        start = np.searchsorted(self.vocabulary, token, side='left')
+        if prefix:
+            end = np.searchsorted(self.vocabulary, token + "\U0010ffff", side='left')
+        else:
+            end = start + 1 if start < len(self.vocabulary) and self.vocabulary[start] == token else start
+        return slice(self.token_offsets[start], self.token_offsets[end])
+
+    def _keys(self, token: str, prefix: bool = False) -> np.ndarray:
+        """
+        Sorted occurrence keys of a token or prefix
+
+        A key packs (document, line, position) into one int64, so sorting keys
+        sorts occurrences by document, then line, then position.
+        """
+        span = self._token_range(token, prefix)
+        keys = ((self.posting_documents[span].astype(np.int64) << KEY_DOCUMENT_SHIFT)
+                | (self.posting_lines[span].astype(np.int64) << KEY_LINE_SHIFT)
+                | self.posting_positions[span])
+        # A prefix concatenates several tokens' postings; restore document order
+        return np.sort(keys) if prefix else keys
+
+    def find(self, query: str) -> np.ndarray:
+        """
+        Occurrences of a query
+
+        A single word matches that token; several words match them as a
+        consecutive phrase on one line (surrounding quotes are optional). A
+        trailing ``*`` turns the last word into a prefix, e.g. ``guilt*`` or
+        ``"set up*"``.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Array of (document, line, position of the first word) rows, in document order
+        """
+        query = query.strip().strip('"').strip()
+        prefix = query.endswith("*")
+        tokens = tokenize(query)
+        if not tokens:
+            return np.zeros((0, 3), dtype=np.int64)
+
+        last = len(tokens) - 1
+        matches = self._keys(tokens[0], prefix and last == 0)
+        for offset, token in enumerate(tokens[1:], 1):
+            if len(matches) == 0:
+                break
+            # A phrase continues where the next word sits `offset` positions further on the same line
+            following = self._keys(token, prefix and offset == last)
+            following = following[(following & KEY_FIELD_MASK) >= offset] - offset
+            if len(following) == 0:
+                matches = matches[:0]
+                break
+            # Both key arrays are sorted, so membership is a binary search
+            found = np.minimum(np.searchsorted(following, matches), len(following) - 1)
+            matches = matches[following[found] == matches]
+
+        return np.column_stack([
+            matches >> KEY_DOCUMENT_SHIFT,
+            (matches >> KEY_LINE_SHIFT) & KEY_FIELD_MASK,
+            matches & KEY_FIELD_MASK
+        ])
+
+    def search(self, query: str, max_results: int = TRANSCRIPT_SEARCH_MAX_RESULTS,
+               max_snippets: int = TRANSCRIPT_SEARCH_SNIPPETS) -> Dict:
+        """
+        Interviews matching a query, with match counts and snippets
+
+        Counts cover every match; snippets are only read for the interviews returned.
+
+        Args:
+            query: Search query (see find)
+            max_results: Interviews returned (the first ones in interview order)
+            max_snippets: Matching lines returned per interview
+
+        Returns:
+            Dictionary with the total number of matching interviews and
+            occurrences, and results: a list of dictionaries with interview,
+            matches (matching lines), occurrences, lines and snippets
+        """
+        matches = self.find(query)
+        documents, starts, occurrences = np.unique(matches[:, 0], return_index=True, return_counts=True)
+
+        results = []
+        for document, start, count in zip(documents[:max_results].tolist(), starts[:max_results].tolist(),
+                                          occurrences[:max_results].tolist()):
+            lines = np.unique(matches[start:start + count, 1]).tolist()
+            results.append({
+                "interview": self.documents[document],
+                "matches": len(lines),
+                "occurrences": count,
+                "lines": lines,
+                "snippets": self.read_lines(self.documents[document], lines[:max_snippets])
+            })
+        return {
+            "interviews": len(documents),
+            "occurrences": len(matches),
+            "results": results
+        }
+
+    def line_count(self, interview: str) -> int:
+        """Number of lines in an indexed transcript"""
+        document = self._document_numbers[interview]
+        return int(self.document_line_starts[document + 1] - self.document_line_starts[document]) - 1
+
+    def read_lines(self, interview: str, lines: List[int]) -> List[str]:
+        """
+        Read specific lines of a transcript using the stored byte offsets
+
+        Args:
+            interview: Transcript name (e.g. "interview_01")
+            lines: Zero-based line numbers
+
+        Returns:
+            Line texts without trailing newlines
+        """
+        offsets = self.line_offsets[self.document_line_starts[self._document_numbers[interview]]:]
+        texts = []
+        with open(self.transcript_dir / f"{interview}.txt", 'rb') as f:
+            for line in lines:
+                f.seek(int(offsets[line]))
+                texts.append(f.read(int(offsets[line + 1] - offsets[line])).decode('utf-8').rstrip("\r\n"))
+        return texts
+
+    def read_line_range(self, interview: str, start: int, stop: int) -> List[str]:
+        """
+        Read a contiguous block of transcript lines with one seek and one read
+
+        Args:
+            interview: Transcript name (e.g. "interview_01")
+            start: First zero-based line number
+            stop: Line number after the last line (clamped to the transcript)
+
+        Returns:
+            Line texts without trailing newlines
+        """
+        stop = min(stop, self.line_count(interview))
+        if start >= stop:
+            return []
+        offsets = self.line_offsets[self.document_line_starts[self._document_numbers[interview]]:]
+        with open(self.transcript_dir / f"{interview}.txt", 'rb') as f:
+            f.seek(int(offsets[start]))
+            block = f.read(int(offsets[stop] - offsets[start])).decode('utf-8')
+        return [line.rstrip("\r") for line in block.split("\n")[:stop - start]]
@@ -0,0 +1,20 @@
+"""
+Shared test setup: the research modules live in src/ and are imported by name
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import *
+
+@pytest.fixture(scope="session")
+def research_data():
+    """Interview metadata and affinity observations shipped with the repository"""
+    metadata_df = pd.read_csv(RAW_DATA_DIR / "interview_metadata.csv")
+    observations_df = pd.read_csv(PROCESSED_DATA_DIR / "affinity_clusters.csv")
+    return metadata_df, observations_df
@@ -0,0 +1,111 @@
+"""
+Persona aggregates: folding or merging interview batches must equal a full rebuild
+"""
+
+import pandas as pd
+import pytest
+from persona_aggregates import PersonaAggregate, PersonaAggregateStore, normalize_interview_ids
+
+def split_batches(metadata_df, observations_df, split):
+    """Split the data into two disjoint interview batches at the ``split``-th interview"""
+    first_ids = set(metadata_df['interview_id'].iloc[:split])
+    in_first = normalize_interview_ids(observations_df['interview_id']).isin(first_ids)
+    return ((metadata_df[metadata_df['interview_id'].isin(first_ids)], observations_df[in_first]),
+            (metadata_df[~metadata_df['interview_id'].isin(first_ids)], observations_df[~in_first]))
+
+def state(store: PersonaAggregateStore) -> dict:
+    """Aggregate state of every persona, independent of heap layout and insertion order"""
+    states = {}
+    for name, aggregate in store.aggregates.items():
+        data = aggregate.to_dict()
+        data["quote_heap"] = sorted(data["quote_heap"])
+        states[name] = data
+    return states
+
+def full_rebuild(metadata_df, observations_df) -> PersonaAggregateStore:
+    """Aggregates built from all the given interviews in one fold"""
+    store = PersonaAggregateStore()
+    store.fold(metadata_df, observations_df)
+    return store
+
+@pytest.mark.parametrize("split", [0, 1, 7, 21, 22])
+def test_fold_batches_equals_full_rebuild(research_data, split):
+    metadata_df, observations_df = research_data
+    store = PersonaAggregateStore()
+    for batch in split_batches(metadata_df, observations_df, split):
+        store.fold(*batch)
+
+    assert state(store) == state(full_rebuild(metadata_df, observations_df))
+
+@pytest.mark.parametrize("split", [0, 1, 7, 21, 22])
+def test_merge_stores_equals_full_rebuild(research_data, split):
+    metadata_df, observations_df = research_data
+    first, second = (full_rebuild(*batch) for batch in split_batches(metadata_df, observations_df, split))
+
+    assert state(first.merge(second)) == state(full_rebuild(metadata_df, observations_df))
+
+def test_merge_keeps_derived_statistics(research_data):
+    metadata_df, observations_df = research_data
+    full = full_rebuild(metadata_df, observations_df)
+    merged = PersonaAggregateStore()
+    for batch in split_batches(metadata_df, observations_df, 11):
+        merged.merge(full_rebuild(*batch))
+
+    themes = sorted(observations_df['theme'].unique())
+    for name, aggregate in full.aggregates.items():
+        other = merged.aggregates[name]
+        assert other.mean_age == pytest.approx(aggregate.mean_age)
+        assert other.std_tools_abandoned == pytest.approx(aggregate.std_tools_abandoned)
+        assert other.top_themes() == aggregate.top_themes()
+        assert other.top_quotes() == aggregate.top_quotes()
+        assert (other.sample_matrix(themes) == aggregate.sample_matrix(themes)).all()
+
+def test_merge_with_empty_aggregates(research_data):
+    full = full_rebuild(*research_data)
+    expected = state(full)
+
+    # Empty into full, full into empty, and empty into empty
+    assert state(full.merge(PersonaAggregateStore())) == expected
+    assert state(PersonaAggregateStore().merge(full)) == expected
+    assert state(PersonaAggregateStore().merge(PersonaAggregateStore())) == {}
+
+    for name, aggregate in full.aggregates.items():
+        before = aggregate.to_dict()
+        aggregate.merge(PersonaAggregate(name))
+        assert aggregate.to_dict() == before
+
+def test_saved_store_merges_like_the_original(research_data, tmp_path):
+    metadata_df, observations_df = research_data
+    first_batch, second_batch = split_batches(metadata_df, observations_df, 11)
+    full_rebuild(*first_batch).save(tmp_path / "persona_aggregates.json")
+
+    store = PersonaAggregateStore.load(tmp_path / "persona_aggregates.json")
+    store.fold(*second_batch)
+
+    assert state(store) == state(full_rebuild(metadata_df, observations_df))
+
+def test_refolding_a_batch_is_rejected(research_data):
+    metadata_df, observations_df = research_data
+    first_batch, _ = split_batches(metadata_df, observations_df, 7)
+    store = full_rebuild(*first_batch)
+    before = state(store)
+
+    with pytest.raises(ValueError, match="already folded"):
+        store.fold(*first_batch)
+    with pytest.raises(ValueError, match="already folded"):
+        store.fold(metadata_df, observations_df)
+    assert state(store) == before
+
+    with pytest.raises(ValueError, match="already folded"):
+        PersonaAggregateStore().fold(pd.concat([metadata_df, metadata_df.iloc[:1]]), observations_df)
+
+def test_merging_overlapping_stores_is_rejected(research_data):
+    store = full_rebuild(*research_data)
+    before = state(store)
+
+    with pytest.raises(ValueError, match="already folded"):
+        store.merge(full_rebuild(*research_data))
+    for name, aggregate in store.aggregates.items():
+        with pytest.raises(ValueError, match="already folded"):
+            aggregate.merge(PersonaAggregate.from_dict(aggregate.to_dict()))
+    assert state(store) == before
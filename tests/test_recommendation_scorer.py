@@ -0,0 +1,66 @@
+"""
+Recommendation scorer: incremental updates must score exactly like a full recompute
+"""
+
+import numpy as np
+import pytest
+from persona_aggregates import normalize_interview_ids
+from recommendation_scorer import RecommendationScorer
+
+def comparable(scores):
+    """Scores keyed by rec_id (covered personas as a set, whatever order personas were first seen in)"""
+    return {entry["rec_id"]: {**entry, "covered_personas": set(entry["covered_personas"])} for entry in scores}
+
+@pytest.mark.parametrize("batches", [1, 2, 5, 40])
+def test_observation_batches_match_full_recompute(research_data, batches):
+    metadata_df, observations_df = research_data
+    shuffled = observations_df.sample(frac=1, random_state=batches)
+
+    scorer = RecommendationScorer()
+    scorer.add_interviews(metadata_df)
+    for batch in np.array_split(np.arange(len(shuffled)), batches):
+        scorer.add_observations(shuffled.iloc[batch])
+
+    full = RecommendationScorer.from_data(metadata_df, observations_df)
+    assert scorer.scores() == full.scores()
+
+def test_new_interviews_and_observations_match_full_recompute(research_data):
+    metadata_df, observations_df = research_data
+    observation_ids = normalize_interview_ids(observations_df['interview_id'])
+
+    # Score the first interviews, then keep folding in later interviews with their observations
+    scorer = RecommendationScorer()
+    for batch in np.array_split(metadata_df['interview_id'].to_numpy()[::-1], 4):
+        scorer.add_interviews(metadata_df[metadata_df['interview_id'].isin(batch)])
+        scorer.add_observations(observations_df[observation_ids.isin(batch)])
+        scorer.scores()
+
+    full = RecommendationScorer.from_data(metadata_df, observations_df)
+    assert scorer.interview_count == full.interview_count
+    assert comparable(scorer.scores()) == comparable(full.scores())
+
+def test_repeated_interviews_and_skipped_observations(research_data):
+    metadata_df, observations_df = research_data
+    scorer = RecommendationScorer()
+
+    # Observations of unregistered interviews are skipped, repeated interviews ignored
+    scorer.add_observations(observations_df)
+    scorer.add_interviews(metadata_df)
+    scorer.add_interviews(metadata_df)
+    scorer.add_observations(observations_df.iloc[:0])
+    scorer.add_observations(observations_df)
+
+    assert scorer.scores() == RecommendationScorer.from_data(metadata_df, observations_df).scores()
+
+def test_scores_match_direct_computation(research_data):
+    metadata_df, observations_df = research_data
+    observations = observations_df.assign(interview_id=normalize_interview_ids(observations_df['interview_id']))
+
+    for entry in RecommendationScorer.from_data(metadata_df, observations_df).scores():
+        linked = observations[observations['theme'].isin(entry["linked_themes"])]
+        reached = linked['interview_id'].nunique()
+        assert entry["interviews_reached"] == reached
+        assert entry["sample_size"] == len(metadata_df)
+        assert entry["reach"] == round(reached / len(metadata_df), 3)
+        assert entry["observations"] == len(linked)
+        assert entry["negative_observations"] == int((linked['sentiment'] == 'negative').sum())